@@ -9,28 +9,21 @@ import sys
 
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi import FastAPI, File, HTTPException, UploadFile, Form
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi import FastAPI, File, HTTPException, UploadFile, Form, Header, Response
+from fastapi.responses import RedirectResponse, JSONResponse, StreamingResponse
 
 try:
     import docx
 except Exception:
     docx = None
 
-from utils.llm.manager import LLMManager
+from utils.llm.manager import LLMManager, get_llm_manager
 from utils.data_extractor.core import extract_text as vision_extract_text
-
-try:
-    from ats.ats import (
-        clean_text,
-        buzzwords
-    )
-    from ats.matchjd import (
-        get_resume_jd_match_score
-    )
-    print("successfully imported from existing ats files")
-except ImportError as e:
-    print(f"could not import ats files: {e}")
+from ats.analyzer import (ATSAnalyzer, DEFAULT_JOB_DESCRIPTION, analysis_plan, analysis_step, analyze_resume,
+                          analyze_resumes, analyzer_status, ats_data_version, build_report, clamp_score, get_analyzer)
+from ats.executor import ATSExecutor, ExecutorBusyError, ExecutorStoppedError
+from utils.result_cache import content_key, create_result_cache
+from utils.readiness import Readiness
 
 
 
@@ -56,213 +49,72 @@ class AutoFixPayload(BaseModel):
 class ATSCheckerPayload(BaseModel):
     job_description: Optional[str] = None
 
-class ATSAnalyzer:
-    def __init__(self):
-        self.esco_zip_path = 'backend/api/src/ats/data/ESCO dataset - v1.2.0 - classification - en - csv.zip'  
-        self.vectorizer_path = 'backend/api/scr/ats/data/ats_tfidf_vectorizer/tfidf_vectorizer.pkl'
-        self.tfidf_vectorizer = None
-        self.buzzwords = buzzwords if 'buzzwords' in globals() else self._get_default_buzzwords()
-        self._load_vectorizer()
 
-    
-    def _load_vectorizer(self):     #for loading tf-idf vectorizer from existing file (have to add later)
-        try:
-            import joblib
-            self.tfidf_vectorizer = joblib.load(self.vectorizer_path)
-            print(f"Successfully loaded TF-IDF vectorizer from {self.vectorizer_path}")
-        except Exception as e:
-            print(f"Could not load TF-IDF vectorizer: {e}")
-
-    def _get_default_buzzwords(self):       #fallback buzzwords (not needed ig but still)
-        return [
-            "machine learning", "deep learning", "artificial intelligence", "data science",
-            "big data", "cloud computing", "aws", "azure", "gcp", "devops", "agile", "scrum",
-            "python", "r", "sql", "nosql", "docker", "kubernetes", "ci/cd", "nlp",
-            "computer vision", "predictive modeling", "statistical analysis", "data mining"
-        ]
-    
-    def analyze_buzzwords_from_text(self, resume_text):     #existing approach
-        resume_text_lower = str(resume_text).lower()
-        buzzword_count = 0
-        found_buzzwords = []
-        
-        for buzzword in self.buzzwords:
-            if buzzword in resume_text_lower:
-                buzzword_count += 1
-                found_buzzwords.append(buzzword)
-        
-        return {
-            "count": buzzword_count,
-            "percentage": min(100, (buzzword_count / 30) * 100),
-            "found_terms": found_buzzwords
-        }
-    
-    def analyze_quantifiable_from_text(self, resume_text):
-        import re
-        
-        refined_quantifiable_patterns = [
-            r'(?:increased|reduced|improved|decreased|boosted|cut|grew)\s+.*?by\s+([\d,\.]+\s*%?)',
-            r'(?:managed|led|oversaw)\s+(?:a\s+team\s+of|[\d,\.]+\s+projects?)',
-            r'(?:saved)\s+([\$\€\£]?[\d,\.]+)',
-            r'(?:achieved|delivered)\s+(?:a\s+)?([\d,\.]+%?)\s+.*?',
-            r'(?:handled|processed)\s+([\d,\.]+)\s+(?:data\s+records?|transactions?)',
-            r'(?:developed|implemented)\s+.*?for\s+([\d,\.]+)\s+users?',
-            r'(?:optimized|streamlined)\s+.*?resulting\s+in\s+([\d,\.]+%?)\s+reduction',
-            r'([\d,\.]+%?)\s+(?:increase|reduction|improvement|gain|growth)',
-        ]
-        
-        quantifiable_achievements = []
-        resume_text_lower = str(resume_text).lower()
-        
-        for pattern in refined_quantifiable_patterns:
-            matches = re.findall(pattern, resume_text_lower)
-            if matches:
-                for match in matches:
-                    if isinstance(match, tuple):
-                        quantifiable_achievements.extend([item for item in match if item])
-                    else:
-                        quantifiable_achievements.append(match)
-        
-        count = len(quantifiable_achievements)
-        return {
-            "count": count,
-            "percentage": min(100, (count / 8) * 100),
-            "achievements": quantifiable_achievements
-        }
-    
-    def analyze_esco_technical_terms(self, resume_text):        #from ats.py (existing esco analysis)
-        import zipfile
-        import pandas as pd
-        import spacy
-        from spacy.matcher import PhraseMatcher
-        
-        unique_technical_terms_count = 0
-        found_terms = []
-        
-        try:
-            if os.path.exists(self.esco_zip_path):
-                with zipfile.ZipFile(self.esco_zip_path, 'r') as zip_ref:
-                    if 'skills_en.csv' in zip_ref.namelist():
-                        zip_ref.extract('skills_en.csv', path='/tmp/')
-                        
-                        esco_skills_df = pd.read_csv('/tmp/skills_en.csv')
-                        
-                        os.remove('/tmp/skills_en.csv')
-                        
-                        required_cols = ['preferredLabel', 'altLabels', 'description']
-                        if all(col in esco_skills_df.columns for col in required_cols):
-                            esco_terms = []
-                            for index, row in esco_skills_df.iterrows():
-                                if pd.notna(row['preferredLabel']) and isinstance(row['preferredLabel'], str):
-                                    esco_terms.append(row['preferredLabel'])
-                                if pd.notna(row['altLabels']) and isinstance(row['altLabels'], str):
-                                    alt_labels = [label.strip() for label in row['altLabels'].split(',') if label.strip()]
-                                    esco_terms.extend(alt_labels)
-                        
-                            nlp_esco_matcher = spacy.blank("en")
-                            esco_matcher = PhraseMatcher(nlp_esco_matcher.vocab)
-                            
-                            cleaned_esco_terms = [clean_text(term) for term in esco_terms if term]
-                            cleaned_esco_terms = [term for term in cleaned_esco_terms if term]
-                            
-                            if cleaned_esco_terms:
-                                esco_patterns = [nlp_esco_matcher.make_doc(term) for term in cleaned_esco_terms[:1000]]  #umm limiting for performance
-                                esco_matcher.add("TECHNICAL_TERMS", esco_patterns)
-                                
-                                cleaned_resume_text = clean_text(resume_text)
-                                if cleaned_resume_text:
-                                    resume_doc = nlp_esco_matcher(cleaned_resume_text)
-                                    esco_matches = esco_matcher(resume_doc)
-                                    found_terms = [resume_doc[start:end].text for match_id, start, end in esco_matches]
-                                    unique_technical_terms_count = len(set(found_terms))
-                        
-        except Exception as e:      #vibecoded exception logic :>
-            print(f"ESCO analysis failed: {e}")
-            # Fallback to basic technical terms
-            basic_terms = ["python", "java", "javascript", "sql", "aws", "docker", "react"]
-            text_lower = resume_text.lower()
-            found_terms = [term for term in basic_terms if term in text_lower]
-            unique_technical_terms_count = len(found_terms)
-        
-        return {
-            "count": unique_technical_terms_count,
-            "percentage": min(100, (unique_technical_terms_count / 15) * 100),
-            "terms": found_terms[:20]  # Limit for response size
-        }
-    
-    def analyze_structure_from_text(self, resume_text):
-        import re
-        
-        section_titles = [
-            "summary", "objective", "education", "experience", "work experience",
-            "professional experience", "skills", "technical skills", "projects",
-            "portfolio", "awards", "honors", "publications", "presentations",
-            "licenses", "certifications", "volunteering", "interests", "contact",
-            "contact information"
-        ]
-        
-        resume_text_lower = str(resume_text).lower()
-        identified_sections = []
-        
-        for title in section_titles:
-            if re.search(r'\b' + re.escape(title) + r'\b', resume_text_lower):
-                identified_sections.append(title)
-        
-        count = len(identified_sections)
-        return {
-            "count": count,
-            "percentage": min(100, (count / 8) * 100),
-            "sections": identified_sections
-        }
-    
-    def analyze_repetition_from_text(self, resume_text):
-        import re
-        from collections import Counter
+ATS_SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.txt')
+ATS_BATCH_MAX_RESUMES = int(os.getenv('ATS_BATCH_MAX_RESUMES', '500'))
+ATS_BATCH_EXTRACT_CONCURRENCY = int(os.getenv('ATS_BATCH_EXTRACT_CONCURRENCY', str(min(8, os.cpu_count() or 1))))
 
-        try:
-            from nltk.corpus import stopwords
-            stop_words = set(stopwords.words('english'))
-        except:     #basic fallback
-            stop_words = set(['the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an', 'is', 'are', 'was', 'were'])
-        
-        words = re.findall(r'\b\w+\b', str(resume_text).lower())
-        word_counts = Counter(words)
-        
-        ignore_words = stop_words | {'com', 'https', 'www', 'project', 'skill', 
-                                   'experience', 'develop', 'system'}
-        
-        high_frequency_words = [word for word, count in word_counts.most_common(50) 
-                              if count > 10 and word not in ignore_words]
-        
-        repetition_penalty = len(high_frequency_words) * 5
-        score = max(0, 100 - repetition_penalty)
-        
-        return {
-            "score": score,
-            "percentage": score,
-            "repetitive_words": high_frequency_words
-        }
-    
-    def calculate_jd_match_score(self, resume_text, jd_text):       
-        if not self.tfidf_vectorizer or not jd_text:
-            return {"score": 0, "percentage": 0, "available": False}
-        
-        try:
-            if 'get_resume_jd_match_score' in globals():
-                similarity = get_resume_jd_match_score(resume_text, jd_text, self.tfidf_vectorizer)
-                if similarity is not None:
-                    return {
-                        "score": similarity,
-                        "percentage": similarity * 100,
-                        "available": True
-                    }
-            return {"score": 0, "percentage": 0, "available": False}
-            
-        except Exception as e:
-            print(f"JD matching error: {e}")
-            return {"score": 0, "percentage": 0, "available": False}
+ATS_WARMUP = os.getenv('ATS_WARMUP', 'background').lower()     #background, blocking or off
+PDF_PAGE_SEPARATOR = "\n\f\n"      #form feed marks real page breaks for prompt compaction (see utils/llm/compaction.py)
+
+ats_result_cache = create_result_cache(os.path.join(tempfile.gettempdir(), 'darzi_ats_results'))
+ats_executor = ATSExecutor()       #CPU-bound analysis runs here, off the event loop (see ats/executor.py)
+
+
+readiness = Readiness() if ATS_WARMUP != "off" else Readiness(required=())      #gates /readyz (see utils/readiness.py)
+
+
+async def _warm_up_ats_analyzer():      #asks the analyzer that serves jobs: a pool worker's, or this process's in thread mode
+    status = await ats_executor.run(analyzer_status, ats_executor.workers == 0)     #workers warm up when they start
+    for name in ("tfidf_vectorizer", "esco_index"):     #a deployed data file that failed to load keeps /readyz at 503
+        check = status[name]
+        readiness.mark(name, check["ok"], check["detail"], required=check["deployed"])
+    return f"{status['analyzers']} analyzers warmed"
+
+
+def _warm_up_stopwords():
+    import ats.ats
+    count = len(ats.ats.stop_words)
+    return f"{count} words ({ats.ats.stopwords_source})"
+
+
+def _warm_up_llm():
+    llm = _get_llm()
+    if not llm or not llm.is_llm_available():
+        raise RuntimeError("no LLM provider available")
+    return ", ".join(llm.get_available_providers())
+
+
+def _warm_up_ats_workers():
+    ats_executor.start()
+    return f"{ats_executor.workers} worker process(es)" if ats_executor.workers else "thread mode"
 
-ats_analyzer = ATSAnalyzer()        
+
+async def _warm_up():       #independent steps load in parallel; each one is a readiness check
+    await asyncio.gather(
+        readiness.run("ats_analyzer", _warm_up_ats_analyzer),
+        readiness.run("stopwords", _warm_up_stopwords),
+        readiness.run("llm", _warm_up_llm),
+        readiness.run("ats_workers", _warm_up_ats_workers),
+    )
+    readiness.complete()
+
+
+@app.on_event("startup")
+async def start_ats_executor():
+    #models are loaded after the server starts listening (ATS_WARMUP=background), so importing the app stays cheap
+    if ATS_WARMUP == "off":
+        readiness.complete()
+        return
+    if ATS_WARMUP == "blocking":
+        await _warm_up()
+    else:
+        app.state.warmup = asyncio.create_task(_warm_up())
+
+
+@app.on_event("shutdown")
+async def stop_ats_executor():
+    ats_executor.shutdown()
 
 
 
@@ -502,22 +354,49 @@ def _to_frontend_resume_data(parsed: Dict[str, Any]) -> Dict[str, Any]:
     return resume
 
 
+@app.get("/healthz")
+async def liveness_check():
+    """Liveness: the process is up and serving; no dependency checks, never waits on warm-up"""
+    return {"status": "alive", "timestamp": datetime.utcnow().isoformat()}
+
+
+@app.get("/readyz")
+async def readiness_check():
+    """Readiness: 200 once warm-up finished and every required model loaded, else 503"""
+    report = readiness.report()
+    return JSONResponse(status_code=200 if report["ready"] else 503, content=report)
+
+
 @app.get("/health")
 async def health_check():
-    """Health check endpoint for monitoring and load balancers"""
+    """Informational service status; always 200 (probes should use /healthz and /readyz)"""
     try:
         # Test LLM availability
         llm = _get_llm()
         llm_available = llm.is_llm_available() if llm else False
+        ats_analyzer = get_analyzer(create=False)       #None in process mode (the workers hold the analyzers) and during warm-up
+        ready = readiness.report()
         
         return {
-            "status": "healthy",
+            "status": "healthy" if ready["ready"] else ready["status"],
+            "readiness": ready,
             "timestamp": datetime.utcnow().isoformat(),
             "services": {
                 "llm": "available" if llm_available else "unavailable",
                 "vision_api": "available",  # Google Vision API integration
                 "api": "available"
             },
+            "caches": {
+                **(ats_analyzer.cache_stats() if ats_analyzer else {}),
+                "ats_results": ats_result_cache.stats() if ats_result_cache else None,
+                "llm_responses": llm.cache.stats() if llm and llm.cache else None
+            },
+            "ats_executor": ats_executor.stats(),
+            "ats_analyzers": ats_analyzer.runner.stats() if ats_analyzer else None,
+            "llm_requests": llm.inflight.stats() if llm else None,
+            "llm_limits": llm.limiter_stats() if llm else None,
+            "llm_breakers": llm.breaker_stats() if llm else None,
+            "llm_prompt_compaction": llm.compaction.stats() if llm and llm.compaction else None,
             "version": "1.0.0"
         }
     except Exception as e:
@@ -535,9 +414,12 @@ def _decode_text_bytes(b: bytes) -> str:
 
 
 async def _extract_text_for_file(upload: UploadFile) -> str:
-    filename = upload.filename or "uploaded"
-    suffix = filename.lower()
     content = await upload.read()
+    return _extract_text_from_bytes(upload.filename or "uploaded", content)
+
+
+def _extract_text_from_bytes(filename: str, content: bytes) -> str:
+    suffix = filename.lower()
 
     if suffix.endswith(".txt"):
         return _decode_text_bytes(content)
@@ -582,7 +464,7 @@ async def _extract_text_for_file(upload: UploadFile) -> str:
                 except Exception as e:
                     print(f"PyPDF2: Failed to extract page {page_num + 1}: {e}")
             
-            extracted_text = "\n\n".join(text_parts)
+            extracted_text = PDF_PAGE_SEPARATOR.join(text_parts)
             
             if extracted_text.strip() and len(extracted_text) > 100:
                 print(f"PyPDF2: Successfully extracted {len(extracted_text)} characters total")
@@ -608,7 +490,7 @@ async def _extract_text_for_file(upload: UploadFile) -> str:
                     except Exception as e:
                         print(f"pdfplumber: Failed to extract page {page_num + 1}: {e}")
                 
-                extracted_text = "\n\n".join(text_parts)
+                extracted_text = PDF_PAGE_SEPARATOR.join(text_parts)
                 
                 if extracted_text.strip() and len(extracted_text) > 100:
                     print(f"pdfplumber: Successfully extracted {len(extracted_text)} characters total")
@@ -638,7 +520,7 @@ async def _extract_text_for_file(upload: UploadFile) -> str:
                     print(f"PyMuPDF: Failed to extract page {page_num + 1}: {e}")
             
             doc.close()
-            extracted_text = "\n\n".join(text_parts)
+            extracted_text = PDF_PAGE_SEPARATOR.join(text_parts)
             
             if extracted_text.strip() and len(extracted_text) > 100:
                 print(f"PyMuPDF: Successfully extracted {len(extracted_text)} characters total")
@@ -683,7 +565,6 @@ async def _parse_text(text: str, llm: Optional[LLMManager]) -> Dict[str, Any]:
     try:
         if llm:
             structured_data = await _llm_structure_resume(text, llm)
-            print(f"LLM returned: {structured_data}")
             if structured_data:
                 return structured_data
         
@@ -697,8 +578,8 @@ async def _llm_structure_resume(text: str, llm: LLMManager) -> Optional[Dict[str
     """Use LLM to structure resume text into JSON"""
     
     try:
-        # Use the LLM manager's built-in parsing method
-        structured_data = llm.parse_resume_with_llm(text)
+        # Use the LLM manager's built-in parsing method (async client, so files parse concurrently)
+        structured_data = await llm.parse_resume_with_llm_async(text)
         
         # Validate the structure has required fields
         if isinstance(structured_data, dict) and len(structured_data) > 0:
@@ -806,8 +687,8 @@ def _merge(items: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 def _get_llm(preferred: Optional[str] = None) -> Optional[LLMManager]:
     try:
-        # LLMManager in this codebase doesn't accept preferred on init; handled per-call
-        return LLMManager()
+        # shared manager, rebuilt only when credentials change; preferred is handled per-call
+        return get_llm_manager()
     except Exception:
         return None
 
@@ -843,6 +724,49 @@ async def parse_data(files: List[UploadFile] = File(...)) -> Dict[str, Any]:
     }
 
 
+@app.post("/parse-data/stream")
+async def parse_data_stream(file: UploadFile = File(...)) -> StreamingResponse:
+    """/parse-data for one file as Server-Sent Events.
+
+    Streams the LLM response and emits one ``section`` event per top-level
+    section (contact_information, work_experience, ...) as soon as it is
+    complete, then ``complete`` with the same ``parsed`` data /parse-data
+    returns plus its ``resumeData`` mapping. Without a working LLM the only
+    event is ``complete`` with the basic fallback structure.
+    """
+    if not file:
+        raise HTTPException(status_code=400, detail="No file uploaded")
+
+    text = await _extract_text_for_file(file)
+    if not text or not text.strip():
+        raise HTTPException(status_code=400, detail="Could not extract text from file")
+
+    llm = _get_llm()
+
+    async def events():
+        parsed = None
+        if llm and llm.is_llm_available():
+            try:
+                async for event in llm.parse_resume_with_llm_stream(text):
+                    if event.kind == "section":
+                        yield _sse("section", {"section": event.section, "data": event.data})
+                    else:
+                        parsed = event.data
+            except Exception as e:
+                print(f"LLM streaming parse error: {str(e)}")
+
+        normalized = _ensure_resume_schema(parsed or _create_basic_structure(text))
+        yield _sse("complete", {
+            "filename": file.filename,
+            "text_length": len(text),
+            "parsed": normalized,
+            "resumeData": _to_frontend_resume_data(normalized),
+        })
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
 @app.post("/generate-resume")
 async def generate_resume(payload: GenerateResumePayload) -> Dict[str, Any]:
     if not payload or not payload.data:
@@ -866,7 +790,7 @@ async def generate_resume(payload: GenerateResumePayload) -> Dict[str, Any]:
             prompt = (
                 "Rewrite this resume summary in a concise, ATS-friendly style (2-3 sentences).\n\n" + str(summary_src)
             )
-            result = llm.generate_text(prompt, preferred_provider=payload.preferred_provider)
+            result = await llm.generate_text_async(prompt, preferred_provider=payload.preferred_provider)
             if isinstance(result, dict) and result.get("success") and result.get("content"):
                 merged["professional_summary"] = str(result["content"]).strip()
         except Exception:
@@ -897,7 +821,7 @@ async def auto_fix(payload: AutoFixPayload) -> Dict[str, Any]:
                 "Return only the improved text.\n\n"
                 f"Context JSON: {json.dumps(context)}\n"
             )
-            result = llm.generate_text(prompt, preferred_provider=payload.preferred_provider)
+            result = await llm.generate_text_async(prompt, preferred_provider=payload.preferred_provider)
             if isinstance(result, dict) and result.get("success") and result.get("content"):
                 return {"field": field, "suggestion": str(result["content"]).strip()}
         except Exception:
@@ -913,161 +837,207 @@ async def auto_fix(payload: AutoFixPayload) -> Dict[str, Any]:
 
 @app.post("/ats-checker")
 async def ats_checker(
+    response: Response,
     file: UploadFile = File(...),
-    job_description: str = Form("")
+    job_description: str = Form(""),
+    if_none_match: Optional[str] = Header(None)
 ) -> Dict[str, Any]:    
 
     if not file:
         raise HTTPException(status_code=400, detail="No resume file uploaded")
     
-    if not file.filename or not file.filename.lower().endswith(('.pdf', '.docx', '.txt')):
+    if not file.filename or not file.filename.lower().endswith(ATS_SUPPORTED_EXTENSIONS):
         raise HTTPException(status_code=400, detail="Only pdf, docx, txt files are supported")
 
     try:
-        resume_text = await _extract_text_for_file(file)
+        content = await file.read()
+
+        if not job_description:
+            job_description = DEFAULT_JOB_DESCRIPTION
+
+        #same bytes + filename + JD + analyzer/data version always produce the same report
+        cache_key = content_key(content, file.filename, job_description, ats_data_version())
+        etag = f'"{cache_key}"'
+        if if_none_match and etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        cached = ats_result_cache.get(cache_key) if ats_result_cache else None
+        if cached is not None:
+            print(f"ATS result cache hit for {file.filename}")
+            response.headers["ETag"] = etag
+            return cached
+
+        resume_text = await asyncio.to_thread(_extract_text_from_bytes, file.filename, content)
 
         if not resume_text or len(resume_text.strip()) < 100:
             raise HTTPException(status_code=400, detail="Could not extract meaningful text from resume") 
 
-        if not job_description:
-            job_description = """
-            We are seeking a skilled professional with strong technical expertise and proven experience. 
-            Candidates should demonstrate quantifiable achievements, relevant industry experience, 
-            and excellent communication skills. Experience with modern technologies and methodologies preferred.
-            Strong analytical and problem-solving abilities required.
-            """
-        
-        print(f"Analyzing resume with {len(resume_text)} characters")
-        
-        analyses = {}
-        
-        #Buzzwords Analysis (from ats.py)   
-        analyses["buzzwords"] = ats_analyzer.analyze_buzzwords_from_text(resume_text)
-        print(f"Buzzwords: {analyses['buzzwords']['count']} found")
-        
-        #Quantifiable Achievements (from ats.py)
-        analyses["quantifiable"] = ats_analyzer.analyze_quantifiable_from_text(resume_text)
-        print(f"Quantifiable achievements: {analyses['quantifiable']['count']} found")
-        
-        #Resume Structure (from ats.py)
-        analyses["structure"] = ats_analyzer.analyze_structure_from_text(resume_text)
-        print(f"Structure sections: {analyses['structure']['count']} found")
-        
-        #Repetition Analysis (from ats.py)
-        analyses["repetition"] = ats_analyzer.analyze_repetition_from_text(resume_text)
-        print(f"Repetition score: {analyses['repetition']['score']}")
-        
-        #Technical Terms (from ats.py ESCO analysis)
-        analyses["technical"] = ats_analyzer.analyze_esco_technical_terms(resume_text)
-        print(f"Technical terms: {analyses['technical']['count']} found")
-        
-        #JD Matching (from matchjd.py)
-        jd_match = ats_analyzer.calculate_jd_match_score(resume_text, job_description)
-        if jd_match["available"]:
-            analyses["jd_match"] = jd_match
-            print(f"JD Match: {jd_match['percentage']:.1f}%")
-
-
-        #using weights and calculation from your ats.py
-        buzzword_points = analyses["buzzwords"]["count"] * 0.5
-        quantifiable_points = analyses["quantifiable"]["count"] * 10
-        technical_points = analyses["technical"]["count"] * 2
-        structure_points = analyses["structure"]["count"] * 5
-        repetition_penalty = max(0, 100 - analyses["repetition"]["score"])
-        
-        overall_score = max(0, min(100, 
-            buzzword_points + quantifiable_points + technical_points + 
-            structure_points - repetition_penalty
-        ))
-        
-        graph_data = {
-            "overall_score": round(overall_score, 1),
-            "categories": {
-                "Industry Keywords": {
-                    "score": round(analyses["buzzwords"]["percentage"], 1),
-                    "count": analyses["buzzwords"]["count"],
-                    "details": f"Found {analyses['buzzwords']['count']} relevant industry keywords",
-                    "suggestions": "Include more industry-specific terms and technologies" if analyses["buzzwords"]["percentage"] < 60 else "Strong keyword coverage",
-                    "found_items": analyses["buzzwords"]["found_terms"][:10]  # Top 10 for display
-                },
-                "Quantifiable Impact": {
-                    "score": round(analyses["quantifiable"]["percentage"], 1),
-                    "count": analyses["quantifiable"]["count"],
-                    "details": f"Found {analyses['quantifiable']['count']} quantifiable achievements with metrics",
-                    "suggestions": "Add more specific numbers, percentages, and measurable outcomes" if analyses["quantifiable"]["percentage"] < 50 else "Excellent use of quantifiable metrics",
-                    "found_items": analyses["quantifiable"]["achievements"][:5]
-                },
-                "Resume Structure": {
-                    "score": round(analyses["structure"]["percentage"], 1),
-                    "count": analyses["structure"]["count"],
-                    "details": f"Identified {analyses['structure']['count']} standard resume sections",
-                    "suggestions": "Consider adding missing standard sections" if analyses["structure"]["percentage"] < 70 else "Well-organized resume structure",
-                    "found_items": analyses["structure"]["sections"]
-                },
-                "Content Quality": {
-                    "score": round(analyses["repetition"]["percentage"], 1),
-                    "details": "Analysis of word repetition and content diversity",
-                    "suggestions": "Vary your language and avoid repetitive phrases" if analyses["repetition"]["percentage"] < 80 else "Good content diversity and language variation",
-                    "issues": analyses["repetition"]["repetitive_words"][:5]
-                },
-                "Technical Expertise": {
-                    "score": round(analyses["technical"]["percentage"], 1),
-                    "count": analyses["technical"]["count"],
-                    "details": f"Found {analyses['technical']['count']} technical skills and expertise terms",
-                    "suggestions": "Include more specific technical skills relevant to your field" if analyses["technical"]["percentage"] < 60 else "Strong technical skills representation",
-                    "found_items": analyses["technical"]["terms"][:15]
-                }
-            },
-            "recommendations": [],
-            "metadata": {
-                "filename": file.filename,
-                "text_length": len(resume_text),
-                "analysis_timestamp": datetime.utcnow().isoformat(),
-                "jd_matching_available": jd_match["available"],
-                "datasets_used": {
-                    "esco_available": os.path.exists(ats_analyzer.esco_zip_path),
-                    "tfidf_available": ats_analyzer.tfidf_vectorizer is not None
-                }
-            }
-        }
-        
-        #will add jd match if available
-        if jd_match["available"]:
-            graph_data["categories"]["Job Relevance"] = {
-                "score": round(jd_match["percentage"], 1),
-                "details": f"Resume-job description similarity: {jd_match['percentage']:.1f}%",
-                "suggestions": "Tailor resume content more closely to job requirements" if jd_match["percentage"] < 60 else "Strong alignment with job requirements"
-            }
-        
-        #for generating prioritized recommendations
-        for category, data in graph_data["categories"].items():
-            if data["score"] < 60:
-                priority = "high" if data["score"] < 40 else "medium"
-                graph_data["recommendations"].append({
-                    "category": category,
-                    "priority": priority,
-                    "suggestion": data["suggestions"],
-                    "current_score": data["score"]
-                })
-        
-        #sortin recommendations by priority and score
-        graph_data["recommendations"].sort(key=lambda x: (x["priority"] == "high", -x["current_score"]), reverse=True)
-        
-        #Overall assessment (might change later)
-        if overall_score >= 80:
-            graph_data["overall_assessment"] = "Excellent ATS compatibility - ready for application"
-        elif overall_score >= 60:
-            graph_data["overall_assessment"] = "Good ATS compatibility with some areas for improvement"
-        elif overall_score >= 40:
-            graph_data["overall_assessment"] = "Moderate ATS compatibility - several improvements needed"
-        else:
-            graph_data["overall_assessment"] = "Low ATS compatibility - significant improvements required"
-        
-        print(f"Analysis complete. Overall score: {overall_score}")
-        return graph_data
+        #all analyzers + JD matching run in the ATS worker pool
+        report = await ats_executor.run(analyze_resume, resume_text, job_description, file.filename)
+
+        if ats_result_cache:
+            ats_result_cache.set(cache_key, report)
+        response.headers["ETag"] = etag
+        return report
         
     except HTTPException:
         raise
+    except (ExecutorBusyError, ExecutorStoppedError) as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         print(f"ATS analysis error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error analyzing resume: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error analyzing resume: {str(e)}")
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.post("/ats-checker/stream")
+async def ats_checker_stream(
+    file: UploadFile = File(...),
+    job_description: str = Form("")
+) -> StreamingResponse:
+    """/ats-checker as Server-Sent Events.
+
+    Emits one ``category`` event per analysis as soon as it finishes (cheapest
+    first, with the running overall score), then ``complete`` with exactly the
+    report /ats-checker would return, or ``error``. Analyses are sent to the ATS
+    workers one by one so each result can be flushed immediately; the stream
+    holds one ATS queue slot meanwhile (503 when the queue is full).
+    """
+    if not file:
+        raise HTTPException(status_code=400, detail="No resume file uploaded")
+    
+    if not file.filename or not file.filename.lower().endswith(ATS_SUPPORTED_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="Only pdf, docx, txt files are supported")
+
+    content = await file.read()
+
+    if not job_description:
+        job_description = DEFAULT_JOB_DESCRIPTION
+
+    cache_key = content_key(content, file.filename, job_description, ats_data_version())
+    cached = ats_result_cache.get(cache_key) if ats_result_cache else None
+
+    resume_text = ""
+    if cached is None:
+        resume_text = await asyncio.to_thread(_extract_text_from_bytes, file.filename, content)
+        if not resume_text or len(resume_text.strip()) < 100:
+            raise HTTPException(status_code=400, detail="Could not extract meaningful text from resume")
+        if ats_executor.full:
+            ats_executor.rejected += 1
+            raise HTTPException(status_code=503, detail=f"ATS queue is full ({ats_executor.queue_limit} jobs)",
+                                headers={"Retry-After": "1"})
+
+    async def events():
+        if cached is not None:
+            yield _sse("complete", cached)
+            return
+
+        try:
+            async with ats_executor.reserve():      #same admission limit as /ats-checker
+                analyses, points = {}, {}
+                jd_match = {"score": 0, "percentage": 0, "available": False}
+                steps = await ats_executor.submit(analysis_plan)
+
+                for completed, key in enumerate(steps, 1):
+                    result, points[key] = await ats_executor.submit(analysis_step, resume_text, job_description, key)
+                    event = {"analysis": key, "completed": completed, "total": len(steps)}
+                    if key == "jd_match":
+                        jd_match = result
+                        del points[key]     #reported separately, like /ats-checker
+                    else:
+                        analyses[key] = result
+                    if key != "jd_match" or result["available"]:
+                        event["category"], event["result"] = ATSAnalyzer.build_category(key, result)
+                    event["overall_score"] = round(clamp_score(sum(points.values())), 1)
+                    yield _sse("category", event)
+
+                report = await ats_executor.submit(build_report, analyses, jd_match, file.filename, len(resume_text))
+                if ats_result_cache:
+                    ats_result_cache.set(cache_key, report)
+                yield _sse("complete", report)
+
+        except Exception as e:
+            print(f"ATS analysis error: {str(e)}")
+            yield _sse("error", {"detail": f"Error analyzing resume: {str(e)}"})
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "ETag": f'"{cache_key}"'})
+
+
+@app.post("/ats-checker/batch")
+async def ats_checker_batch(
+    files: Optional[List[UploadFile]] = File(None),
+    texts: Optional[List[str]] = Form(None),
+    job_description: str = Form("")
+) -> Dict[str, Any]:
+    """Score many resumes (uploaded files and/or pre-extracted texts) against one job description.
+
+    Text is extracted concurrently in worker threads, the JD is vectorized once and
+    every resume is matched in a single sparse transform + matrix product. Each
+    entry in ``results`` is the same report /ats-checker returns for that resume,
+    or ``{"filename", "error"}`` if it could not be analyzed.
+    """
+    files = files or []
+    texts = texts or []
+    total = len(files) + len(texts)
+
+    if not total:
+        raise HTTPException(status_code=400, detail="No resume files or texts provided")
+
+    if total > ATS_BATCH_MAX_RESUMES:
+        raise HTTPException(status_code=400, detail=f"At most {ATS_BATCH_MAX_RESUMES} resumes per batch")
+
+    if not job_description:
+        job_description = DEFAULT_JOB_DESCRIPTION
+
+    extract_slots = asyncio.Semaphore(ATS_BATCH_EXTRACT_CONCURRENCY)
+
+    async def extract(upload: UploadFile) -> str:
+        if not upload.filename or not upload.filename.lower().endswith(ATS_SUPPORTED_EXTENSIONS):
+            raise ValueError("Only pdf, docx, txt files are supported")
+        content = await upload.read()
+        async with extract_slots:
+            return await asyncio.to_thread(_extract_text_from_bytes, upload.filename, content)
+
+    try:
+        extracted = await asyncio.gather(*(extract(f) for f in files), return_exceptions=True)
+        entries = [(f.filename, text) for f, text in zip(files, extracted)]
+        entries += [(f"text_{i + 1}", text) for i, text in enumerate(texts)]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        positions, valid_entries = [], []
+        for position, (name, text) in enumerate(entries):
+            if isinstance(text, Exception):
+                results[position] = {"filename": name, "error": str(text)}
+            elif not text or len(text.strip()) < 100:
+                results[position] = {"filename": name, "error": "Could not extract meaningful text from resume"}
+            else:
+                positions.append(position)
+                valid_entries.append((name, text))
+
+        print(f"Batch ATS analysis of {len(valid_entries)}/{total} resumes")
+
+        #one chunk per worker; each chunk is JD-matched with a single transform + sparse product
+        chunk_size = max(1, -(-len(valid_entries) // max(1, ats_executor.workers)))
+        chunks = [valid_entries[i:i + chunk_size] for i in range(0, len(valid_entries), chunk_size)]
+        chunk_reports = await asyncio.gather(*(ats_executor.run(analyze_resumes, chunk, job_description) for chunk in chunks))
+        for position, report in zip(positions, (report for reports in chunk_reports for report in reports)):
+            results[position] = report
+
+        return {
+            "count": total,
+            "analyzed": sum(1 for result in results if "error" not in result),
+            "jd_matching_available": any(result.get("metadata", {}).get("jd_matching_available", False) for result in results),
+            "analysis_timestamp": datetime.utcnow().isoformat(),
+            "results": results
+        }
+
+    except HTTPException:
+        raise
+    except (ExecutorBusyError, ExecutorStoppedError) as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except Exception as e:
+        print(f"Batch ATS analysis error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error analyzing resumes: {str(e)}")
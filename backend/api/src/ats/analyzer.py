@@ -0,0 +1,596 @@
+"""
+ATS analysis engine shared by the API and its worker processes.
+
+``ATSAnalyzer`` loads the TF-IDF vectorizer, the ESCO index and the term
+matcher once, then scores resumes. It lives outside ``app.py`` so the
+process-pool workers (see ``ats.executor``) can import it without pulling in
+FastAPI or the LLM stack. Each process builds one analyzer through
+``get_analyzer``; ``analyze_resume`` / ``analyze_resumes`` (and the per-step
+functions ``/ats-checker/stream`` uses) are the picklable entry points
+submitted to the pool. ``ats_data_version`` fingerprints the data files from
+their metadata alone, so the API process can key its result cache without
+loading any model.
+
+The individual analyzers, their inputs, costs and score weights are declared
+in the analyzer's ``AnalyzerRegistry`` (see ``ats.registry``) and executed by
+its ``AnalyzerRunner``, which also times them.
+"""
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from ats.document import ResumeDocument
+from ats.quantifiable import quantifiable_extractor
+from ats.registry import AnalyzerRegistry, AnalyzerRunner
+from utils.cache import LRUCache
+
+try:
+    from ats.ats import (
+        clean_text,
+        buzzwords
+    )
+    from ats.matchjd import (
+        get_resume_jd_match_score,
+        get_resumes_jd_match_scores,
+        precompute_jd_vectors
+    )
+    print("successfully imported from existing ats files")
+except Exception as e:
+    print(f"could not import ats files: {e}")
+
+
+ATS_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+#used when /ats-checker is called without a job description
+DEFAULT_JOB_DESCRIPTION = """
+            We are seeking a skilled professional with strong technical expertise and proven experience. 
+            Candidates should demonstrate quantifiable achievements, relevant industry experience, 
+            and excellent communication skills. Experience with modern technologies and methodologies preferred.
+            Strong analytical and problem-solving abilities required.
+            """
+
+ATS_ANALYZER_VERSION = "1"      #bump whenever scoring/report output changes; part of the result cache key and ETag
+
+
+class ATSDataPaths(NamedTuple):
+    esco_zip: str
+    vectorizer: str
+    esco_index_dir: str
+
+
+def data_paths() -> ATSDataPaths:
+    #resolved against this package, not the working directory (uvicorn runs from backend/api, scripts from src)
+    esco_zip = os.getenv('ESCO_ZIP_PATH', os.path.join(ATS_DATA_DIR, 'ESCO dataset - v1.2.0 - classification - en - csv.zip'))
+    vectorizer = os.getenv('TFIDF_VECTORIZER_PATH', os.path.join(ATS_DATA_DIR, 'ats_tfidf_vectorizer', 'tfidf_vectorizer.pkl'))
+    esco_index_dir = os.getenv('ESCO_INDEX_DIR', os.path.join(os.path.dirname(esco_zip), 'esco_index'))
+    return ATSDataPaths(esco_zip, vectorizer, esco_index_dir)
+
+
+def ats_data_version(paths: Optional[ATSDataPaths] = None) -> str:
+    """Analyzer version plus fingerprints of the ESCO index and vectorizer on disk.
+
+    Read from ``meta.json`` and file stats only, never by loading a model, so
+    the API process can compute result cache keys while the analyzers live in
+    the pool workers. Cached reports never outlive the data they came from.
+    """
+    from ats.esco_index import FORMAT_VERSION, read_index_meta
+
+    paths = paths or data_paths()
+    meta = read_index_meta(paths.esco_index_dir)
+    esco = f"{meta.get('format_version')}:{meta.get('source')}:{meta.get('term_count')}" if meta else None
+    try:
+        st = os.stat(paths.vectorizer)
+        tfidf = f"{st.st_size}:{int(st.st_mtime)}"
+    except OSError:
+        tfidf = None
+    return f"{ATS_ANALYZER_VERSION}|esco:{FORMAT_VERSION}/{esco}|tfidf:{tfidf}|jd:{'get_resume_jd_match_score' in globals()}"
+
+
+def clamp_score(points: float) -> float:
+    return max(0, min(100, points))
+
+#run through every analyzer when a worker starts, so the first real request doesn't pay for lazy loads
+WARMUP_RESUME = """
+John Doe - Software Engineer
+Summary
+Python developer with experience in machine learning, cloud computing and agile teams.
+Experience
+Increased API throughput by 40% and reduced infrastructure costs by 25%.
+Led a team of 5 engineers and delivered 12 projects for 20,000 users.
+Education
+B.Tech in Computer Science
+Skills
+Python, SQL, Docker, Kubernetes, AWS, data analysis, project management
+"""
+
+
+class ATSAnalyzer:
+    def __init__(self, build_esco_index: bool = True):
+        self.paths = data_paths()
+        self.esco_zip_path, self.vectorizer_path, self.esco_index_dir = self.paths
+        self.tfidf_vectorizer = None
+        self.esco_index = None
+        self.term_matcher = None
+        self._stop_words = None
+        self.buzzwords = buzzwords if 'buzzwords' in globals() else self._get_default_buzzwords()
+        self._load_vectorizer()
+        self._precompute_default_jd()
+        self._load_esco_index(build_esco_index)
+        self._build_term_matcher()
+        self.registry = self._build_registry()
+        self.runner = AnalyzerRunner(self.registry)
+
+    def _build_registry(self) -> AnalyzerRegistry:     #registration order is report order; cost orders streaming (cheapest first)
+        registry = AnalyzerRegistry()
+        registry.provide("term_hits", self.scan_terms)      #one automaton pass shared by buzzwords + technical
+        registry.register("buzzwords", self.analyze_buzzwords_from_text, inputs=("doc", "term_hits"), cost=4)
+        registry.register("quantifiable", self.analyze_quantifiable_from_text, cost=2)
+        registry.register("structure", self.analyze_structure_from_text, cost=1)
+        registry.register("repetition", self.analyze_repetition_from_text, cost=3,
+                          metric=lambda result: 100 - result["score"])
+        registry.register("technical", self.analyze_esco_technical_terms, inputs=("doc", "term_hits"), cost=5)
+        registry.register("jd_match", self.calculate_jd_match_score, inputs=("doc", "jd"), cost=6,
+                          metric=lambda result: result["score"])
+        return registry
+
+    
+    def _load_vectorizer(self):     #for loading tf-idf vectorizer from existing file (have to add later)
+        try:
+            import joblib
+            self.tfidf_vectorizer = joblib.load(self.vectorizer_path)
+            print(f"Successfully loaded TF-IDF vectorizer from {self.vectorizer_path}")
+        except Exception as e:
+            print(f"Could not load TF-IDF vectorizer: {e}")
+
+    def _precompute_default_jd(self):     #default JD is cleaned + vectorized once here instead of on every request without a JD
+        if self.tfidf_vectorizer is None or 'precompute_jd_vectors' not in globals():
+            return
+        try:
+            precompute_jd_vectors([DEFAULT_JOB_DESCRIPTION], self.tfidf_vectorizer)
+            print("Precomputed default job description vector")
+        except Exception as e:
+            print(f"Could not precompute default job description vector: {e}")
+
+    def _load_stem_table(self, path):
+        if not path or not os.path.isfile(path):
+            return
+        try:
+            from ats.ats import stem_cache
+            added = stem_cache.load_table(path)
+            print(f"Pinned {added} precomputed stems from {path}")
+        except Exception as e:
+            print(f"Could not load stem table {path}: {e}")
+
+    def _load_esco_index(self, build: bool = True):     #prebuilt ESCO index, built once from the zip if missing (see ats/esco_index.py)
+        try:
+            from ats.esco_index import load_or_build_esco_index
+            self.esco_index = load_or_build_esco_index(self.esco_zip_path, self.esco_index_dir, self.buzzwords, build)
+            if self.esco_index is not None:
+                print(f"Successfully loaded ESCO index with {len(self.esco_index)} terms from {self.esco_index_dir}")
+                self._load_stem_table(self.esco_index.stems_path)
+            else:
+                print(f"ESCO index not available: no index at {self.esco_index_dir} and no zip at {self.esco_zip_path}")
+        except Exception as e:
+            print(f"Could not load ESCO index: {e}")
+
+    def _build_term_matcher(self):     #one automaton for buzzwords + ESCO terms, built once here
+        try:
+            from ats.term_matcher import TermMatcher
+            self.term_matcher = TermMatcher.from_esco_index(self.buzzwords, self.esco_index)
+            print(f"Built term matcher with {len(self.buzzwords)} buzzwords and {self.term_matcher.esco_term_count} ESCO terms")
+        except Exception as e:
+            print(f"Could not build term matcher: {e}")
+            if self.esco_index is None:
+                return
+            try:        #buzzwords still go through the token automaton without ESCO
+                self.term_matcher = TermMatcher.from_esco_index(self.buzzwords, None)
+                print(f"Built buzzword-only term matcher with {len(self.buzzwords)} buzzwords")
+            except Exception as e:
+                print(f"Could not build buzzword-only term matcher: {e}")
+
+    def scan_terms(self, resume_text):
+        """Single pass over the resume for buzzwords and ESCO terms (None if the matcher is unavailable)"""
+        if self.term_matcher is None:
+            return None
+        doc = ResumeDocument.coerce(resume_text)
+        return doc.memo("term_hits", lambda: self.term_matcher.scan_tokens(doc.stemmed_tokens))
+
+    def _get_stop_words(self):
+        if self._stop_words is None:
+            try:
+                from nltk.corpus import stopwords
+                self._stop_words = set(stopwords.words('english'))
+            except:     #basic fallback
+                self._stop_words = set(['the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an', 'is', 'are', 'was', 'were'])
+        return self._stop_words
+
+    def version(self):      #same key the API computes without an analyzer (see ats_data_version)
+        return ats_data_version(self.paths)
+
+    def cache_stats(self):
+        stats = {}
+        try:
+            from ats.ats import stem_cache
+            stats["stems"] = stem_cache.stats()
+        except Exception:
+            pass
+        try:
+            from ats.jd_cache import jd_cache
+            stats["jd_vectors"] = jd_cache.stats()
+        except Exception:
+            pass
+        return stats
+
+    def _get_default_buzzwords(self):       #fallback buzzwords (not needed ig but still)
+        return [
+            "machine learning", "deep learning", "artificial intelligence", "data science",
+            "big data", "cloud computing", "aws", "azure", "gcp", "devops", "agile", "scrum",
+            "python", "r", "sql", "nosql", "docker", "kubernetes", "ci/cd", "nlp",
+            "computer vision", "predictive modeling", "statistical analysis", "data mining"
+        ]
+    
+    def analyze_buzzwords_from_text(self, resume_text, term_hits=None):     #term_hits: the shared scan_terms pass, when the runner already has it
+        doc = ResumeDocument.coerce(resume_text)
+        if term_hits is None:
+            term_hits = self.scan_terms(doc)
+
+        if term_hits is not None:
+            found_buzzwords = term_hits.buzzwords
+        else:       #only if no matcher could be built; whole-word like the automaton, never a substring test
+            found_buzzwords = [buzzword for buzzword in self.buzzwords if doc.contains_phrase(buzzword)]
+        buzzword_count = len(found_buzzwords)
+        
+        return {
+            "count": buzzword_count,
+            "percentage": min(100, (buzzword_count / 30) * 100),
+            "found_terms": found_buzzwords
+        }
+    
+    def analyze_quantifiable_from_text(self, resume_text):
+        quantifiable_achievements = quantifiable_extractor.extract(resume_text)
+        
+        count = len(quantifiable_achievements)
+        return {
+            "count": count,
+            "percentage": min(100, (count / 8) * 100),
+            "achievements": quantifiable_achievements
+        }
+    
+    def analyze_esco_technical_terms(self, resume_text, term_hits=None):        #from ats.py (existing esco analysis), matched via the term automaton
+        doc = ResumeDocument.coerce(resume_text)
+        unique_technical_terms_count = 0
+        found_terms = []
+        
+        try:
+            if self.esco_index is not None:
+                if term_hits is None:
+                    term_hits = self.scan_terms(doc)
+                if term_hits is None or not self.term_matcher.esco_term_count:
+                    raise RuntimeError("term matcher with ESCO terms not available")
+                found_terms = term_hits.esco_terms
+                unique_technical_terms_count = len(set(found_terms))
+                        
+        except Exception as e:      #vibecoded exception logic :>
+            print(f"ESCO analysis failed: {e}")
+            # Fallback to basic technical terms
+            basic_terms = ["python", "java", "javascript", "sql", "aws", "docker", "react"]
+            found_terms = [term for term in basic_terms if doc.contains_phrase(term)]     #whole words: "java" is not in "javascript"
+            unique_technical_terms_count = len(found_terms)
+        
+        return {
+            "count": unique_technical_terms_count,
+            "percentage": min(100, (unique_technical_terms_count / 15) * 100),
+            "terms": found_terms[:20]  # Limit for response size
+        }
+    
+    def analyze_structure_from_text(self, resume_text):
+        section_titles = [
+            "summary", "objective", "education", "experience", "work experience",
+            "professional experience", "skills", "technical skills", "projects",
+            "portfolio", "awards", "honors", "publications", "presentations",
+            "licenses", "certifications", "volunteering", "interests", "contact",
+            "contact information"
+        ]
+        
+        doc = ResumeDocument.coerce(resume_text)
+        identified_sections = [title for title in section_titles if doc.contains_phrase(title)]
+        
+        count = len(identified_sections)
+        return {
+            "count": count,
+            "percentage": min(100, (count / 8) * 100),
+            "sections": identified_sections
+        }
+    
+    def analyze_repetition_from_text(self, resume_text):
+        word_counts = ResumeDocument.coerce(resume_text).token_counts
+        
+        ignore_words = self._get_stop_words() | {'com', 'https', 'www', 'project', 'skill', 
+                                   'experience', 'develop', 'system'}
+        
+        high_frequency_words = [word for word, count in word_counts.most_common(50) 
+                              if count > 10 and word not in ignore_words]
+        
+        repetition_penalty = len(high_frequency_words) * 5
+        score = max(0, 100 - repetition_penalty)
+        
+        return {
+            "score": score,
+            "percentage": score,
+            "repetitive_words": high_frequency_words
+        }
+    
+    def calculate_jd_match_score(self, resume_text, jd_text):       
+        if not self.tfidf_vectorizer or not jd_text:
+            return {"score": 0, "percentage": 0, "available": False}
+        
+        try:
+            if 'get_resume_jd_match_score' in globals():
+                similarity = get_resume_jd_match_score(resume_text, jd_text, self.tfidf_vectorizer)
+                if similarity is not None:
+                    return {
+                        "score": similarity,
+                        "percentage": similarity * 100,
+                        "available": True
+                    }
+            return {"score": 0, "percentage": 0, "available": False}
+            
+        except Exception as e:
+            print(f"JD matching error: {e}")
+            return {"score": 0, "percentage": 0, "available": False}
+
+    def calculate_jd_match_scores(self, resume_texts, jd_text):        #batch version: one transform + one sparse product for all resumes
+        unavailable = [{"score": 0, "percentage": 0, "available": False} for _ in resume_texts]
+        if not self.tfidf_vectorizer or not jd_text:
+            return unavailable
+
+        try:
+            if 'get_resumes_jd_match_scores' in globals():
+                similarities = get_resumes_jd_match_scores(resume_texts, jd_text, self.tfidf_vectorizer)
+                if similarities is not None:
+                    return [
+                        {"score": float(similarity), "percentage": float(similarity) * 100, "available": True}
+                        for similarity in similarities
+                    ]
+            return unavailable
+
+        except Exception as e:
+            print(f"JD matching error: {e}")
+            return unavailable
+
+    def run_analyses(self, resume_doc: ResumeDocument) -> Dict[str, Any]:
+        """Every JD-independent analyzer over one (shared) resume document, run concurrently"""
+        print(f"Analyzing resume with {len(resume_doc)} characters")
+        analyses, timings = self.runner.run({"doc": resume_doc}, self.registry.keys(exclude_inputs=("jd",)))
+        self._log_timings(timings)
+        return analyses
+
+    @staticmethod
+    def _log_timings(timings) -> None:
+        print("Analyzer timings: " + ", ".join(f"{key} {timing.wall_ms:.1f}ms/{timing.result_bytes}B" for key, timing in timings.items()))
+
+    def analysis_step(self, resume_doc: ResumeDocument, job_description: str, key: str) -> Tuple[Dict[str, Any], float]:
+        """``(result, points)`` of one analysis (used to stream partial results)"""
+        result = self.runner.run_one(key, {"doc": resume_doc, "jd": job_description})
+        return result, self.registry.get(key).points(result)
+
+    def overall_score(self, analyses: Dict[str, Any]) -> float:
+        """Weighted 0-100 score (weights from the registry); analyses not (yet) present contribute nothing"""
+        return clamp_score(self.registry.score(analyses))
+
+    @staticmethod
+    def build_category(key: str, analysis: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """(category name, report entry) for one analysis result"""
+        if key == "buzzwords":
+            return "Industry Keywords", {
+                "score": round(analysis["percentage"], 1),
+                "count": analysis["count"],
+                "details": f"Found {analysis['count']} relevant industry keywords",
+                "suggestions": "Include more industry-specific terms and technologies" if analysis["percentage"] < 60 else "Strong keyword coverage",
+                "found_items": analysis["found_terms"][:10]  # Top 10 for display
+            }
+        if key == "quantifiable":
+            return "Quantifiable Impact", {
+                "score": round(analysis["percentage"], 1),
+                "count": analysis["count"],
+                "details": f"Found {analysis['count']} quantifiable achievements with metrics",
+                "suggestions": "Add more specific numbers, percentages, and measurable outcomes" if analysis["percentage"] < 50 else "Excellent use of quantifiable metrics",
+                "found_items": analysis["achievements"][:5]
+            }
+        if key == "structure":
+            return "Resume Structure", {
+                "score": round(analysis["percentage"], 1),
+                "count": analysis["count"],
+                "details": f"Identified {analysis['count']} standard resume sections",
+                "suggestions": "Consider adding missing standard sections" if analysis["percentage"] < 70 else "Well-organized resume structure",
+                "found_items": analysis["sections"]
+            }
+        if key == "repetition":
+            return "Content Quality", {
+                "score": round(analysis["percentage"], 1),
+                "details": "Analysis of word repetition and content diversity",
+                "suggestions": "Vary your language and avoid repetitive phrases" if analysis["percentage"] < 80 else "Good content diversity and language variation",
+                "issues": analysis["repetitive_words"][:5]
+            }
+        if key == "technical":
+            return "Technical Expertise", {
+                "score": round(analysis["percentage"], 1),
+                "count": analysis["count"],
+                "details": f"Found {analysis['count']} technical skills and expertise terms",
+                "suggestions": "Include more specific technical skills relevant to your field" if analysis["percentage"] < 60 else "Strong technical skills representation",
+                "found_items": analysis["terms"][:15]
+            }
+        if key == "jd_match":
+            return "Job Relevance", {
+                "score": round(analysis["percentage"], 1),
+                "details": f"Resume-job description similarity: {analysis['percentage']:.1f}%",
+                "suggestions": "Tailor resume content more closely to job requirements" if analysis["percentage"] < 60 else "Strong alignment with job requirements"
+            }
+        raise KeyError(f"unknown analysis {key}")
+
+    def build_report(self, analyses: Dict[str, Any], jd_match: Dict[str, Any], filename: str, text_length: int) -> Dict[str, Any]:
+        """Scores, per-category breakdown and recommendations returned by /ats-checker"""
+        if jd_match["available"]:
+            analyses["jd_match"] = jd_match
+            print(f"JD Match: {jd_match['percentage']:.1f}%")
+
+        overall_score = self.overall_score(analyses)
+        
+        graph_data = {
+            "overall_score": round(overall_score, 1),
+            "categories": dict(
+                self.build_category(key, analyses[key])
+                for key in self.registry.keys(exclude_inputs=("jd",))
+            ),
+            "recommendations": [],
+            "metadata": {
+                "filename": filename,
+                "text_length": text_length,
+                "analysis_timestamp": datetime.utcnow().isoformat(),
+                "jd_matching_available": jd_match["available"],
+                "datasets_used": {
+                    "esco_available": self.esco_index is not None,
+                    "tfidf_available": self.tfidf_vectorizer is not None
+                }
+            }
+        }
+        
+        #will add jd match if available
+        if jd_match["available"]:
+            name, category = self.build_category("jd_match", jd_match)
+            graph_data["categories"][name] = category
+        
+        #for generating prioritized recommendations
+        graph_data["recommendations"] = self.build_recommendations(graph_data["categories"])
+        graph_data["overall_assessment"] = self.overall_assessment(overall_score)
+        
+        print(f"Analysis complete. Overall score: {overall_score}")
+        return graph_data
+
+    @staticmethod
+    def build_recommendations(categories: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        recommendations = []
+        for category, data in categories.items():
+            if data["score"] < 60:
+                priority = "high" if data["score"] < 40 else "medium"
+                recommendations.append({
+                    "category": category,
+                    "priority": priority,
+                    "suggestion": data["suggestions"],
+                    "current_score": data["score"]
+                })
+        
+        #sortin recommendations by priority and score
+        recommendations.sort(key=lambda x: (x["priority"] == "high", -x["current_score"]), reverse=True)
+        return recommendations
+
+    @staticmethod
+    def overall_assessment(overall_score: float) -> str:
+        #Overall assessment (might change later)
+        if overall_score >= 80:
+            return "Excellent ATS compatibility - ready for application"
+        elif overall_score >= 60:
+            return "Good ATS compatibility with some areas for improvement"
+        elif overall_score >= 40:
+            return "Moderate ATS compatibility - several improvements needed"
+        else:
+            return "Low ATS compatibility - significant improvements required"
+
+    def analyze(self, resume_text: Any, job_description: str, filename: str) -> Dict[str, Any]:
+        """Full /ats-checker report for one resume"""
+        resume_doc = ResumeDocument.coerce(resume_text)     #normalized/tokenized/stemmed once, shared by every analyzer
+        print(f"Analyzing resume with {len(resume_doc)} characters")
+        analyses, timings = self.runner.run({"doc": resume_doc, "jd": job_description})
+        self._log_timings(timings)
+
+        #JD Matching (from matchjd.py) runs alongside the others; the report adds it separately
+        jd_match = analyses.pop("jd_match")
+        return self.build_report(analyses, jd_match, filename, len(resume_doc))
+
+    def analyze_many(self, entries: Sequence[Tuple[str, str]], job_description: str) -> List[Dict[str, Any]]:
+        """Reports for ``(filename, resume_text)`` pairs; the JD is matched against all of them in one sparse product"""
+        resume_docs = [ResumeDocument(text) for _, text in entries]
+        jd_matches = self.calculate_jd_match_scores(resume_docs, job_description)
+        reports = []
+        for (name, _), resume_doc, jd_match in zip(entries, resume_docs, jd_matches):
+            try:
+                reports.append(self.build_report(self.run_analyses(resume_doc), jd_match, name, len(resume_doc)))
+            except Exception as e:
+                print(f"ATS analysis error for {name}: {str(e)}")
+                reports.append({"filename": name, "error": f"Error analyzing resume: {str(e)}"})
+        return reports
+
+    def warm_up(self) -> None:
+        self.analyze(WARMUP_RESUME, DEFAULT_JOB_DESCRIPTION, "warmup.txt")
+
+
+_analyzer: Optional[ATSAnalyzer] = None
+_analyzer_lock = threading.Lock()
+
+
+def get_analyzer(create: bool = True, build_esco_index: bool = True) -> Optional[ATSAnalyzer]:
+    """The process-wide analyzer, built on first use (``create=False`` returns None until then)"""
+    global _analyzer
+    if _analyzer is None and create:
+        with _analyzer_lock:
+            if _analyzer is None:
+                _analyzer = ATSAnalyzer(build_esco_index)
+    return _analyzer
+
+
+def analyze_resume(resume_text: str, job_description: str, filename: str) -> Dict[str, Any]:
+    return get_analyzer().analyze(resume_text, job_description, filename)
+
+
+def analyze_resumes(entries: Sequence[Tuple[str, str]], job_description: str) -> List[Dict[str, Any]]:
+    return get_analyzer().analyze_many(entries, job_description)
+
+
+def prepare_esco_index() -> bool:
+    """Build (or check against its zip) the ESCO index without loading anything else; True if one is there"""
+    paths = data_paths()
+    try:
+        from ats.esco_index import load_or_build_esco_index
+        return load_or_build_esco_index(paths.esco_zip, paths.esco_index_dir) is not None     #default buzzwords, as the analyzer
+    except Exception as e:      #workers then run without ESCO, as the analyzer itself would
+        print(f"Could not prepare ESCO index: {e}")
+        return False
+
+
+def _data_check(loaded: bool, path: str, deployed: bool) -> Dict[str, Any]:
+    return {"ok": loaded, "detail": path if deployed else f"not deployed: {path}", "deployed": deployed}
+
+
+def analyzer_status(warm_up: bool = False) -> Dict[str, Any]:
+    """What this process's analyzer loaded, and which data files exist; run through the executor to ask a pool worker"""
+    from ats.esco_index import META_FILE
+
+    analyzer = get_analyzer()
+    if warm_up:
+        analyzer.warm_up()
+    esco_deployed = os.path.isfile(os.path.join(analyzer.esco_index_dir, META_FILE)) or os.path.isfile(analyzer.esco_zip_path)
+    return {
+        "analyzers": len(analyzer.registry),
+        "tfidf_vectorizer": _data_check(analyzer.tfidf_vectorizer is not None, analyzer.vectorizer_path,
+                                        os.path.isfile(analyzer.vectorizer_path)),
+        "esco_index": _data_check(analyzer.esco_index is not None, analyzer.esco_index_dir, esco_deployed),
+    }
+
+
+def analysis_plan() -> List[str]:
+    """Analysis keys, cheapest first (the order /ats-checker/stream runs them in)"""
+    return [spec.key for spec in get_analyzer().registry.by_cost()]
+
+
+#a stream submits its steps one at a time, so the worker keeps the parsed document between them
+_step_documents = LRUCache(maxsize=8)
+
+
+def analysis_step(resume_text: str, job_description: str, key: str) -> Tuple[Dict[str, Any], float]:
+    resume_doc = _step_documents.get_or_set(resume_text, lambda: ResumeDocument(resume_text))
+    return get_analyzer().analysis_step(resume_doc, job_description, key)
+
+
+def build_report(analyses: Dict[str, Any], jd_match: Dict[str, Any], filename: str, text_length: int) -> Dict[str, Any]:
+    return get_analyzer().build_report(analyses, jd_match, filename, text_length)
@@ -1,66 +1,112 @@
-import pandas as pd
 import re
 import os
-import zipfile
-from collections import Counter
-import spacy
-from spacy.matcher import PhraseMatcher
+import threading
+from ats.stemming import StemCache
 
+#nltk is imported on first use, not at import time:
+#nltk alone takes ~2s to import (it pulls in scipy) and used to download corpora here
+
+NLTK_DATASETS = ['stopwords', 'punkt', 'wordnet', 'omw-1.4']
+
+
+def setup_nltk(download=None):   #trying to Setup NLTK; missing corpora are only downloaded when asked (download=True or NLTK_AUTO_DOWNLOAD=1)
+    if download is None:
+        download = os.getenv('NLTK_AUTO_DOWNLOAD', '0').lower() in ('1', 'true', 'yes')
 
-def setup_nltk():   #trying to Setup NLTK for automatic downloads
-    
     try:
         import nltk
         import ssl
         
         #forHandling SSL certificate issues
-        try:
-            _create_unverified_https_context = ssl._create_unverified_context
-        except AttributeError:
-            pass
-        else:
-            ssl._create_default_https_context = _create_unverified_https_context
+        if download:
+            try:
+                _create_unverified_https_context = ssl._create_unverified_context
+            except AttributeError:
+                pass
+            else:
+                ssl._create_default_https_context = _create_unverified_https_context
         
-        required_datasets = ['stopwords', 'punkt', 'wordnet', 'omw-1.4']
-        for dataset in required_datasets:
+        for dataset in NLTK_DATASETS:
             try:
                 nltk.data.find(f'tokenizers/{dataset}' if dataset == 'punkt' else f'corpora/{dataset}')
             except LookupError:
-                print(f"Downloading NLTK {dataset}...")
-                nltk.download(dataset, quiet=True)
+                if download:
+                    print(f"Downloading NLTK {dataset}...")
+                    nltk.download(dataset, quiet=True)
+                else:
+                    print(f"NLTK {dataset} not found (set NLTK_AUTO_DOWNLOAD=1 to download it)")
         
         return True
     except Exception as e:
         print(f"NLTK setup failed: {e}")
         return False
 
-nltk_available = setup_nltk()
-
-if nltk_available:
-    try:
-        from nltk.stem.porter import PorterStemmer
-        from nltk.corpus import stopwords as nltk_stopwords
-        stemmer = PorterStemmer()
-    except Exception as e:
-        print(f"Failed to import NLTK modules: {e}")
-        stemmer = None
-        nltk_stopwords = None
-else:
-    stemmer = None
-    nltk_stopwords = None
+#set by load_nltk() on first use
+nltk_available = None
+stemmer = None
+nltk_stopwords = None
+_nltk_lock = threading.Lock()
+
+
+def load_nltk():        #imports nltk + the porter stemmer once, the first time anything needs them
+    global nltk_available, stemmer, nltk_stopwords
+    if nltk_available is None:
+        with _nltk_lock:
+            if nltk_available is None:
+                available = setup_nltk()
+                if available:
+                    try:
+                        from nltk.stem.porter import PorterStemmer
+                        from nltk.corpus import stopwords
+                        stemmer = PorterStemmer()
+                        nltk_stopwords = stopwords
+                    except Exception as e:
+                        print(f"Failed to import NLTK modules: {e}")
+                nltk_available = available
+    return nltk_available
+
+
+class LazyWordSet:
+    """Read-only word set built on first use (membership, iteration, len)"""
+
+    def __init__(self, load):
+        self._load = load
+        self._words = None
+        self._lock = threading.Lock()
+
+    def words(self):
+        if self._words is None:
+            with self._lock:
+                if self._words is None:
+                    self._words = frozenset(self._load())
+        return self._words
+
+    def __contains__(self, word):
+        return word in self.words()
+
+    def __iter__(self):
+        return iter(self.words())
+
+    def __len__(self):
+        return len(self.words())
 
 resume_file_path = "/content/Resume_AyushPandey_V15.pdf"
-esco_zip_path = '/content/ESCO dataset - v1.2.0 - classification - en - csv.zip'
-target_csv_name = 'skills_en.csv'
-extracted_csv_path = f'/tmp/{target_csv_name}' 
+
+stopwords_source = None     #"nltk" or "fallback" once stop_words has loaded
+
 
 def get_stopwords():        #get stopwords if nltk is not availab;e
+    global stopwords_source
+    load_nltk()
     if nltk_stopwords:
         try:
-            return set(nltk_stopwords.words('english'))
+            words = set(nltk_stopwords.words('english'))
+            stopwords_source = "nltk"
+            return words
         except Exception as e:
             print(f"Error getting NLTK stopwords: {e}")
     
+    stopwords_source = "fallback"
     return {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 
             'a', 'an', 'is', 'are', 'was', 'were', 'i', 'you', 'he', 'she', 'it', 'we', 
             'they', 'this', 'that', 'these', 'those', 'my', 'your', 'his', 'her', 'its', 
@@ -76,22 +122,83 @@ def simple_stem(word):
     return word
 
 
-stop_words = get_stopwords()
+stop_words = LazyWordSet(get_stopwords)
+
+
+def _stem(word):        #porter stemmer once nltk is loaded, simple_stem without it
+    load_nltk()
+    return stemmer.stem(word) if stemmer else simple_stem(word)
+
+#memoized stems, shared by every clean_text caller (see ats/stemming.py)
+stem_cache = StemCache(_stem)
+
+buzzwords = [
+    "machine learning", "deep learning", "artificial intelligence", "data science",
+    "big data", "cloud computing", "aws", "azure", "gcp", "devops", "agile", "scrum",
+    "python", "r", "sql", "nosql", "docker", "kubernetes", "ci/cd", "nlp",
+    "computer vision", "predictive modeling", "statistical analysis", "data mining",
+    "business intelligence", "ETL", "API", "microservices", "containerization",
+    "javascript", "react", "angular", "vue", "node.js", "backend", "frontend",
+    "full-stack", "cybersecurity", "blockchain", "iot", "data engineering",
+    "data visualization", "tableau", "power bi", "spark", "hadoop", "kafka",
+    "tensorflow", "pytorch", "scikit-learn", "statistical modeling",
+    "natural language processing", "reinforcement learning", "supervised learning",
+    "unsupervised learning", "feature engineering", "model deployment", "scalable",
+    "robust", "efficient", "optimize", "automate", "innovative", "strategic",
+    "leadership", "communication", "collaboration", "problem-solving",
+    "critical thinking", "quantitative", "qualitative", "analytical",
+    "customer-facing", "cross-functional", "stakeholders", "ROI", "KPIs",
+    "A/B testing", "workflow", "pipeline", "architecture", "design patterns",
+    "best practices", "documentation", "testing", "debugging", "performance tuning",
+    "scalability", "reliability", "security", "compliance", "governance",
+    "mentoring", "training", "presentation", "reporting", "dashboarding",
+    "monitoring", "alerting", "logging", "troubleshooting", "optimization",
+    "automation", "innovation", "strategy", "execution", "delivery", "roadmap",
+    "vision", "mission", "values", "culture", "team player", "independent",
+    "proactive", "results-oriented", "detail-oriented", "organized", "flexible",
+    "adaptable", "resourceful", "creative", "passionate", "driven", "motivated",
+    "enthusiastic", "committed", "dedicated", "reliable", "responsible",
+    "ethical", "professional", "positive attitude", "strong work ethic",
+    "time management", "prioritization", "multitasking", "negotiation",
+    "persuasion", "influence", "mentorship", "coaching", "feedback",
+    "performance", "evaluation", "recruitment", "hiring", "onboarding",
+    "retention", "engagement", "satisfaction", "loyalty", "advocacy",
+    "brand", "marketing", "sales", "finance", "accounting", "legal",
+    "HR", "operations", "supply chain", "logistics", "procurement",
+    "inventory", "warehousing", "transportation", "customer service",
+    "user experience", "ui/ux", "product management", "project management",
+    "program management", "portfolio management", "risk management",
+    "quality assurance", "testing", "automation testing", "manual testing",
+    "performance testing", "security testing", "usability testing",
+    "accessibility testing", "compliance testing", "governance testing",
+    "audit", "compliance", "regulation", "policy", "standard", "framework",
+    "methodology", "process", "workflow", "procedure", "guideline",
+    "best practice", "lessons learned", "post-mortem", "retrospective",
+    "stand-up", "sprint", "epic", "user story", "task", "bug", "feature",
+    "release", "version control", "git", "github", "gitlab", "bitbucket",
+    "jira", "confluence", "slack", "microsoft teams", "google workspace",
+    "office 365", "salesforce", "servicenow", "zendesk", "hubspot",
+    "marketo", "pardot", "salesloft", "outreach", "zoominfo",
+    "linkedin sales navigator", "crunchbase", "clearbit", "zoom",
+    "google meet", "microsoft teams", "webex", "skype", "slack",
+    "jira", "confluence", "trello", "asana", "monday.com",
+    "smartsheet", "microsoft project", "primavera", "servicenow",
+    "zendesk",
+]
 
 def clean_text(text):
     if isinstance(text, str):
         text = text.lower()
         text = re.sub(r'[^\w\s]', '', text)
         
-        if stemmer:
-            text = ' '.join([stemmer.stem(word) for word in text.split() if word not in stop_words])
-        else:
-            text = ' '.join([simple_stem(word) for word in text.split() if word not in stop_words])
+        stem = stem_cache.stem
+        stop = stop_words.words()
+        text = ' '.join([stem(word) for word in text.split() if word not in stop])
         return text
     return ''
 
 def get_wordnet_lemmatizer():
-    if not nltk_available:
+    if not load_nltk():
         print("NLTK not available, lemmatizer unavailable")
         return None
         
@@ -119,348 +226,40 @@ def extract_text_from_resume_pdf(pdf_path):
         print(f"Error extracting text from PDF: {e}")
         return ""
 
-def analyze_resume(resume_text_input):      #main resume ananlysis fucnction
+def analyze_resume(resume_text_input, job_description=None, filename="resume"):      #main resume analysis function (CLI); same registry-driven path as /ats-checker
     if not resume_text_input or not resume_text_input.strip():
         return {"error": "No resume text provided"}
-    
-    print("Analyzing for buzzwords...")
-    buzzwords = [
-        "machine learning", "deep learning", "artificial intelligence", "data science",
-        "big data", "cloud computing", "aws", "azure", "gcp", "devops", "agile", "scrum",
-        "python", "r", "sql", "nosql", "docker", "kubernetes", "ci/cd", "nlp",
-        "computer vision", "predictive modeling", "statistical analysis", "data mining",
-        "business intelligence", "ETL", "API", "microservices", "containerization",
-        "javascript", "react", "angular", "vue", "node.js", "backend", "frontend",
-        "full-stack", "cybersecurity", "blockchain", "iot", "data engineering",
-        "data visualization", "tableau", "power bi", "spark", "hadoop", "kafka",
-        "tensorflow", "pytorch", "scikit-learn", "statistical modeling",
-        "natural language processing", "reinforcement learning", "supervised learning",
-        "unsupervised learning", "feature engineering", "model deployment", "scalable",
-        "robust", "efficient", "optimize", "automate", "innovative", "strategic",
-        "leadership", "communication", "collaboration", "problem-solving",
-        "critical thinking", "quantitative", "qualitative", "analytical",
-        "customer-facing", "cross-functional", "stakeholders", "ROI", "KPIs",
-        "A/B testing", "workflow", "pipeline", "architecture", "design patterns",
-        "best practices", "documentation", "testing", "debugging", "performance tuning",
-        "scalability", "reliability", "security", "compliance", "governance",
-        "mentoring", "training", "presentation", "reporting", "dashboarding",
-        "monitoring", "alerting", "logging", "troubleshooting", "optimization",
-        "automation", "innovation", "strategy", "execution", "delivery", "roadmap",
-        "vision", "mission", "values", "culture", "team player", "independent",
-        "proactive", "results-oriented", "detail-oriented", "organized", "flexible",
-        "adaptable", "resourceful", "creative", "passionate", "driven", "motivated",
-        "enthusiastic", "committed", "dedicated", "reliable", "responsible",
-        "ethical", "professional", "positive attitude", "strong work ethic",
-        "time management", "prioritization", "multitasking", "negotiation",
-        "persuasion", "influence", "mentorship", "coaching", "feedback",
-        "performance", "evaluation", "recruitment", "hiring", "onboarding",
-        "retention", "engagement", "satisfaction", "loyalty", "advocacy",
-        "brand", "marketing", "sales", "finance", "accounting", "legal",
-        "HR", "operations", "supply chain", "logistics", "procurement",
-        "inventory", "warehousing", "transportation", "customer service",
-        "user experience", "ui/ux", "product management", "project management",
-        "program management", "portfolio management", "risk management",
-        "quality assurance", "testing", "automation testing", "manual testing",
-        "performance testing", "security testing", "usability testing",
-        "accessibility testing", "compliance testing", "governance testing",
-        "audit", "compliance", "regulation", "policy", "standard", "framework",
-        "methodology", "process", "workflow", "procedure", "guideline",
-        "best practice", "lessons learned", "post-mortem", "retrospective",
-        "stand-up", "sprint", "epic", "user story", "task", "bug", "feature",
-        "release", "version control", "git", "github", "gitlab", "bitbucket",
-        "jira", "confluence", "slack", "microsoft teams", "google workspace",
-        "office 365", "salesforce", "servicenow", "zendesk", "hubspot",
-        "marketo", "pardot", "salesloft", "outreach", "zoominfo",
-        "linkedin sales navigator", "crunchbase", "clearbit", "zoom",
-        "google meet", "microsoft teams", "webex", "skype", "slack",
-        "jira", "confluence", "trello", "asana", "monday.com",
-        "smartsheet", "microsoft project", "primavera", "servicenow",
-        "zendesk",
-    ]
-
-    resume_text_lower = str(resume_text_input).lower()
-    buzzword_count = 0
-    for buzzword in buzzwords:
-        if buzzword in resume_text_lower:
-            buzzword_count += 1
-    print(f"Identified {buzzword_count} buzzwords.")
-
-    print("\nAnalyzing for quantifiable impact...")
-    refined_quantifiable_patterns = [
-        r'(?:increased|reduced|improved|decreased|boosted|cut|grew)\s+.*?by\s+([\d,\.]+\s*%?)',
-        r'(?:managed|led|oversaw)\s+(?:a\s+team\s+of|[\d,\.]+\s+projects?)',
-        r'(?:saved)\s+([\$\€\£]?[\d,\.]+)',
-        r'(?:achieved|delivered)\s+(?:a\s+)?([\d,\.]+%?)\s+.*?',
-        r'(?:handled|processed)\s+([\d,\.]+)\s+(?:data\s+records?|transactions?)',
-        r'(?:developed|implemented)\s+.*?for\s+([\d,\.]+)\s+users?',
-        r'(?:optimized|streamlined)\s+.*?resulting\s+in\s+([\d,\.]+%?)\s+reduction',
-        r'(?:optimized|streamlined)\s+.*?leading\s+to\s+([\d,\.]+%?)\s+improvement',
-        r'([\d,\.]+%?)\s+(?:increase|reduction|improvement|gain|growth)',
-        r'(?:handled|processed|managed|completed)\s+([\d,\.]+)\s+.*?(?:tasks|projects|clients|transactions|users)',
-        r'(?:generated)\s+([\$\€\£]?[\d,\.]+)\s+(?:in\s+revenue|sales)',
-        r'(?:served)\s+([\d,\.]+)\s+clients?',
-        r'(?:grew)\s+.*?by\s+([\d,\.]+\s*%)',
-        r'(?:decreased)\s+.*?by\s+([\d,\.]+\s*%)',
-        r'(?:cut)\s+costs?\s+by\s+([\d,\.]+\s*%)',
-        r'(?:boosted)\s+.*?by\s+([\d,\.]+\s*%)',
-        r'(?:reduced)\s+[\w\s]+by\s+([\d,\.]+%?)\s+\w+'
-    ]
-
-    quantifiable_achievements_refined = []
-    for pattern in refined_quantifiable_patterns:
-        matches = re.findall(pattern, resume_text_lower)
-        if matches:
-            for match in matches:
-                if isinstance(match, tuple):
-                    quantifiable_achievements_refined.extend([item for item in match if item])
-                else:
-                    quantifiable_achievements_refined.append(match)
-
-    quantifiable_count = len(quantifiable_achievements_refined)
-    print(f"Identified {quantifiable_count} quantifiable achievements.")
-
-    print("\nAnalyzing date formats...")
-    date_patterns = [
-        r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\b',
-        r'\b\d{1,2}/\d{4}\b',
-        r'\b\d{4}-\d{2}-\d{2}\b',
-        r'\b\d{4}\b',
-        r'\bPresent\b|\bTo Date\b|\bCurrent\b',
-        r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*-\s*(?:Present|To Date|Current|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}|\b\d{1,2}/\d{4}|\b\d{4}-\d{2}-\d{2}|\b\d{4})\b',
-        r'\b\d{1,2}/\d{4}\s*-\s*(?:Present|To Date|Current|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}|\b\d{1,2}/\d{4}|\b\d{4}-\d{2}-\d{2}|\b\d{4})\b',
-        r'\b\d{4}\s*-\s*(?:Present|To Date|Current|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}|\b\d{1,2}/\d{4}|\b\d{4}-\d{2}-\d{2}|\b\d{4})\b'
-    ]
-
-    identified_dates = []
-    for pattern in date_patterns:
-        matches = re.findall(pattern, resume_text_lower, re.IGNORECASE)
-        if matches:
-            for match in matches:
-                if isinstance(match, tuple):
-                    identified_dates.extend([item for item in match if item])
-                else:
-                    identified_dates.append(match)
-
-    # TODO: Implement actual date consistency checking
-    date_consistency = False 
-    print(f"Identified date strings: {identified_dates}")
-    print(f"Date format consistency assessed as: {date_consistency}")
-
-    print("\nAnalyzing for repetitions...")
-    words = re.findall(r'\b\w+\b', str(resume_text_input).lower())
-    word_counts = Counter(words)
-
-    repetition_penalty = 0
-    ignore_words = list(stop_words) + ['com', 'https', 'www', 'ayushpandey003', 'github', 'linkedin', 'leetcode', 'project', 'skill', 'experi', 'develop', 'system']
-
-    high_frequency_words = [word for word, count in word_counts.most_common(50) if count > 10 and word not in ignore_words]
-
-    if high_frequency_words:
-        repetition_penalty = len(high_frequency_words) * 5 
-        print(f"Potential excessive repetition of words detected: {high_frequency_words}")
-    else:
-        print("Excessive repetition does not appear to be a major issue based on common words.")
 
-    print(f"Repetition penalty applied: {repetition_penalty}")
-
-    print("\nAnalyzing for technical quality words from ESCO...")
-    unique_technical_terms_count = 0 
-
-    try:
-        with zipfile.ZipFile(esco_zip_path, 'r') as zip_ref:
-            if target_csv_name in zip_ref.namelist():
-                zip_ref.extract(target_csv_name, path='/tmp/')
-                print(f"Successfully extracted {target_csv_name} from the zip.")
-            else:
-                print(f"Error: '{target_csv_name}' not found in the zip archive.")
-                extracted_csv_path = None
-
-        if extracted_csv_path and os.path.exists(extracted_csv_path):
-            esco_skills_df = pd.read_csv(extracted_csv_path)
-            print("Successfully loaded ESCO dataset.")
-
-            os.remove(extracted_csv_path)
-            print(f"Cleaned up temporary file: {extracted_csv_path}")
-
-            required_cols = ['preferredLabel', 'altLabels', 'description']
-            if all(col in esco_skills_df.columns for col in required_cols):
-                esco_terms = []
-                for index, row in esco_skills_df.iterrows():
-                    if pd.notna(row['preferredLabel']) and isinstance(row['preferredLabel'], str):
-                        esco_terms.append(row['preferredLabel'])
-                    if pd.notna(row['altLabels']) and isinstance(row['altLabels'], str):
-                        alt_labels = [label.strip() for label in row['altLabels'].split(',') if label.strip()]
-                        esco_terms.extend(alt_labels)
-                    if pd.notna(row['description']) and isinstance(row['description'], str):
-                        esco_terms.append(row['description'])
-
-                esco_terms = list(set([str(term) for term in esco_terms if term]))
-                cleaned_esco_terms = [clean_text(term) for term in esco_terms]
-                cleaned_esco_terms = [term for term in cleaned_esco_terms if term]
-
-                nlp_esco_matcher = spacy.blank("en")
-                esco_matcher = PhraseMatcher(nlp_esco_matcher.vocab)
-                esco_term_docs = list(nlp_esco_matcher.pipe(cleaned_esco_terms, disable=["parser", "ner"]))
-                esco_patterns = [nlp_esco_matcher.make_doc(doc.text) for doc in esco_term_docs]
-                esco_matcher.add("TECHNICAL_TERMS", esco_patterns)
-
-                cleaned_resume_text_esco = clean_text(resume_text_input)
-                if cleaned_resume_text_esco:
-                    resume_doc_esco = nlp_esco_matcher(cleaned_resume_text_esco)
-                    esco_matches = esco_matcher(resume_doc_esco)
-                    identified_technical_terms = [resume_doc_esco[start:end].text for match_id, start, end in esco_matches]
-                    unique_technical_terms_count = len(set(identified_technical_terms))
-                    print(f"Identified {unique_technical_terms_count} unique technical quality words.")
-                else:
-                     print("Cleaned resume text is empty, cannot extract technical terms.")
-            else:
-                 print("Error: Required columns not found in ESCO dataset.")
-        else:
-            print("Failed to extract or find the target CSV in the zip.")
-
-    except FileNotFoundError:
-        print(f"Error: ESCO zip file not found at {esco_zip_path}")
-    except Exception as e:
-        print(f"An error occurred during ESCO processing: {e}")
-
-    print("\nAnalyzing resume structure (sections)...")
-    section_titles = [
-        "summary", "objective", "education", "experience", "work experience",
-        "professional experience", "skills", "technical skills", "projects",
-        "portfolio", "awards", "honors", "publications", "presentations",
-        "licenses", "certifications", "volunteering", "interests", "contact",
-        "contact information"
-    ]
-    identified_sections_count = 0
-    for title in section_titles:
-        if re.search(r'\b' + re.escape(title) + r'\b', resume_text_lower):
-            identified_sections_count += 1
-    print(f"Estimated number of sections: {identified_sections_count}")
-
-    def calculate_comprehensive_resume_score(
-        buzzword_count,
-        quantifiable_count,
-        date_consistency,
-        repetition_penalty,
-        unique_technical_terms_count,
-        sections_count
-    ):
-        buzzword_points = buzzword_count * 0.5
-        quantifiable_points = quantifiable_count * 10
-        date_consistency_points = 30 if date_consistency else -10
-        technical_terms_points = unique_technical_terms_count * 2
-        sections_points = sections_count * 5
-
-        total_score = (
-            buzzword_points +
-            quantifiable_points +
-            date_consistency_points +
-            technical_terms_points +
-            sections_points -
-            repetition_penalty
-        )
-        return max(0, int(total_score))
-
-    comprehensive_resume_score = calculate_comprehensive_resume_score(
-        buzzword_count,
-        quantifiable_count,
-        date_consistency,
-        repetition_penalty,
-        unique_technical_terms_count,
-        identified_sections_count
-    )
-
-    #feedback generation
-    results = {
-        "score": comprehensive_resume_score,
-        "buzzword_count": buzzword_count,
-        "quantifiable_count": quantifiable_count,
-        "date_consistency": date_consistency,
-        "repetition_penalty": repetition_penalty,
-        "unique_technical_terms_count": unique_technical_terms_count,
-        "sections_count": identified_sections_count,
-        "identified_dates": identified_dates
-    }
-    
-    return results
+    from ats.analyzer import DEFAULT_JOB_DESCRIPTION, get_analyzer
+    return get_analyzer().analyze(resume_text_input, job_description or DEFAULT_JOB_DESCRIPTION, filename)
 
 if __name__ == "__main__":
+    setup_nltk(download=True)
     resume_text = extract_text_from_resume_pdf(resume_file_path)
 
     if not resume_text or not resume_text.strip():
         print(f"Could not extract text from {resume_file_path}. Exiting.")
         exit() 
 
-    results = analyze_resume(resume_text)
+    results = analyze_resume(resume_text, filename=os.path.basename(resume_file_path))
     
     if "error" in results:
         print(results["error"])
         exit()
 
     print("\n--- Resume Quality Analysis Results ---")
-    print(f"Comprehensive Resume Quality Score: {results['score']}")
+    print(f"Comprehensive Resume Quality Score: {results['overall_score']}")
+    print(results["overall_assessment"])
 
     print("\nDetailed Feedback:")
-
-    print("\nDate Format Consistency:")
-    if results['date_consistency']:
-        print("Date formats appear consistent.")
-    else:
-        print("Inconsistent date formats found. Suggestion: Use a single, standard format (e.g., 'Month YYYY - Month YYYY').")
-
-    quantifiable_threshold = 5
-    print("\nQuantifiable Achievements:")
-    print(f"Identified {results['quantifiable_count']} quantifiable achievements.")
-    if results['quantifiable_count'] < quantifiable_threshold:
-        print(f"Suggestion: Add more quantifiable achievements using numbers and metrics.")
-    else:
-        print("Good job including quantifiable achievements.")
-
-    buzzword_threshold = 20
-    print("\nIndustry Keywords (Buzzwords):")
-    print(f"Identified {results['buzzword_count']} industry-specific keywords.")
-    if results['buzzword_count'] < buzzword_threshold:
-        print(f"Suggestion: Incorporate more relevant industry-specific keywords.")
-    else:
-        print("Your resume includes a good number of relevant industry keywords.")
-
-    print("\nRepetition:")
-    if results['repetition_penalty'] > 0:
-         print(f"Some potential word or phrase repetition noted (penalty applied: {results['repetition_penalty']}). Suggestion: Review for varied language.")
-    else:
-         print("Excessive repetition does not appear to be a significant issue.")
-
-    technical_terms_threshold = 15
-    print("\nTechnical Quality Words (from ESCO):")
-    print(f"Identified {results['unique_technical_terms_count']} unique technical quality words.")
-    if results['unique_technical_terms_count'] < technical_terms_threshold:
-        print(f"Suggestion: Include more specific technical skills and knowledge relevant to your target roles.")
-    else:
-        print("Your resume includes a good range of relevant technical quality words.")
-
-    sections_threshold = 4
-    print("\nResume Structure (Sections):")
-    print(f"Estimated number of sections: {results['sections_count']}.")
-    if results['sections_count'] < sections_threshold:
-        print("Suggestion: Organize your resume into standard sections.")
-    else:
-        print("Your resume appears to have a good structural organization.")
+    for category, data in results["categories"].items():
+        print(f"\n{category}: {data['score']}")
+        print(data["details"])
+        print(f"Suggestion: {data['suggestions']}")
 
     print("\n--- Key Areas for Improvement ---")
-    improvement_suggestions = []
-    if not results['date_consistency']:
-        improvement_suggestions.append("Ensure consistent date formats throughout.")
-    if results['quantifiable_count'] < quantifiable_threshold:
-        improvement_suggestions.append("Add more quantifiable achievements with metrics.")
-    if results['repetition_penalty'] > 0:
-        improvement_suggestions.append("Review for and reduce word/phrase repetitions.")
-    if results['unique_technical_terms_count'] < technical_terms_threshold:
-        improvement_suggestions.append("Include more specific technical skills and knowledge.")
-    if results['sections_count'] < sections_threshold:
-        improvement_suggestions.append("Improve resume structure by adding standard sections.")
-
-    if improvement_suggestions:
-        for suggestion in improvement_suggestions:
-            print(f"- {suggestion}")
+    if results["recommendations"]:
+        for recommendation in results["recommendations"]:
+            print(f"- [{recommendation['priority']}] {recommendation['category']}: {recommendation['suggestion']}")
     else:
-        print("Based on the analysis, your resume is well-structured and contains relevant content. Continue to tailor it for specific job applications.")
\ No newline at end of file
+        print("Based on the analysis, your resume is well-structured and contains relevant content. Continue to tailor it for specific job applications.")
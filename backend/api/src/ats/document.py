@@ -0,0 +1,109 @@
+"""
+Per-request resume document shared by all ATS analyzers.
+
+Every analyzer used to lowercase, tokenize and (for ESCO and JD matching)
+stem the same resume text on its own. ``ResumeDocument`` computes each view
+once, lazily, the first time an analyzer asks for it.
+"""
+import re
+from collections import Counter
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Set, Tuple, Union
+
+from ats.ats import clean_text
+
+WORD_RE = re.compile(r'\b\w+\b')
+SENTENCE_END_RE = re.compile(r'[.!?]+(?=\s)|\n')
+
+
+class ResumeDocument:
+    """Resume text with cached normalized views"""
+
+    def __init__(self, text: Any):
+        self.text = text if isinstance(text, str) else str(text or "")
+        self._memo: Dict[str, Any] = {}
+
+    @classmethod
+    def coerce(cls, value: Union["ResumeDocument", Any]) -> "ResumeDocument":
+        """Return ``value`` if it already is a document, else wrap it"""
+        return value if isinstance(value, cls) else cls(value)
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Lowercased ``\\w+`` tokens"""
+        return WORD_RE.findall(self.lower)
+
+    @cached_property
+    def token_counts(self) -> Counter:
+        return Counter(self.tokens)
+
+    @cached_property
+    def cleaned(self) -> str:
+        """``clean_text`` output: punctuation and stopwords removed, stemmed"""
+        return clean_text(self.text)
+
+    @cached_property
+    def stemmed_tokens(self) -> List[str]:
+        return self.cleaned.split()
+
+    @cached_property
+    def line_spans(self) -> List[Tuple[int, int]]:
+        """(start, end) character offsets of every line"""
+        spans = []
+        start = 0
+        for match in re.finditer(r'\n', self.text):
+            spans.append((start, match.start()))
+            start = match.end()
+        spans.append((start, len(self.text)))
+        return spans
+
+    @cached_property
+    def sentence_spans(self) -> List[Tuple[int, int]]:
+        """(start, end) character offsets of sentences; line breaks also end a sentence"""
+        text = self.text
+        spans = []
+        start = 0
+        for end in [m.end() for m in SENTENCE_END_RE.finditer(text)] + [len(text)]:
+            while start < end and text[start].isspace():
+                start += 1
+            stop = end
+            while stop > start and text[stop - 1].isspace():
+                stop -= 1
+            if stop > start:
+                spans.append((start, stop))
+            start = end
+        return spans
+
+    def lines(self) -> List[str]:
+        return [self.lower[start:end] for start, end in self.line_spans]
+
+    def sentences(self) -> List[str]:
+        return [self.lower[start:end] for start, end in self.sentence_spans]
+
+    def ngrams(self, n: int) -> Set[Tuple[str, ...]]:
+        """Set of token n-grams, cached per n"""
+        return self.memo(f"ngrams:{n}", lambda: {
+            tuple(self.tokens[i:i + n]) for i in range(len(self.tokens) - n + 1)
+        })
+
+    def contains_phrase(self, phrase: str) -> bool:
+        """Whole-word phrase lookup against the token stream"""
+        words = tuple(WORD_RE.findall(phrase.lower()))
+        if not words:
+            return False
+        if len(words) == 1:
+            return words[0] in self.token_counts
+        return words in self.ngrams(len(words))
+
+    def memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Cache an arbitrary derived value on the document (e.g. matcher hits)"""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
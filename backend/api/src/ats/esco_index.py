@@ -0,0 +1,333 @@
+"""
+Prebuilt ESCO skill index.
+
+The ESCO classification ships as a zip of CSV files. Reading it, cleaning every
+label and building a matcher is far too slow to do per request, so this module
+compiles ``skills_en.csv`` into a versioned index directory once and loads it
+at startup:
+
+    meta.json       format version, source fingerprint, counts and the
+                    buzzword list compiled into the automaton
+    terms.bin       string table of (cleaned term, original label) pairs
+    vocab.bin       string table of automaton tokens (token id = position)
+    automaton.bin   compiled Aho-Corasick arrays over every ESCO preferred and
+                    alternative label plus the buzzwords (see ``ats.term_matcher``)
+    stems.tsv       precomputed stems of every word in the labels and buzzwords,
+                    pinned into the stem cache at startup (see ``ats.stemming``)
+
+All ``.bin`` files are memory-mapped by the loader, so the full taxonomy costs
+little more than the vocabulary dict in Python heap.
+
+Build it ahead of time with::
+
+    python -m ats.esco_index --zip "<ESCO zip>" --out <index dir>
+"""
+import argparse
+import csv
+import io
+import json
+import mmap
+import os
+import re
+import shutil
+import sys
+import tempfile
+import zipfile
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ats.ats import buzzwords as default_buzzwords, clean_text, stem_cache, stop_words
+from ats.term_matcher import CompiledAutomaton, compile_phrases
+
+FORMAT_VERSION = 3
+MAGIC = b"DRZESCO1"
+ARRAYS_MAGIC = b"DRZAUTO1"
+SKILLS_CSV_NAME = "skills_en.csv"
+
+META_FILE = "meta.json"
+TERMS_FILE = "terms.bin"
+VOCAB_FILE = "vocab.bin"
+AUTOMATON_FILE = "automaton.bin"
+STEMS_FILE = "stems.tsv"
+ARRAY_NAME_SIZE = 16
+
+
+def source_fingerprint(zip_path: str) -> str:
+    """Cheap fingerprint of the source zip (name, size, mtime) used to detect stale indexes."""
+    st = os.stat(zip_path)
+    return f"{os.path.basename(zip_path)}:{st.st_size}:{int(st.st_mtime)}"
+
+
+def read_esco_labels(zip_path: str) -> List[str]:
+    """Read preferred and alternative skill labels straight out of the ESCO zip."""
+    labels: List[str] = []
+    csv.field_size_limit(sys.maxsize)
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        if SKILLS_CSV_NAME not in zip_ref.namelist():
+            raise FileNotFoundError(f"'{SKILLS_CSV_NAME}' not found in {zip_path}")
+        with zip_ref.open(SKILLS_CSV_NAME) as raw:
+            reader = csv.DictReader(io.TextIOWrapper(raw, encoding="utf-8", newline=""))
+            required_cols = ["preferredLabel", "altLabels", "description"]
+            if not all(col in (reader.fieldnames or []) for col in required_cols):
+                raise ValueError("Required columns not found in ESCO dataset")
+            for row in reader:
+                preferred = row.get("preferredLabel")
+                if preferred:
+                    labels.append(preferred)
+                alt = row.get("altLabels")
+                if alt:     # ESCO separates alternative labels with newlines
+                    labels.extend(label.strip() for label in re.split(r"[\n,]", alt) if label.strip())
+    return labels
+
+
+def _write_string_table(path: str, strings: Sequence[str]) -> None:
+    offsets = array("I", [0])
+    blob = bytearray()
+    for value in strings:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+    with open(path, "wb") as fh:
+        fh.write(MAGIC)
+        fh.write(array("I", [len(strings)]).tobytes())
+        fh.write(offsets.tobytes())
+        fh.write(blob)
+
+
+def _write_arrays(path: str, arrays: Dict[str, array]) -> None:
+    with open(path, "wb") as fh:
+        fh.write(ARRAYS_MAGIC)
+        fh.write(array("I", [len(arrays)]).tobytes())
+        for name, values in arrays.items():
+            fh.write(name.encode("ascii").ljust(ARRAY_NAME_SIZE, b"\0"))
+            fh.write(array("I", [len(values)]).tobytes())
+        for values in arrays.values():
+            fh.write(values.tobytes())
+
+
+def _mmap_file(path: str) -> mmap.mmap:
+    with open(path, "rb") as fh:
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _map_arrays(path: str) -> Dict[str, memoryview]:
+    mm = _mmap_file(path)
+    if mm[:len(ARRAYS_MAGIC)] != ARRAYS_MAGIC:
+        raise ValueError(f"{path} is not an automaton array file")
+    view = memoryview(mm)
+    pos = len(ARRAYS_MAGIC)
+    count = view[pos:pos + 4].cast("I")[0]
+    pos += 4
+    header = []
+    for _ in range(count):
+        name = bytes(view[pos:pos + ARRAY_NAME_SIZE]).rstrip(b"\0").decode("ascii")
+        length = view[pos + ARRAY_NAME_SIZE:pos + ARRAY_NAME_SIZE + 4].cast("I")[0]
+        header.append((name, length))
+        pos += ARRAY_NAME_SIZE + 4
+    arrays = {}
+    for name, length in header:
+        arrays[name] = view[pos:pos + 4 * length].cast("I")
+        pos += 4 * length
+    return arrays
+
+
+class _StringTable:
+    """Memory-mapped string table written by ``_write_string_table``"""
+
+    def __init__(self, path: str):
+        self._mm = _mmap_file(path)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not an ESCO index string table")
+        view = memoryview(self._mm)
+        pos = len(MAGIC)
+        self._count = view[pos:pos + 4].cast("I")[0]
+        pos += 4
+        self._offsets = view[pos:pos + 4 * (self._count + 1)].cast("I")
+        self._blob_start = pos + 4 * (self._count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> str:
+        start = self._blob_start + self._offsets[i]
+        end = self._blob_start + self._offsets[i + 1]
+        return self._mm[start:end].decode("utf-8")
+
+
+def build_esco_index(zip_path: str, out_dir: str, buzzwords: Optional[Sequence[str]] = None) -> str:
+    """
+    Compile the ESCO skills CSV into an index directory.
+
+    The index is written to a temporary sibling directory and swapped into place
+    (the previous index is renamed aside, not deleted first), so concurrent
+    builders and readers never observe a half-written or missing index beyond
+    the instant between the two renames. If the swap fails the previous index
+    is renamed back; if writing fails it is never touched.
+
+    Args:
+        zip_path: Path to the ESCO classification zip
+        out_dir: Directory the index should end up in
+        buzzwords: Buzzwords compiled into the automaton (defaults to ``ats.ats.buzzwords``)
+
+    Returns:
+        Path of the index directory
+    """
+    pairs: List[Tuple[str, str]] = []
+    seen = set()
+    label_words = set()
+    for label in read_esco_labels(zip_path):
+        label_words.update(word for word in re.sub(r'[^\w\s]', '', label.lower()).split() if word not in stop_words)
+        cleaned = clean_text(label)
+        if cleaned and cleaned not in seen:
+            seen.add(cleaned)
+            pairs.append((cleaned, label))
+
+    buzzwords = list(default_buzzwords if buzzwords is None else buzzwords)
+    for buzzword in buzzwords:
+        label_words.update(word for word in re.sub(r'[^\w\s]', '', buzzword.lower()).split() if word not in stop_words)
+    phrases = [cleaned.split() for cleaned, _ in pairs]
+    phrases.extend(clean_text(buzzword).split() for buzzword in buzzwords)
+    arrays, vocab, phrase_lengths = compile_phrases(phrases)
+    arrays["phrase_len"] = phrase_lengths
+
+    parent = os.path.dirname(os.path.abspath(out_dir)) or "."
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=".esco_index-", dir=parent)
+    old_dir = None
+    try:
+        _write_string_table(os.path.join(tmp_dir, TERMS_FILE), [value for pair in pairs for value in pair])
+        _write_string_table(os.path.join(tmp_dir, VOCAB_FILE), vocab)
+        _write_arrays(os.path.join(tmp_dir, AUTOMATON_FILE), arrays)
+        stem_cache.save_table(os.path.join(tmp_dir, STEMS_FILE), label_words)
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "source": source_fingerprint(zip_path),
+            "term_count": len(pairs),
+            "vocab_size": len(vocab),
+            "node_count": len(arrays["fail"]),
+            "buzzwords": buzzwords,
+            "byteorder": sys.byteorder,
+        }
+        with open(os.path.join(tmp_dir, META_FILE), "w", encoding="utf-8") as fh:
+            json.dump(meta, fh, indent=2)
+
+        # a directory can't be renamed over a non-empty one: move the old index aside
+        # first (never delete it in place), so out_dir is only missing between two renames
+        if os.path.isdir(out_dir):
+            old_dir = tmp_dir + ".old"
+            try:
+                os.rename(out_dir, old_dir)
+            except OSError:
+                old_dir = None      # another builder already moved it
+        try:
+            os.replace(tmp_dir, out_dir)
+        except OSError:
+            if os.path.isdir(out_dir):
+                pass        # another process won the race; its index is just as good
+            else:
+                if old_dir:
+                    os.rename(old_dir, out_dir)     # put the previous index back rather than leave none
+                    old_dir = None
+                raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if old_dir:
+            # readers that already mapped the old files keep them until they unmap
+            shutil.rmtree(old_dir, ignore_errors=True)
+    return out_dir
+
+
+def read_index_meta(index_dir: str) -> Optional[Dict]:
+    """``meta.json`` of the index at ``index_dir`` without mapping its files (None if missing or unreadable)"""
+    try:
+        with open(os.path.join(index_dir, META_FILE), "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+class EscoIndex:
+    """Read-only view over a built ESCO index"""
+
+    def __init__(self, index_dir: str):
+        self.index_dir = index_dir
+        with open(os.path.join(index_dir, META_FILE), "r", encoding="utf-8") as fh:
+            self.meta = json.load(fh)
+        if self.meta.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported ESCO index version: {self.meta.get('format_version')}")
+        if self.meta.get("byteorder") != sys.byteorder:
+            raise ValueError("ESCO index was built on a machine with different byte order")
+
+        self._terms = _StringTable(os.path.join(index_dir, TERMS_FILE))
+        self._count = len(self._terms) // 2
+        self.buzzwords: List[str] = list(self.meta.get("buzzwords", []))
+
+        vocab_table = _StringTable(os.path.join(index_dir, VOCAB_FILE))
+        vocab = {vocab_table[i]: i for i in range(len(vocab_table))}
+        arrays = _map_arrays(os.path.join(index_dir, AUTOMATON_FILE))
+        self.automaton = CompiledAutomaton(arrays, vocab, arrays["phrase_len"])
+        stems_path = os.path.join(index_dir, STEMS_FILE)
+        self.stems_path = stems_path if os.path.isfile(stems_path) else None
+
+    @classmethod
+    def load(cls, index_dir: str) -> "EscoIndex":
+        return cls(index_dir)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def term(self, i: int) -> str:
+        """Cleaned (stemmed, stopword-free) form of the i-th term"""
+        return self._terms[2 * i]
+
+    def label(self, i: int) -> str:
+        """Original ESCO label of the i-th term"""
+        return self._terms[2 * i + 1]
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        for i in range(self._count):
+            yield self.term(i), self.label(i)
+
+
+def load_or_build_esco_index(zip_path: str, index_dir: str, buzzwords: Optional[Sequence[str]] = None,
+                             build: bool = True) -> Optional[EscoIndex]:
+    """
+    Load the index at ``index_dir``, building it from ``zip_path`` first if it is
+    missing or was built from a different zip or buzzword list. Returns None if
+    neither exists. With ``build=False`` (ATS worker processes, whose parent has
+    already built or verified it) whatever index is there is loaded as-is.
+    """
+    buzzwords = list(default_buzzwords if buzzwords is None else buzzwords)
+    if os.path.isfile(os.path.join(index_dir, META_FILE)):
+        try:
+            index = EscoIndex.load(index_dir)
+            if not build or not os.path.exists(zip_path):
+                return index
+            if index.meta.get("source") == source_fingerprint(zip_path) and index.buzzwords == buzzwords:
+                return index
+            print(f"ESCO index at {index_dir} is stale, rebuilding")
+        except Exception as e:
+            print(f"Could not load ESCO index from {index_dir}: {e}")
+
+    if not build or not os.path.exists(zip_path):
+        return None
+
+    print(f"Building ESCO index from {zip_path} into {index_dir}")
+    build_esco_index(zip_path, index_dir, buzzwords)
+    return EscoIndex.load(index_dir)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the ESCO skill index used by the ATS checker")
+    parser.add_argument("--zip", required=True, help="path to the ESCO classification csv zip")
+    parser.add_argument("--out", required=True, help="directory to write the index to")
+    args = parser.parse_args(argv)
+
+    build_esco_index(args.zip, args.out)
+    index = EscoIndex.load(args.out)
+    print(f"Built ESCO index with {len(index)} terms, {index.meta['vocab_size']} tokens "
+          f"and {index.meta['node_count']} automaton states at {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Runs CPU-bound ATS analysis off the event loop.
+
+``ats_checker`` used to call every analyzer inline in the async handler, so
+one large resume blocked all other requests on the worker. ``ATSExecutor``
+dispatches picklable jobs (``ats.analyzer.analyze_resume`` and friends) to a
+process pool whose workers each build and warm one ``ATSAnalyzer`` when they
+start, and bounds how many jobs may be running or queued. The ESCO index is
+built (or checked against its zip) once, in this process, before the pool
+starts; workers only load it, so a cold start never has several processes
+building it at once. The API process itself never builds an analyzer.
+
+A request that submits several jobs in sequence (``/ats-checker/stream`` runs
+the analyzer steps one by one so each result can be flushed) takes one slot
+from the same queue limit with ``reserve`` and sends its jobs with ``submit``.
+After ``shutdown`` every job fails with ``ExecutorStoppedError``.
+
+Configuration (environment):
+
+    ATS_WORKERS                 pool size; 0 runs jobs in a thread in-process (default: min(4, cpus))
+    ATS_QUEUE_LIMIT             max jobs running + waiting before new ones are rejected (default: 4 x workers)
+    ATS_WORKER_START_METHOD     multiprocessing start method (default: forkserver where available)
+"""
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+
+class ExecutorBusyError(RuntimeError):
+    """Raised when the job queue is full; callers should answer 503"""
+
+
+class ExecutorStoppedError(RuntimeError):
+    """Raised for jobs submitted after (or while) the executor shuts down; callers should answer 503"""
+
+
+def _init_worker() -> None:
+    from ats.analyzer import get_analyzer
+
+    analyzer = get_analyzer(build_esco_index=False)
+    try:
+        analyzer.warm_up()
+    except Exception as e:
+        print(f"ATS worker {os.getpid()} warm-up failed: {e}")
+    print(f"ATS worker {os.getpid()} ready")
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class ATSExecutor:
+    """Bounded process pool (or thread fallback) for analyzer jobs"""
+
+    def __init__(self, workers: Optional[int] = None, queue_limit: Optional[int] = None,
+                 start_method: Optional[str] = None):
+        if workers is None:
+            workers = int(os.getenv("ATS_WORKERS", str(min(4, os.cpu_count() or 1))))
+        self.workers = max(0, workers)
+        if queue_limit is None:
+            queue_limit = int(os.getenv("ATS_QUEUE_LIMIT", str(4 * max(1, self.workers))))
+        self.queue_limit = max(1, queue_limit)
+        if start_method is None:
+            start_method = os.getenv("ATS_WORKER_START_METHOD") or (
+                "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+        self.start_method = start_method
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._pending = 0
+        self._stopped = False
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        """Create the pool and start every worker now (each loads and warms its analyzer)"""
+        with self._start_lock:
+            if self.workers == 0 or self._pool is not None or self._stopped:
+                return
+            from ats.analyzer import prepare_esco_index
+
+            prepare_esco_index()        #builds or verifies the ESCO index here, once, before any worker loads it
+            self._start_pool()
+
+    def _start_pool(self) -> None:
+        context = multiprocessing.get_context(self.start_method)
+        if self.start_method == "forkserver":
+            # imported once in the fork server, so workers fork with sklearn/nltk/etc. already loaded
+            context.set_forkserver_preload(["ats.analyzer"])
+        pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context, initializer=_init_worker)
+        pids = {future.result() for future in [pool.submit(_ping) for _ in range(self.workers)]}
+        with self._lock:
+            self._pool = pool
+        print(f"Started {len(pids)} ATS worker process(es) ({self.start_method}), queue limit {self.queue_limit}")
+
+    def shutdown(self) -> None:
+        """Stop the workers for good; queued and later jobs raise ``ExecutorStoppedError``"""
+        self._stopped = True
+        self._drop_pool()
+
+    def _drop_pool(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def full(self) -> bool:
+        return self._pending >= self.queue_limit
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self._pending >= self.queue_limit:
+                self.rejected += 1
+                raise ExecutorBusyError(f"ATS queue is full ({self.queue_limit} jobs)")
+            self._pending += 1
+
+    def _done(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    @contextlib.asynccontextmanager
+    async def reserve(self) -> AsyncIterator[None]:
+        """Hold one queue slot for a request that sends several jobs with ``submit``; ``ExecutorBusyError`` when full"""
+        self._admit()
+        try:
+            yield
+            self.completed += 1
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self._done()
+
+    async def _current_pool(self) -> ProcessPoolExecutor:
+        # read under the lock: shutdown() may clear it between any two awaits
+        with self._lock:
+            pool = self._pool
+        if pool is None and not self._stopped:
+            await asyncio.to_thread(self.start)
+            with self._lock:
+                pool = self._pool
+        if pool is None:
+            raise ExecutorStoppedError("ATS executor stopped")
+        return pool
+
+    async def submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` like ``run`` but without taking a queue slot; callers hold ``reserve``"""
+        if self._stopped:
+            raise ExecutorStoppedError("ATS executor stopped")
+        if self.workers == 0:
+            return await asyncio.to_thread(fn, *args)
+        pool, future = await self._current_pool(), None
+        try:
+            future = pool.submit(fn, *args)
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            # a worker died (e.g. OOM-killed); drop the pool so the next job starts a fresh one
+            self._drop_pool()
+            raise
+        except RuntimeError as e:
+            if future is not None:
+                raise
+            raise ExecutorStoppedError("ATS executor stopped") from e       #the pool was shut down after we took it
+        except asyncio.CancelledError:
+            if self._stopped and future.cancelled():        #shutdown cancels queued jobs
+                raise ExecutorStoppedError("ATS executor stopped") from None
+            raise
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` in the pool (a thread when ATS_WORKERS=0) without blocking the event loop"""
+        self._admit()
+        try:
+            result = await self.submit(fn, *args)
+            self.completed += 1
+            return result
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self._done()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": "process" if self.workers else "thread",
+            "stopped": self._stopped,
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "pending": self._pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,80 @@
+"""
+Cache of cleaned and vectorized job descriptions.
+
+Users check many resume variants against the same posting, and JD text is
+usually several times longer than the resume, so ``clean_text`` +
+``vectorizer.transform`` on the JD was about half the cost of every match.
+Entries are keyed by the SHA-256 of the JD text and the ``id`` of the
+vectorizer they were computed with, held in a bounded LRU, and the default JD
+is precomputed at startup. The cache holds no reference to a vectorizer: a
+weakref finalizer drops its entries when it is garbage collected, so a
+replaced vectorizer is freed and its id can never match stale vectors.
+"""
+import hashlib
+import os
+import threading
+import weakref
+from typing import Any, Callable, Dict, NamedTuple
+
+from ats.ats import clean_text
+from utils.cache import LRUCache
+
+DEFAULT_JD_CACHE_SIZE = int(os.getenv('JD_CACHE_SIZE', '256'))
+
+
+class JDEntry(NamedTuple):
+    cleaned: str
+    vector: Any         # 1 x vocabulary sparse row from vectorizer.transform
+
+
+def jd_hash(jd_text: str) -> str:
+    return hashlib.sha256(jd_text.encode('utf-8')).hexdigest()
+
+
+class JDCache:
+    """Bounded LRU of ``JDEntry`` per (vectorizer id, JD content hash)"""
+
+    def __init__(self, maxsize: int = DEFAULT_JD_CACHE_SIZE):
+        self._cache = LRUCache(maxsize=maxsize)
+        self._vectorizers: Dict[int, weakref.finalize] = {}
+        self._lock = threading.Lock()
+
+    def get(self, jd_text: str, vectorizer, clean: Callable[[str], str] = clean_text) -> JDEntry:
+        """Cleaned text and vector for ``jd_text``, computed on a miss.
+
+        The vectorizer's ``id`` is part of the key, so a reloaded vectorizer is
+        never served vectors of the old one. A vectorizer that cannot be weakly
+        referenced is not cached for. Errors from ``clean``/``transform``
+        propagate and nothing is cached.
+        """
+        try:
+            key = (self._track(vectorizer), jd_hash(jd_text))
+        except TypeError:
+            return self._compute(jd_text, vectorizer, clean)
+        return self._cache.get_or_set(key, lambda: self._compute(jd_text, vectorizer, clean))
+
+    def _track(self, vectorizer) -> int:
+        vectorizer_id = id(vectorizer)
+        with self._lock:
+            if vectorizer_id not in self._vectorizers:
+                self._vectorizers[vectorizer_id] = weakref.finalize(vectorizer, self._forget, vectorizer_id)
+        return vectorizer_id
+
+    def _forget(self, vectorizer_id: int) -> None:
+        with self._lock:
+            self._vectorizers.pop(vectorizer_id, None)
+        self._cache.pop_matching(lambda key: key[0] == vectorizer_id)
+
+    @staticmethod
+    def _compute(jd_text: str, vectorizer, clean: Callable[[str], str]) -> JDEntry:
+        cleaned = clean(jd_text)
+        return JDEntry(cleaned, vectorizer.transform([cleaned]))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+jd_cache = JDCache()
@@ -1,45 +1,53 @@
-import joblib
-import pandas as pd
-import re
-from nltk.corpus import stopwords
-from nltk.stem.porter import PorterStemmer
-from sklearn.metrics.pairwise import cosine_similarity
-import spacy 
-vectorizer_path = 'ats_tfidf_vectorizer/tfidf_vectorizer.pkl'
-
-
-try:
-    tfidf_vectorizer = joblib.load(vectorizer_path)
-    print(f"Successfully loaded TF-IDF vectorizer from {vectorizer_path}")
-except FileNotFoundError:
-    print(f"Error: TF-IDF vectorizer not found at {vectorizer_path}")
-    tfidf_vectorizer = None
-except Exception as e:
-    print(f"An error occurred while loading the TF-IDF vectorizer: {e}")
-    tfidf_vectorizer = None
-
+"""
+TF-IDF resume / job description matching.
 
-try:
-    nlp = spacy.load(spacy_model_path)
-    print(f"Successfully loaded spaCy model from {spacy_model_path}")
-except:
-    print("Could not load spaCy model. Skill extraction will not be available.")
-    nlp = None
+Importing this module is cheap: sklearn, pandas and spaCy are imported inside
+the functions that use them, and the vectorizer / spaCy model are loaded on
+request (``load_tfidf_vectorizer``, ``get_spacy_model``), not at import.
+Run ``python -m ats.matchjd`` for the sample-data demo.
+"""
+import os
+import threading
+import numpy as np
+from ats.document import ResumeDocument
+from ats.ats import clean_text     #same normalization as the resume path
+from ats.jd_cache import jd_cache
+vectorizer_path = 'ats_tfidf_vectorizer/tfidf_vectorizer.pkl'
+spacy_model_path = os.getenv('SPACY_MODEL_PATH', 'en_core_web_sm')     #installed package name or model directory
 
 
+def load_tfidf_vectorizer(path=vectorizer_path):
+    try:
+        import joblib
+        vectorizer = joblib.load(path)
+        print(f"Successfully loaded TF-IDF vectorizer from {path}")
+        return vectorizer
+    except FileNotFoundError:
+        print(f"Error: TF-IDF vectorizer not found at {path}")
+    except Exception as e:
+        print(f"An error occurred while loading the TF-IDF vectorizer: {e}")
+    return None
 
 
-stemmer = PorterStemmer()
-stop_words = set(stopwords.words('english'))
+_nlp = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
 
-def clean_text(text):
-    if isinstance(text, str):
-        text = text.lower()
-        text = re.sub(r'[^\w\s]', '', text)
-        text = ' '.join([stemmer.stem(word) for word in text.split() if word not in stop_words])
-        return text
-    return ''
 
+def get_spacy_model():      #loaded once on first call; None if spaCy or the model is missing
+    global _nlp, _nlp_loaded
+    if not _nlp_loaded:
+        with _nlp_lock:
+            if not _nlp_loaded:
+                try:
+                    import spacy
+                    _nlp = spacy.load(spacy_model_path)
+                    print(f"Successfully loaded spaCy model from {spacy_model_path}")
+                except Exception as e:
+                    print(f"Could not load spaCy model {spacy_model_path} ({e}). Skill extraction will not be available.")
+                    _nlp = None
+                _nlp_loaded = True
+    return _nlp
 
 
 def extract_skills_from_text(text, spacy_model, esco_matcher):
@@ -59,20 +67,43 @@ def get_resume_skill_score(extracted_skills):
 
 
 
+def _cleaned(text):
+    # ResumeDocument caches its cleaned text, so other analyzers don't redo the stemming
+    if isinstance(text, ResumeDocument):
+        return text.cleaned
+    return clean_text(text)
+
+
+def _jd_vector(jd_text, vectorizer):
+    # JDs repeat across requests; cleaned + vectorized once per distinct text (see ats/jd_cache.py)
+    if isinstance(jd_text, ResumeDocument):
+        jd_text = jd_text.text
+    return jd_cache.get(jd_text, vectorizer, clean_text).vector
+
+
+def precompute_jd_vectors(jd_texts, vectorizer):
+    """Warm the JD cache (e.g. with the default JD at startup)"""
+    if vectorizer is None:
+        return 0
+    for jd_text in jd_texts:
+        _jd_vector(jd_text, vectorizer)
+    return len(jd_texts)
+
+
 def get_resume_jd_match_score(resume_text, jd_text, vectorizer):
+    """resume_text / jd_text may be raw strings or ResumeDocument instances"""
     if vectorizer is None:
         print("Vectorizer not loaded. Cannot calculate match score.")
         return None
 
     
-    cleaned_resume = clean_text(resume_text)
-    cleaned_jd = clean_text(jd_text)
+    cleaned_resume = _cleaned(resume_text)
 
     
     
     try:
         resume_vector = vectorizer.transform([cleaned_resume])
-        jd_vector = vectorizer.transform([cleaned_jd])
+        jd_vector = _jd_vector(jd_text, vectorizer)
     except Exception as e:
         print(f"Error transforming text: {e}")
         return None
@@ -83,20 +114,69 @@ def get_resume_jd_match_score(resume_text, jd_text, vectorizer):
     if resume_vector.shape[1] == 0 or jd_vector.shape[1] == 0:
          return 0.0 
 
+    from sklearn.metrics.pairwise import cosine_similarity
+
     similarity_score = cosine_similarity(resume_vector, jd_vector)[0][0]
 
     return similarity_score
 
 
+def get_resumes_jd_match_scores(resume_texts, jd_text, vectorizer):
+    """Cosine similarity of many resumes against one JD.
+
+    All resumes go through a single ``vectorizer.transform`` call and the
+    similarities come from one sparse matrix product of the L2-normalized
+    resume rows with the normalized JD vector. Returns a float array in input
+    order, or None if the vectorizer is unavailable or fails.
+    """
+    if vectorizer is None:
+        print("Vectorizer not loaded. Cannot calculate match scores.")
+        return None
+
+    cleaned_resumes = [_cleaned(text) for text in resume_texts]
+    if not cleaned_resumes:
+        return np.zeros(0)
+
+    try:
+        resume_matrix = vectorizer.transform(cleaned_resumes)
+        jd_vector = _jd_vector(jd_text, vectorizer)
+    except Exception as e:
+        print(f"Error transforming text: {e}")
+        return None
+
+    if resume_matrix.shape[1] == 0 or jd_vector.shape[1] == 0:
+        return np.zeros(len(cleaned_resumes))
+
+    from sklearn.preprocessing import normalize
+
+    scores = normalize(resume_matrix) @ normalize(jd_vector).T
+    return scores.toarray().ravel()
+
+
+def top_k_indices(scores, n):
+    """Positions of the ``n`` highest scores, best first; equal scores keep input order"""
+    scores = np.asarray(scores)
+    n = min(n, len(scores))
+    if n <= 0:
+        return np.zeros(0, dtype=np.intp)
+    if n < len(scores):
+        candidates = np.argpartition(-scores, n - 1)[:n]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
 def predict_top_resumes(job_description, resumes_df, vectorizer, n=5):
+    import pandas as pd
+    from sklearn.preprocessing import normalize
+
     if vectorizer is None:
         print("Vectorizer not loaded. Cannot predict top resumes.")
         return pd.DataFrame() 
 
     
-    cleaned_jd = clean_text(job_description)
     try:
-        jd_vector = vectorizer.transform([cleaned_jd])
+        jd_vector = _jd_vector(job_description, vectorizer)
     except Exception as e:
         print(f"Error transforming job description: {e}")
         return pd.DataFrame()
@@ -106,78 +186,50 @@ def predict_top_resumes(job_description, resumes_df, vectorizer, n=5):
         return pd.DataFrame()
 
     
-    if 'match_score' not in resumes_df.columns:
-        resumes_df['match_score'] = 0.0 
-
-    
-    for index, row in resumes_df.iterrows():
-        resume_text = row['cleaned_resume_text'] 
-        if isinstance(resume_text, str) and resume_text.strip():
-            try:
-                
-                resume_vector = vectorizer.transform([resume_text])
-
-                
-                if resume_vector.shape[1] > 0:
-                     score = cosine_similarity(resume_vector, jd_vector)[0][0]
-                     resumes_df.loc[index, 'match_score'] = score
-                else:
-                     resumes_df.loc[index, 'match_score'] = 0.0 
-
-            except Exception as e:
-                 print(f"Error processing resume at index {index}: {e}")
-                 resumes_df.loc[index, 'match_score'] = 0.0 
-        else:
-             resumes_df.loc[index, 'match_score'] = 0.0 
-
-
-    
-    ranked_resumes = resumes_df.sort_values(by='match_score', ascending=False)
-
-    
-    return ranked_resumes.head(n)
-
-
-
-
-
-
-data = {
-    'resume_id': [1, 2, 3, 4, 5],
-    'raw_resume_text': [
-        "Experienced software engineer with skills in Python, Java, and SQL. Worked on web development projects.",
-        "Data Scientist with background in machine learning, R, and statistical modeling.",
-        "Project Manager with experience in Agile methodologies and team leadership.",
-        "Full-stack developer proficient in JavaScript, React, and Node.js.",
-        "Business Analyst with strong communication and analytical skills."
-    ]
-}
-sample_resumes_df = pd.DataFrame(data)
-
-
-sample_resumes_df['cleaned_resume_text'] = sample_resumes_df['raw_resume_text'].apply(clean_text)
-
-
-
-sample_jd = """
-We are looking for a Data Scientist with expertise in machine learning, Python, and statistical analysis.
-Experience with SQL and cloud platforms is a plus. Strong analytical skills required.
-"""
-
-
-
-single_resume_text = sample_resumes_df.loc[1, 'raw_resume_text']
-match_score = get_resume_jd_match_score(single_resume_text, sample_jd, tfidf_vectorizer)
-
-print(f"\nMatch score between sample resume 2 and sample JD: {match_score:.4f}")
-
-
-
-if tfidf_vectorizer:
-    print("\nPredicting top 3 resumes for the sample JD:")
-    top_resumes = predict_top_resumes(sample_jd, sample_resumes_df.copy(), tfidf_vectorizer, n=3) 
+    # one transform for the whole column, one sparse product against the normalized JD
+    resume_texts = [text if isinstance(text, str) else '' for text in resumes_df['cleaned_resume_text']]
+    try:
+        resume_matrix = vectorizer.transform(resume_texts)
+    except Exception as e:
+        print(f"Error transforming resumes: {e}")
+        return pd.DataFrame()
 
-    
-    display(top_resumes[['resume_id', 'raw_resume_text', 'match_score']])
-else:
-    print("\nCannot demonstrate predicting top resumes because the vectorizer was not loaded.")
\ No newline at end of file
+    scores = (normalize(resume_matrix) @ normalize(jd_vector).T).toarray().ravel()
+    top = top_k_indices(scores, n)
+
+    return resumes_df.iloc[top].assign(match_score=scores[top])
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    tfidf_vectorizer = load_tfidf_vectorizer()
+
+    data = {
+        'resume_id': [1, 2, 3, 4, 5],
+        'raw_resume_text': [
+            "Experienced software engineer with skills in Python, Java, and SQL. Worked on web development projects.",
+            "Data Scientist with background in machine learning, R, and statistical modeling.",
+            "Project Manager with experience in Agile methodologies and team leadership.",
+            "Full-stack developer proficient in JavaScript, React, and Node.js.",
+            "Business Analyst with strong communication and analytical skills."
+        ]
+    }
+    sample_resumes_df = pd.DataFrame(data)
+    sample_resumes_df['cleaned_resume_text'] = sample_resumes_df['raw_resume_text'].apply(clean_text)
+
+    sample_jd = """
+    We are looking for a Data Scientist with expertise in machine learning, Python, and statistical analysis.
+    Experience with SQL and cloud platforms is a plus. Strong analytical skills required.
+    """
+
+    single_resume_text = sample_resumes_df.loc[1, 'raw_resume_text']
+    match_score = get_resume_jd_match_score(single_resume_text, sample_jd, tfidf_vectorizer)
+    if match_score is not None:
+        print(f"\nMatch score between sample resume 2 and sample JD: {match_score:.4f}")
+
+    if tfidf_vectorizer:
+        print("\nPredicting top 3 resumes for the sample JD:")
+        top_resumes = predict_top_resumes(sample_jd, sample_resumes_df.copy(), tfidf_vectorizer, n=3)
+        print(top_resumes[['resume_id', 'raw_resume_text', 'match_score']].to_string(index=False))
+    else:
+        print("\nCannot demonstrate predicting top resumes because the vectorizer was not loaded.")
@@ -0,0 +1,60 @@
+"""
+Linear-time extraction of quantifiable achievements.
+
+The original patterns used unbounded ``.*?`` / ``[\\w\\s]+`` spans over the
+whole lowercased resume, which backtrack quadratically on long newline-free
+PDF text (e.g. many "increased" with no "by"). Here every pattern is compiled
+once, runs per sentence with whitespace collapsed to single spaces, and uses
+only bounded repetition, so the work per start position is a constant and the
+whole scan is linear in the resume length.
+"""
+import re
+from typing import List, Sequence, Union
+
+from ats.document import ResumeDocument
+
+GAP = r'.{0,150}?'          # was .*? - longest filler allowed between keyword and metric
+NUM = r'[\d,\.]{1,20}'      # was [\d,\.]+
+WORDS = r'[\w ]{1,150}'     # was [\w\s]+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# patterns from ATSAnalyzer.analyze_quantifiable_from_text
+QUANTIFIABLE_PATTERNS = [
+    rf'(?:increased|reduced|improved|decreased|boosted|cut|grew) {GAP}by ({NUM} ?%?)',
+    rf'(?:managed|led|oversaw) (?:a team of|{NUM} projects?)',
+    rf'(?:saved) ([\$\€\£]?{NUM})',
+    rf'(?:achieved|delivered) (?:a )?({NUM}%?) ',
+    rf'(?:handled|processed) ({NUM}) (?:data records?|transactions?)',
+    rf'(?:developed|implemented) {GAP}for ({NUM}) users?',
+    rf'(?:optimized|streamlined) {GAP}resulting in ({NUM}%?) reduction',
+    rf'({NUM}%?) (?:increase|reduction|improvement|gain|growth)',
+]
+
+class QuantifiableExtractor:
+    """Precompiled, sentence-bounded quantifiable-achievement matcher"""
+
+    def __init__(self, patterns: Sequence[str] = QUANTIFIABLE_PATTERNS):
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+
+    def segments(self, doc: ResumeDocument) -> List[str]:
+        """Lowercased sentences with whitespace runs collapsed to one space"""
+        lower = doc.lower
+        # trailing space lets patterns that end in a space match at the end of a sentence
+        return [WHITESPACE_RE.sub(' ', lower[start:end]) + ' ' for start, end in doc.sentence_spans]
+
+    def extract(self, resume_text: Union[ResumeDocument, str]) -> List[str]:
+        """All captured metrics, pattern by pattern, in document order"""
+        doc = ResumeDocument.coerce(resume_text)
+        segments = doc.memo("quantifiable_segments", lambda: self.segments(doc))
+        achievements: List[str] = []
+        for pattern in self.patterns:
+            for segment in segments:
+                for match in pattern.findall(segment):
+                    if isinstance(match, tuple):
+                        achievements.extend(item for item in match if item)
+                    else:
+                        achievements.append(match)
+        return achievements
+
+
+quantifiable_extractor = QuantifiableExtractor(QUANTIFIABLE_PATTERNS)
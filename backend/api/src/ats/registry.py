@@ -0,0 +1,243 @@
+"""
+Registry and runner for the ATS analyzers.
+
+Scoring used to be written out twice - in ``ats.analyze_resume`` and in
+``ATSAnalyzer`` - each with its own copy of the weights and matching code.
+``ats.analyze_resume`` is now a wrapper over ``ATSAnalyzer.analyze``, and
+analyzers are registered once with what they read and what they are worth:
+
+    key         result name ("buzzwords", "jd_match", ...)
+    fn          called with the declared inputs as positional arguments
+    inputs      names looked up in the run context ("doc", "jd") or produced
+                by a registered provider ("term_hits")
+    cost        relative cost estimate; the runner starts expensive analyzers
+                first and streaming runs them cheapest first
+    weight      points per unit of ``metric(result)`` in the overall score
+                (``SCORE_WEIGHTS``)
+
+``AnalyzerRunner`` resolves the shared inputs once, runs the analyzers (inline,
+or in a thread pool when configured) and records each one's wall time and
+result size (JSON bytes), per run and aggregated in ``stats()``. Stats are per
+process; with ATS_WORKERS > 0 every pool worker keeps its own.
+
+Configuration (environment):
+
+    ATS_ANALYZER_THREADS    threads per run (default 1: the analyzers run one after
+                            another in the calling thread)
+
+The built-in analyzers are pure Python and hold the GIL, so threads only pay
+off for analyzers that release it (native code, I/O) and are opt-in; the pool
+workers already parallelize across resumes.
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+#points per unit of each analyzer's metric; repetition is a penalty
+SCORE_WEIGHTS: Dict[str, float] = {
+    "buzzwords": 0.5,
+    "quantifiable": 10,
+    "technical": 2,
+    "structure": 5,
+    "repetition": -1,
+    "jd_match": 0,
+}
+
+
+def count_metric(result: Dict[str, Any]) -> float:
+    return result["count"]
+
+
+def weighted_points(metrics: Dict[str, float], weights: Dict[str, float] = SCORE_WEIGHTS) -> float:
+    """Sum of ``weight * metric`` over the analyzers present in ``metrics``"""
+    return sum(weights.get(key, 0) * value for key, value in metrics.items())
+
+
+class AnalyzerSpec(NamedTuple):
+    key: str
+    fn: Callable[..., Dict[str, Any]]
+    inputs: Tuple[str, ...] = ("doc",)
+    cost: int = 1
+    weight: float = 0.0
+    metric: Callable[[Dict[str, Any]], float] = count_metric
+
+    def points(self, result: Dict[str, Any]) -> float:
+        return self.weight * self.metric(result)
+
+
+class AnalyzerTiming(NamedTuple):
+    wall_ms: float
+    result_bytes: int
+
+
+class AnalyzerRegistry:
+    """Analyzers in registration order (which is also report order) plus shared input providers"""
+
+    def __init__(self):
+        self._specs: Dict[str, AnalyzerSpec] = {}
+        self._providers: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...]]] = {}
+
+    def register(self, key: str, fn: Callable[..., Dict[str, Any]], inputs: Sequence[str] = ("doc",),
+                 cost: int = 1, weight: Optional[float] = None,
+                 metric: Callable[[Dict[str, Any]], float] = count_metric) -> AnalyzerSpec:
+        """Add (or replace) an analyzer; ``weight`` defaults to ``SCORE_WEIGHTS[key]`` (0 if unlisted)"""
+        spec = AnalyzerSpec(key, fn, tuple(inputs), cost, SCORE_WEIGHTS.get(key, 0) if weight is None else weight, metric)
+        self._specs[key] = spec
+        return spec
+
+    def provide(self, name: str, fn: Callable[..., Any], inputs: Sequence[str] = ("doc",)) -> None:
+        """Register a derived input computed once per run before any analyzer that declares it"""
+        self._providers[name] = (fn, tuple(inputs))
+
+    def __iter__(self) -> Iterator[AnalyzerSpec]:
+        return iter(list(self._specs.values()))
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._specs
+
+    def get(self, key: str) -> AnalyzerSpec:
+        return self._specs[key]
+
+    def keys(self, exclude_inputs: Iterable[str] = ()) -> List[str]:
+        """Analyzer keys in registration order, skipping those that need any of ``exclude_inputs``"""
+        excluded = set(exclude_inputs)
+        return [spec.key for spec in self if not excluded.intersection(spec.inputs)]
+
+    def by_cost(self, keys: Optional[Iterable[str]] = None) -> List[AnalyzerSpec]:
+        """Cheapest first; equal costs keep registration order"""
+        specs = [self._specs[key] for key in keys] if keys is not None else list(self)
+        return sorted(specs, key=lambda spec: spec.cost)
+
+    def weights(self) -> Dict[str, float]:
+        return {spec.key: spec.weight for spec in self}
+
+    def score(self, results: Dict[str, Dict[str, Any]]) -> float:
+        """Weighted points of the results present; analyzers not (yet) run contribute nothing"""
+        return sum(spec.points(results[spec.key]) for spec in self if spec.key in results)
+
+    def resolve_inputs(self, specs: Sequence[AnalyzerSpec], context: Dict[str, Any]) -> Dict[str, AnalyzerTiming]:
+        """Compute every provided input the specs need into ``context`` (in place); returns their timings"""
+        timings = {}
+        pending = [name for spec in specs for name in spec.inputs]
+        while pending:
+            name = pending.pop(0)
+            if name in context:
+                continue
+            if name not in self._providers:
+                raise KeyError(f"no value or provider for analyzer input '{name}'")
+            fn, inputs = self._providers[name]
+            missing = [dep for dep in inputs if dep not in context]
+            if missing:
+                pending = missing + [name] + pending
+                continue
+            started = time.perf_counter()
+            context[name] = fn(*[context[dep] for dep in inputs])
+            timings[f"input:{name}"] = AnalyzerTiming(round((time.perf_counter() - started) * 1000, 3), 0)
+        return timings
+
+
+class AnalyzerRunner:
+    """Runs registered analyzers (concurrently if given more than one thread) and keeps per-analyzer timing stats"""
+
+    def __init__(self, registry: AnalyzerRegistry, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = int(os.getenv("ATS_ANALYZER_THREADS") or 1)
+        self.registry = registry
+        self.max_workers = max(1, max_workers)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self.runs = 0
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ats-analyzer")
+            return self._pool
+
+    def call(self, spec: AnalyzerSpec, context: Dict[str, Any]) -> Tuple[Dict[str, Any], AnalyzerTiming]:
+        """Run one analyzer against an already-resolved context and record its timing"""
+        started = time.perf_counter()
+        result = spec.fn(*[context[name] for name in spec.inputs])
+        wall_ms = (time.perf_counter() - started) * 1000
+        timing = AnalyzerTiming(round(wall_ms, 3), len(json.dumps(result, default=str)))
+        self._record(spec.key, timing)
+        return result, timing
+
+    def run_one(self, key: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Result of a single analyzer, resolving its provided inputs first (used to stream results one by one)"""
+        spec = self.registry.get(key)
+        context = dict(context)
+        for name, timing in self.registry.resolve_inputs([spec], context).items():
+            self._record(name, timing)
+        return self.call(spec, context)[0]
+
+    def run(self, context: Dict[str, Any], keys: Optional[Iterable[str]] = None
+            ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, AnalyzerTiming]]:
+        """``(results, timings)`` for the selected analyzers (default: all), both in registration order.
+
+        The first analyzer exception is re-raised once every analyzer has finished.
+        """
+        specs = [self.registry.get(key) for key in keys] if keys is not None else list(self.registry)
+        context = dict(context)
+        timings = self.registry.resolve_inputs(specs, context)
+        for name, timing in timings.items():
+            self._record(name, timing)
+
+        if self.max_workers == 1 or len(specs) < 2:
+            outcomes = {spec.key: self.call(spec, context) for spec in specs}
+        else:
+            pool = self._executor()
+            #most expensive first, so the long analyzers are never the last ones to start
+            futures = {spec.key: pool.submit(self.call, spec, context)
+                       for spec in sorted(specs, key=lambda spec: -spec.cost)}
+            errors = [future.exception() for future in futures.values()]
+            error = next((e for e in errors if e is not None), None)
+            if error is not None:
+                raise error
+            outcomes = {key: future.result() for key, future in futures.items()}
+
+        with self._lock:
+            self.runs += 1
+        results = {spec.key: outcomes[spec.key][0] for spec in specs}
+        timings.update((spec.key, outcomes[spec.key][1]) for spec in specs)
+        return results, timings
+
+    def _record(self, key: str, timing: AnalyzerTiming) -> None:
+        with self._lock:
+            entry = self._stats.setdefault(key, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0, "total_bytes": 0})
+            entry["calls"] += 1
+            entry["total_ms"] += timing.wall_ms
+            entry["max_ms"] = max(entry["max_ms"], timing.wall_ms)
+            entry["total_bytes"] += timing.result_bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-analyzer call count, mean/max wall time and mean result size, slowest (by total time) first"""
+        with self._lock:
+            entries = sorted(self._stats.items(), key=lambda item: -item[1]["total_ms"])
+            return {
+                "threads": self.max_workers,
+                "runs": self.runs,
+                "analyzers": {
+                    key: {
+                        "calls": entry["calls"],
+                        "mean_ms": round(entry["total_ms"] / entry["calls"], 3),
+                        "max_ms": round(entry["max_ms"], 3),
+                        "total_ms": round(entry["total_ms"], 3),
+                        "mean_result_bytes": round(entry["total_bytes"] / entry["calls"]),
+                    }
+                    for key, entry in entries
+                },
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
@@ -0,0 +1,259 @@
+"""
+Persistent inverted index of resumes for JD-to-candidate search.
+
+``predict_top_resumes`` rescores the whole pool for every job description.
+This index keeps the pool on disk in SQLite instead:
+
+    resumes     one row per resume: external id, optional JSON metadata and
+                the packed term ids it was indexed under (used for deletes)
+    postings    (term, doc) -> L2-normalized tf-idf weight, clustered by term
+    meta        format version and the fingerprint of the vectorizer whose
+                vocabulary/idf produced the weights
+
+Resumes can be added, replaced and deleted incrementally. A query vectorizes
+the JD and reads only the postings of its non-zero terms; SQLite sums the
+weight products per resume (which, with both sides normalized, is the cosine
+similarity ``get_resume_jd_match_score`` computes) and returns the top k, so
+memory stays bounded by the candidate set rather than the pool.
+
+Use from Python::
+
+    index = ResumeIndex("resumes.db", vectorizer)
+    index.add_many((row.id, row.text, {"name": row.name}) for row in rows)
+    index.query(jd_text, k=20)
+
+or from the command line::
+
+    python -m ats.resume_index --index resumes.db --vectorizer <tfidf_vectorizer.pkl> add --csv resumes.csv
+    python -m ats.resume_index --index resumes.db --vectorizer <tfidf_vectorizer.pkl> query --jd jd.txt -k 20
+"""
+import argparse
+import csv
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+from array import array
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sklearn.preprocessing import normalize
+
+from ats.ats import clean_text
+
+FORMAT_VERSION = 1
+DEFAULT_BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS resumes (
+    id INTEGER PRIMARY KEY,
+    resume_id TEXT NOT NULL UNIQUE,
+    metadata TEXT,
+    terms BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term INTEGER NOT NULL,
+    doc INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+"""
+
+QUERY_SQL = """
+SELECT r.resume_id, s.score, r.metadata
+FROM (
+    SELECT p.doc, SUM(p.weight * q.weight) AS score
+    FROM temp.query_terms q CROSS JOIN postings p ON p.term = q.term     -- drive the join from the JD terms
+    GROUP BY p.doc
+    ORDER BY score DESC, p.doc
+    LIMIT ?
+) s JOIN resumes r ON r.id = s.doc
+ORDER BY s.score DESC, s.doc
+"""
+
+
+def vectorizer_fingerprint(vectorizer) -> str:
+    """Hash of a fitted vectorizer's vocabulary and idf weights; postings are only valid for the same one"""
+    digest = hashlib.sha1()
+    vocabulary = getattr(vectorizer, "vocabulary_", None) or {}
+    digest.update(json.dumps(sorted((str(term), int(i)) for term, i in vocabulary.items())).encode("utf-8"))
+    idf = getattr(vectorizer, "idf_", None)
+    if idf is not None:
+        digest.update(idf.tobytes())
+    return digest.hexdigest()
+
+
+class ResumeIndex:
+    """SQLite-backed term -> postings index over a resume pool"""
+
+    def __init__(self, path: str, vectorizer):
+        self.path = path
+        self.vectorizer = vectorizer
+        self.fingerprint = vectorizer_fingerprint(vectorizer)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS query_terms (term INTEGER PRIMARY KEY, weight REAL NOT NULL)")
+        self._check_meta()
+
+    def _check_meta(self) -> None:
+        meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        if meta and len(self):
+            if int(meta.get("format_version", 0)) != FORMAT_VERSION:
+                raise ValueError(f"Resume index {self.path} has format {meta.get('format_version')}, "
+                                 f"expected {FORMAT_VERSION}; rebuild it")
+            if meta.get("vectorizer") != self.fingerprint:
+                raise ValueError(f"Resume index {self.path} was built with a different vectorizer; rebuild it")
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                   [("format_version", str(FORMAT_VERSION)), ("vectorizer", self.fingerprint)])
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def __contains__(self, resume_id: Any) -> bool:
+        return self._conn.execute("SELECT 1 FROM resumes WHERE resume_id = ?", (str(resume_id),)).fetchone() is not None
+
+    def __enter__(self) -> "ResumeIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _vectorize(self, texts: Sequence[str], cleaned: bool):
+        if not cleaned:
+            texts = [clean_text(text) for text in texts]
+        return normalize(self.vectorizer.transform([text if isinstance(text, str) else '' for text in texts])).tocsr()
+
+    def _delete_postings(self, doc: int, terms: bytes) -> None:
+        term_ids = array("I")
+        term_ids.frombytes(terms)
+        self._conn.executemany("DELETE FROM postings WHERE term = ? AND doc = ?", ((term, doc) for term in term_ids))
+
+    def add(self, resume_id: Any, text: str, metadata: Optional[Dict[str, Any]] = None, cleaned: bool = False) -> None:
+        """Index one resume, replacing any previous version with the same id"""
+        self.add_many([(resume_id, text, metadata)], cleaned=cleaned)
+
+    def add_many(self, items: Iterable[Tuple[Any, str, Optional[Dict[str, Any]]]],
+                 cleaned: bool = False, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """Index ``(resume_id, text, metadata)`` items in batches (one transform + one transaction each)
+
+        ``cleaned=True`` means the texts already went through ``clean_text``
+        (e.g. a ``cleaned_resume_text`` column). Returns the number indexed.
+        """
+        items = iter(items)
+        added = 0
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                return added
+            # the last version of an id wins, as it would when added one by one
+            batch = list({str(resume_id): (resume_id, text, metadata) for resume_id, text, metadata in batch}.values())
+            matrix = self._vectorize([text for _, text, _ in batch], cleaned)
+            with self._lock, self._conn:
+                postings = []
+                for row, (resume_id, _, metadata) in enumerate(batch):
+                    start, end = matrix.indptr[row], matrix.indptr[row + 1]
+                    terms = matrix.indices[start:end].tolist()
+                    doc = self._upsert_resume(str(resume_id), metadata, array("I", terms).tobytes())
+                    postings.extend(zip(terms, [doc] * len(terms), matrix.data[start:end].tolist()))
+                postings.sort()         # primary-key order keeps b-tree inserts local instead of scattered
+                self._conn.executemany("INSERT INTO postings (term, doc, weight) VALUES (?, ?, ?)", postings)
+            added += len(batch)
+
+    def _upsert_resume(self, resume_id: str, metadata: Optional[Dict[str, Any]], terms: bytes) -> int:
+        payload = json.dumps(metadata) if metadata is not None else None
+        existing = self._conn.execute("SELECT id, terms FROM resumes WHERE resume_id = ?", (resume_id,)).fetchone()
+        if existing is None:
+            return self._conn.execute("INSERT INTO resumes (resume_id, metadata, terms) VALUES (?, ?, ?)",
+                                      (resume_id, payload, terms)).lastrowid
+        doc, old_terms = existing
+        self._delete_postings(doc, old_terms)
+        self._conn.execute("UPDATE resumes SET metadata = ?, terms = ? WHERE id = ?", (payload, terms, doc))
+        return doc
+
+    def delete(self, resume_id: Any) -> bool:
+        """Remove a resume and its postings; returns False if it was not indexed"""
+        with self._lock, self._conn:
+            existing = self._conn.execute("SELECT id, terms FROM resumes WHERE resume_id = ?", (str(resume_id),)).fetchone()
+            if existing is None:
+                return False
+            self._delete_postings(*existing)
+            self._conn.execute("DELETE FROM resumes WHERE id = ?", (existing[0],))
+            return True
+
+    def query(self, jd_text: str, k: int = 10, cleaned: bool = False) -> List[Dict[str, Any]]:
+        """Top ``k`` resumes by cosine similarity to the JD, reading only the JD terms' postings"""
+        jd_vector = self._vectorize([jd_text], cleaned)
+        if k <= 0 or jd_vector.nnz == 0:
+            return []
+        with self._lock:
+            self._conn.execute("DELETE FROM temp.query_terms")
+            self._conn.executemany("INSERT INTO temp.query_terms (term, weight) VALUES (?, ?)",
+                                   zip(jd_vector.indices.tolist(), jd_vector.data.tolist()))
+            rows = self._conn.execute(QUERY_SQL, (k,)).fetchall()
+        return [
+            {"resume_id": resume_id, "score": score, "metadata": json.loads(metadata) if metadata else None}
+            for resume_id, score, metadata in rows
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "resumes": len(self),
+            "postings": self._conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0],
+            "terms": self._conn.execute("SELECT COUNT(DISTINCT term) FROM postings").fetchone()[0],
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Maintain and query the on-disk resume inverted index")
+    parser.add_argument("--index", required=True, help="SQLite index file")
+    parser.add_argument("--vectorizer", required=True, help="path to the joblib-pickled TF-IDF vectorizer")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="index (or re-index) resumes from a CSV file")
+    add.add_argument("--csv", required=True)
+    add.add_argument("--id-column", default="resume_id")
+    add.add_argument("--text-column", default="raw_resume_text")
+    add.add_argument("--cleaned", action="store_true", help="text column is already clean_text output")
+
+    delete = commands.add_parser("delete", help="remove resumes by id")
+    delete.add_argument("ids", nargs="+")
+
+    query = commands.add_parser("query", help="top-k resumes for a job description")
+    query.add_argument("--jd", required=True, help="file containing the job description")
+    query.add_argument("-k", type=int, default=10)
+
+    args = parser.parse_args(argv)
+
+    import joblib
+
+    with ResumeIndex(args.index, joblib.load(args.vectorizer)) as index:
+        if args.command == "add":
+            with open(args.csv, newline="", encoding="utf-8") as fh:
+                rows = csv.DictReader(fh)
+                added = index.add_many(
+                    ((row[args.id_column], row[args.text_column],
+                      {key: value for key, value in row.items() if key not in (args.id_column, args.text_column)})
+                     for row in rows),
+                    cleaned=args.cleaned)
+            print(f"Indexed {added} resumes; {index.stats()}")
+        elif args.command == "delete":
+            removed = sum(index.delete(resume_id) for resume_id in args.ids)
+            print(f"Deleted {removed} of {len(args.ids)} resumes")
+        else:
+            with open(args.jd, encoding="utf-8") as fh:
+                for rank, hit in enumerate(index.query(fh.read(), k=args.k), 1):
+                    print(f"{rank:>3}. {hit['resume_id']}  {hit['score']:.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Memoized stemming for ``clean_text``.
+
+NLTK's Porter stemmer is pure Python and resume vocabulary repeats heavily
+across users, so stems are served from (in order):
+
+1. a pinned table of precomputed stems of raw words (the ESCO labels and
+   buzzwords, loaded from disk at startup), never evicted
+2. a bounded, thread-safe LRU of recently stemmed words
+3. the underlying stemmer, whose result goes into the LRU
+
+Tables are plain ``word<TAB>stem`` lines, written by the ESCO index build
+(see ``ats.esco_index``). Only surface words belong in a table: the TF-IDF
+vocabulary is already stemmed, and pinning stems of stems never hits.
+"""
+import threading
+from typing import Callable, Dict, Iterable, Tuple
+
+from utils.cache import LRUCache
+
+DEFAULT_CACHE_SIZE = 50000
+
+
+class StemCache:
+    """Stemmer front-end with a pinned precomputed table and a bounded LRU"""
+
+    def __init__(self, stem_fn: Callable[[str], str], maxsize: int = DEFAULT_CACHE_SIZE):
+        self.stem_fn = stem_fn
+        self._table: Dict[str, str] = {}
+        self._table_lock = threading.Lock()
+        self._lru = LRUCache(maxsize=maxsize)
+        self.table_hits = 0
+
+    def stem(self, word: str) -> str:
+        stem = self._table.get(word)
+        if stem is not None:
+            self.table_hits += 1
+            return stem
+        stem = self._lru.get(word)
+        if stem is None:
+            stem = self.stem_fn(word)
+            self._lru.set(word, stem)
+        return stem
+
+    def preload(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """Pin precomputed ``(word, stem)`` pairs; returns how many were added"""
+        new_entries = dict(pairs)
+        with self._table_lock:
+            table = dict(self._table)       # copy-on-write so lock-free readers never see a resize
+            before = len(table)
+            table.update(new_entries)
+            self._table = table
+        return len(table) - before
+
+    def precompute(self, words: Iterable[str]) -> int:
+        """Stem ``words`` now and pin the results"""
+        return self.preload((word, self.stem_fn(word)) for word in set(words) if word)
+
+    def load_table(self, path: str) -> int:
+        """Pin a ``word<TAB>stem`` table from disk"""
+        with open(path, "r", encoding="utf-8") as fh:
+            return self.preload(tuple(line.rstrip("\n").split("\t", 1)) for line in fh if "\t" in line)
+
+    def save_table(self, path: str, words: Iterable[str]) -> int:
+        """Write a ``word<TAB>stem`` table for ``words``; returns the number of rows"""
+        rows = sorted({word for word in words if word and "\t" not in word and "\n" not in word})
+        with open(path, "w", encoding="utf-8") as fh:
+            for word in rows:
+                fh.write(f"{word}\t{self.stem_fn(word)}\n")
+        return len(rows)
+
+    def stats(self) -> Dict[str, float]:
+        lru = self._lru.stats()
+        lookups = self.table_hits + lru["hits"] + lru["misses"]
+        return {
+            "table_size": len(self._table),
+            "table_hits": self.table_hits,
+            "cache_size": lru["size"],
+            "cache_maxsize": lru["maxsize"],
+            "cache_hits": lru["hits"],
+            "misses": lru["misses"],
+            "hit_rate": round((self.table_hits + lru["hits"]) / lookups, 4) if lookups else 0.0,
+        }
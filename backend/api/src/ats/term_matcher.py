@@ -0,0 +1,224 @@
+"""
+Single-pass dictionary matching for the ATS checker.
+
+Buzzwords and ESCO skill terms are compiled into one Aho-Corasick automaton
+over cleaned tokens (lowercased, stopwords removed, stemmed - see
+``clean_text``). Scanning a resume is a single walk over its tokens, so the
+cost is linear in the resume length no matter how many terms are loaded, and
+matching is token-aligned: "r" only matches the word "r", not every word
+containing the letter.
+
+For the full ESCO taxonomy the automaton is compiled into flat integer arrays
+when the ESCO index is built (see ``ats.esco_index``) and memory-mapped at
+startup, so loading it costs neither build time nor per-node Python objects.
+Phrase ids ``< esco_term_count`` are ESCO terms, the rest are buzzwords.
+"""
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from ats.ats import clean_text
+
+
+class PhraseAutomaton:
+    """Aho-Corasick automaton whose alphabet is tokens rather than characters"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._dict_link: List[int] = [0]    # nearest suffix state that has outputs
+        self._out: List[List[Tuple[int, Any]]] = [[]]
+        self._built = True
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def add(self, tokens: Sequence[str], payload: Any) -> None:
+        """Add a phrase (sequence of tokens); ``payload`` is reported on every match"""
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            nxt = self._goto[node].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._dict_link.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(tokens), payload))
+        self._built = False
+
+    def build(self) -> "PhraseAutomaton":
+        """Compute failure and output links; must be called after the last ``add``"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                suffix = self._fail[child]
+                self._dict_link[child] = suffix if self._out[suffix] else self._dict_link[suffix]
+                queue.append(child)
+        self._built = True
+        return self
+
+    def compile(self) -> Dict[str, array]:
+        """
+        Flatten into the arrays ``CompiledAutomaton`` runs on. Tokens and
+        payloads must be non-negative ints (token ids / phrase ids).
+        """
+        if not self._built:
+            self.build()
+        arrays = {name: array("I") for name in
+                  ("edge_start", "edge_tok", "edge_child", "out_start", "out_ids")}
+        arrays["edge_start"].append(0)
+        arrays["out_start"].append(0)
+        for node, transitions in enumerate(self._goto):
+            for token, child in sorted(transitions.items()):
+                arrays["edge_tok"].append(token)
+                arrays["edge_child"].append(child)
+            arrays["edge_start"].append(len(arrays["edge_tok"]))
+            arrays["out_ids"].extend(payload for _length, payload in self._out[node])
+            arrays["out_start"].append(len(arrays["out_ids"]))
+        arrays["fail"] = array("I", self._fail)
+        arrays["dict_link"] = array("I", self._dict_link)
+        return arrays
+
+    def iter_matches(self, tokens: Iterable[str]) -> Iterator[Tuple[int, int, Any]]:
+        """Yield ``(start, end, payload)`` token spans for every phrase occurring in ``tokens``"""
+        if not self._built:
+            self.build()
+        goto, fail, out, dict_link = self._goto, self._fail, self._out, self._dict_link
+        node = 0
+        for i, token in enumerate(tokens):
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            hit = node if out[node] else dict_link[node]
+            while hit:
+                for length, payload in out[hit]:
+                    yield i - length + 1, i + 1, payload
+                hit = dict_link[hit]
+
+
+class CompiledAutomaton:
+    """
+    Read-only Aho-Corasick automaton over flat arrays (typically memoryviews
+    of an mmapped file). Node transitions are sorted token-id runs searched
+    with ``bisect``; outputs are phrase ids.
+    """
+
+    def __init__(self, arrays: Mapping[str, Sequence[int]], vocab: Mapping[str, int],
+                 phrase_lengths: Sequence[int]):
+        self._edge_start = arrays["edge_start"]
+        self._edge_tok = arrays["edge_tok"]
+        self._edge_child = arrays["edge_child"]
+        self._fail = arrays["fail"]
+        self._dict_link = arrays["dict_link"]
+        self._out_start = arrays["out_start"]
+        self._out_ids = arrays["out_ids"]
+        self.vocab = vocab
+        self.phrase_lengths = phrase_lengths
+
+    def __len__(self) -> int:
+        return len(self._fail)
+
+    def iter_matches(self, tokens: Iterable[str]) -> Iterator[Tuple[int, int, int]]:
+        """Yield ``(start, end, phrase_id)`` token spans for every phrase occurring in ``tokens``"""
+        vocab, lengths = self.vocab, self.phrase_lengths
+        edge_start, edge_tok, edge_child = self._edge_start, self._edge_tok, self._edge_child
+        fail, dict_link, out_start, out_ids = self._fail, self._dict_link, self._out_start, self._out_ids
+        node = 0
+        for i, token in enumerate(tokens):
+            tok = vocab.get(token)
+            if tok is None:         # unknown token: no phrase can continue through it
+                node = 0
+                continue
+            while True:
+                lo, hi = edge_start[node], edge_start[node + 1]
+                j = bisect_left(edge_tok, tok, lo, hi)
+                if j < hi and edge_tok[j] == tok:
+                    node = edge_child[j]
+                    break
+                if not node:
+                    break
+                node = fail[node]
+            hit = node if out_start[node] != out_start[node + 1] else dict_link[node]
+            while hit:
+                for k in range(out_start[hit], out_start[hit + 1]):
+                    phrase_id = out_ids[k]
+                    yield i - lengths[phrase_id] + 1, i + 1, phrase_id
+                hit = dict_link[hit]
+
+
+def compile_phrases(phrases: Sequence[Sequence[str]]) -> Tuple[Dict[str, array], List[str], array]:
+    """
+    Compile tokenized phrases (phrase id = position) into automaton arrays.
+
+    Returns:
+        (automaton arrays, vocabulary in token-id order, phrase lengths)
+    """
+    vocab: Dict[str, int] = {}
+    automaton = PhraseAutomaton()
+    lengths = array("I")
+    for phrase_id, tokens in enumerate(phrases):
+        token_ids = [vocab.setdefault(token, len(vocab)) for token in tokens]
+        automaton.add(token_ids, phrase_id)
+        lengths.append(len(token_ids))
+    return automaton.compile(), list(vocab), lengths
+
+
+class TermHits(NamedTuple):
+    buzzwords: List[str]        # distinct buzzwords found, in buzzword list order
+    esco_terms: List[str]       # cleaned ESCO terms found, in resume order (with repeats)
+
+
+class TermMatcher:
+    """Buzzword + ESCO term matcher built once at startup"""
+
+    def __init__(self, buzzwords: Sequence[str], esco_index: Optional[Any] = None):
+        self.buzzwords = list(buzzwords)
+        self.esco_index = esco_index
+        self.esco_term_count = len(esco_index) if esco_index is not None else 0
+
+        compiled = esco_index.automaton if esco_index is not None else None
+        if compiled is not None and list(esco_index.buzzwords) == self.buzzwords:
+            self.automaton = compiled
+        else:
+            if compiled is not None:
+                print("ESCO index was compiled for a different buzzword list, building the term automaton in memory")
+            self.automaton = PhraseAutomaton()
+            for term_id in range(self.esco_term_count):
+                self.automaton.add(esco_index.term(term_id).split(), term_id)
+            for i, buzzword in enumerate(self.buzzwords):
+                self.automaton.add(clean_text(buzzword).split(), self.esco_term_count + i)
+            self.automaton.build()
+
+    @classmethod
+    def from_esco_index(cls, buzzwords: Sequence[str], esco_index: Optional[Any]) -> "TermMatcher":
+        """Build from the buzzword list and an ``EscoIndex`` (may be None)"""
+        return cls(buzzwords, esco_index)
+
+    def scan(self, text: str) -> TermHits:
+        """Find every buzzword and ESCO term in ``text`` with one pass over its tokens"""
+        return self.scan_tokens(clean_text(text).split())
+
+    def scan_tokens(self, tokens: Sequence[str]) -> TermHits:
+        """Same as ``scan`` for text that has already been cleaned and split"""
+        n_esco = self.esco_term_count
+        buzzword_ids = set()
+        esco_term_ids: List[int] = []
+        for _start, _end, phrase_id in self.automaton.iter_matches(tokens):
+            if phrase_id < n_esco:
+                esco_term_ids.append(phrase_id)
+            else:
+                buzzword_ids.add(phrase_id - n_esco)
+        esco_terms = [self.esco_index.term(term_id) for term_id in esco_term_ids]
+        return TermHits([self.buzzwords[i] for i in sorted(buzzword_ids)], esco_terms)
@@ -0,0 +1,99 @@
+"""
+Import-time profile and budget check.
+
+Cold start (container restarts, autoscaling) is dominated by what ``import app``
+pulls in. This runs the import in a fresh interpreter with ``-X importtime``
+and reports total time, the slowest modules by cumulative and self time, and
+self time summed per top-level package::
+
+    python -m utils.import_profile                     # profile `import app`
+    python -m utils.import_profile ats.analyzer --top 15
+    python -m utils.import_profile --budget-ms 1500    # exit 1 if the import takes longer
+
+The budget can also come from IMPORT_BUDGET_MS, so CI can fail a change that
+makes an eager heavy import (nltk, sklearn, spacy, pandas, google.generativeai)
+sneak back in.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional
+
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def profile_imports(module: str = "app", python: str = sys.executable, cwd: Optional[str] = None) -> List[ImportRecord]:
+    """``-X importtime`` records for ``import module`` in a fresh interpreter (raises if the import fails)"""
+    proc = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=cwd, capture_output=True, text=True)
+    records = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append(ImportRecord(name, int(self_us), int(cumulative_us), len(indent) // 2))
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if not IMPORTTIME_RE.match(line)]
+        raise RuntimeError(f"import {module} failed:\n" + "\n".join(errors[-20:]))
+    return records
+
+
+def summarize(records: List[ImportRecord], module: str, top: int = 20) -> Dict[str, Any]:
+    by_package: Dict[str, int] = defaultdict(int)
+    for record in records:
+        by_package[record.module.split(".")[0]] += record.self_us
+    target = next((record for record in records if record.module == module), None)
+    return {
+        "module": module,
+        "total_ms": round((target.cumulative_us if target else sum(r.self_us for r in records)) / 1000, 1),
+        "modules": len(records),
+        "slowest_cumulative": [(r.module, round(r.cumulative_us / 1000, 1))
+                               for r in sorted(records, key=lambda r: -r.cumulative_us)[:top]],
+        "slowest_self": [(r.module, round(r.self_us / 1000, 1))
+                         for r in sorted(records, key=lambda r: -r.self_us)[:top]],
+        "packages": [(name, round(us / 1000, 1))
+                     for name, us in sorted(by_package.items(), key=lambda item: -item[1])[:top]],
+    }
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    lines = [f"import {summary['module']}: {summary['total_ms']} ms, {summary['modules']} modules", ""]
+    for title, key in (("Slowest (cumulative)", "slowest_cumulative"),
+                       ("Slowest (self)", "slowest_self"),
+                       ("By top-level package (self)", "packages")):
+        lines.append(f"{title}:")
+        lines.extend(f"  {ms:>9.1f} ms  {name}" for name, ms in summary[key])
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Profile the import time of a module and check it against a budget")
+    parser.add_argument("module", nargs="?", default="app")
+    parser.add_argument("--top", type=int, default=20, help="rows per table")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_BUDGET_MS", "0")),
+                        help="fail (exit 1) when the import takes longer; 0 disables the check")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    summary = summarize(profile_imports(args.module), args.module, args.top)
+    print(json.dumps(summary, indent=2) if args.json else format_report(summary))
+    if args.budget_ms and summary["total_ms"] > args.budget_ms:
+        print(f"import {args.module} took {summary['total_ms']} ms, over the {args.budget_ms:g} ms budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,25 @@
 """
 Base LLM interface - clean interface for model communication only
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional, Tuple
+
+class ProviderRateLimitError(RuntimeError):
+    """Raised by a provider when the upstream API rejected the call for its rate or quota limits"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers - handles only model communication"""
     
+    # environment variables holding this provider's credentials; the shared
+    # LLMManager is rebuilt when any of them changes (see get_llm_manager)
+    credential_env: Tuple[str, ...] = ()
+    
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         self.api_key = api_key
         self.config = kwargs
@@ -18,9 +31,31 @@ class BaseLLMProvider(ABC):
     
     @abstractmethod
     def generate_text(self, prompt: str) -> str:
-        """Generate text response from the LLM model"""
+        """Generate text response from the LLM model (raise ProviderRateLimitError on 429/quota errors)"""
         pass
     
+    async def generate_text_async(self, prompt: str) -> Optional[str]:
+        """
+        Generate text without blocking the event loop
+        
+        Providers with a native async client should override this; the default
+        runs the blocking ``generate_text`` in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate_text, prompt)
+    
+    async def stream_text_async(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Yield the response text in chunks as the model produces it
+        
+        Providers with a streaming API should override this; the default yields
+        the whole ``generate_text_async`` response as a single chunk. Failures
+        raise instead of returning None so callers can fall back.
+        """
+        text = await self.generate_text_async(prompt)
+        if not text:
+            raise RuntimeError(f"{self.get_provider_name()} returned an empty response")
+        yield text
+    
     @abstractmethod
     def get_provider_name(self) -> str:
         """Get the name of the LLM provider"""
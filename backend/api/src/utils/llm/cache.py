@@ -0,0 +1,244 @@
+"""
+Response cache for LLM calls.
+
+The same resume is often parsed more than once (a user re-uploading, the same
+file sent to ``/parse-data`` and then ``/ats-checker``), and every parse is a
+multi-second provider call. Responses are cached under a key made of the
+provider class, its model and a hash of the fully rendered prompt, so a change
+to the prompt template or the model never serves a stale answer.
+
+Two tiers:
+
+    memory   bounded LRU (``utils.cache.LRUCache``) in front of everything
+    disk     SQLite file that survives restarts and is shared by the workers
+             on one host; least recently used rows are dropped past its cap
+
+A disk hit is promoted into memory. Only non-empty responses are stored, and
+the manager drops an entry that turns out to be unusable (e.g. invalid JSON).
+
+Cached responses are parsed resumes, i.e. personal data. The disk tier is
+therefore opt-in: it needs an explicit ``LLM_CACHE_PATH`` (never a shared temp
+directory), the file is created readable by the service user only (0600, in a
+0700 directory when one has to be created), and rows are kept until they
+expire (``LLM_CACHE_TTL``) or are evicted past ``LLM_CACHE_DISK_SIZE``.
+
+Configuration (environment):
+
+    LLM_CACHE               memory (default), disk (memory + SQLite) or off
+    LLM_CACHE_PATH          SQLite file for the disk tier (required for disk)
+    LLM_CACHE_SIZE          responses kept in memory (default 256)
+    LLM_CACHE_DISK_SIZE     responses kept on disk (default 5000)
+    LLM_CACHE_TTL           seconds a response stays valid (default 604800, 0 = forever)
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from utils.cache import LRUCache
+from utils.result_cache import content_key
+
+logger = logging.getLogger(__name__)
+
+
+def response_key(provider: Any, prompt: str) -> str:
+    """Cache key for ``prompt`` sent to ``provider``: provider class, model and prompt hash"""
+    return content_key(type(provider).__name__, getattr(provider, "model_name", ""), prompt)
+
+
+class SQLiteResponseStore:
+    """Disk tier: one row per response, with expiry and last-use time for LRU eviction"""
+
+    def __init__(self, path: str, max_entries: int = 5000, ttl: Optional[float] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        #owner-only before SQLite opens it; the -wal/-shm files inherit these permissions
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(path, 0o600)
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        #WAL lets several API workers read while one writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[tuple]:
+        """``(value, expires_at)`` for a live entry, else None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                self._delete(key)
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            return row
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl else None
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO responses (key, value, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now))
+            if cursor.rowcount:
+                self._count += 1
+            else:
+                self._conn.execute("UPDATE responses SET value = ?, expires_at = ?, last_used = ? WHERE key = ?",
+                                   (value, expires_at, now, key))
+            if self._count > self.max_entries:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then the least recently used ones down to 90% of max_entries"""
+        self._conn.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        excess = count - int(self.max_entries * 0.9)
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_used LIMIT ?)", (excess,))
+        self.evictions += self._count - (count - max(0, excess))
+        self._count = count - max(0, excess)
+
+    def _delete(self, key: str) -> None:
+        if self._conn.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount:
+            self._count -= 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._count = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"path": self.path, "size": self._count, "max_entries": self.max_entries, "evictions": self.evictions}
+
+
+class LLMResponseCache:
+    """Memory LRU in front of an optional SQLite store, with per-tier hit counters"""
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = None,
+                 store: Optional[SQLiteResponseStore] = None):
+        self.ttl = ttl
+        self.store = store
+        self._memory = LRUCache(maxsize=max_entries, ttl=ttl)
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.chars_served = 0
+
+    def get(self, provider: Any, prompt: str) -> Optional[str]:
+        key = response_key(provider, prompt)
+        value = self._memory.get(key, count=False)
+        tier = "memory"
+        if value is None and self.store is not None:
+            try:
+                row = self.store.get(key)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache lookup failed: {e}")
+                row = None
+            if row is not None:
+                value, expires_at = row
+                tier = "disk"
+                self._memory.set(key, value, ttl=None if expires_at is None else max(0.0, expires_at - time.time()))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.chars_served += len(value)
+                if tier == "memory":
+                    self.memory_hits += 1
+                else:
+                    self.disk_hits += 1
+        return value
+
+    def set(self, provider: Any, prompt: str, response: str) -> None:
+        key = response_key(provider, prompt)
+        self._memory.set(key, response)
+        if self.store is not None:
+            try:
+                self.store.set(key, response)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed: {e}")
+        with self._lock:
+            self.stores += 1
+
+    def delete(self, provider: Any, prompt: str) -> None:
+        key = response_key(provider, prompt)
+        self._memory.pop(key)
+        if self.store is not None:
+            self.store.delete(key)
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        memory = self._memory.stats()
+        return {
+            "backend": "disk" if self.store is not None else "memory",
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "chars_served": self.chars_served,
+            "ttl": self.ttl,
+            "memory": {"size": memory["size"], "max_entries": memory["maxsize"], "evictions": memory["evictions"]},
+            "disk": self.store.stats() if self.store is not None else None,
+        }
+
+
+def create_llm_cache() -> Optional[LLMResponseCache]:
+    """Cache configured by LLM_CACHE* env vars (None when disabled)"""
+    backend = os.getenv("LLM_CACHE", "memory").lower()
+    if backend in ("off", "none", "0", "false"):
+        return None
+    ttl = float(os.getenv("LLM_CACHE_TTL", "604800")) or None
+    store = None
+    path = os.getenv("LLM_CACHE_PATH")
+    if backend == "disk" and not path:
+        logger.warning("LLM_CACHE=disk needs LLM_CACHE_PATH; using the memory cache only")
+    elif backend == "disk":
+        try:
+            store = SQLiteResponseStore(path, max_entries=int(os.getenv("LLM_CACHE_DISK_SIZE", "5000")), ttl=ttl)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"LLM disk cache unavailable at {path}, using memory only: {e}")
+    return LLMResponseCache(max_entries=int(os.getenv("LLM_CACHE_SIZE", "256")), ttl=ttl, store=store)
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_created = False
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Process-wide response cache, shared by every LLMManager (it outlives credential rebuilds)"""
+    global _cache, _cache_created
+    with _cache_lock:
+        if not _cache_created:
+            _cache = create_llm_cache()
+            _cache_created = True
+        return _cache
@@ -0,0 +1,128 @@
+"""
+Section chunking for long resumes and academic CVs.
+
+A 10-page CV sent as one prompt produces one huge JSON response: slow, and
+often truncated or invalid. ``chunk_resume`` splits the text into sections at
+their headings and packs consecutive sections into chunks of at most
+``max_tokens`` estimated tokens (a section that alone is larger is split at
+line boundaries, repeating its heading). Each chunk is parsed on its own with
+the same section vocabulary (``SECTION_SCHEMA``), concurrently, and
+``merge_parsed`` folds the partial results back together in chunk order:
+
+    missing key        taken from the first chunk that has it
+    list + list        concatenated, exact duplicates dropped (a dict joining
+                       a list is appended as one more item)
+    dict + dict        merged recursively
+    anything else      the earlier chunk wins
+
+so the result does not depend on which chunk finished first.
+"""
+import json
+import re
+from typing import Any, Dict, List, Tuple
+
+from .limiter import estimate_tokens
+
+#section names every chunk is asked to use, so partial results line up when merged
+SECTION_SCHEMA = (
+    "contact_information", "professional_summary", "work_experience", "education", "technical_skills",
+    "projects", "certifications", "awards", "publications", "research_experience", "teaching_experience",
+    "grants", "presentations", "volunteer_experience", "languages", "references",
+)
+
+HEADING_WORDS = (
+    "summary", "profile", "objective", "about", "experience", "employment", "work history", "education",
+    "academic", "qualifications", "skills", "competencies", "projects", "certifications", "licenses",
+    "awards", "honors", "honours", "achievements", "publications", "papers", "research", "teaching",
+    "grants", "funding", "presentations", "talks", "conferences", "volunteer", "service", "languages",
+    "interests", "references", "patents", "memberships", "activities", "leadership", "courses", "training",
+)
+
+_HEADING_RE = re.compile(r"^[^\w]*(?:" + "|".join(HEADING_WORDS) + r")\b", re.IGNORECASE)
+#qualified headings name the section last: "Work Experience", "Technical Skills"
+_HEADING_END_RE = re.compile(r"\b(?:" + "|".join(HEADING_WORDS) + r")$", re.IGNORECASE)
+
+
+def is_heading(line: str) -> bool:
+    """Short line that starts or ends with a known section name, or an all-caps short line"""
+    line = line.strip().rstrip(":")
+    if not line or len(line) > 48 or len(line.split()) > 5:
+        return False
+    letters = [c for c in line if c.isalpha()]
+    return bool(_HEADING_RE.match(line) or _HEADING_END_RE.search(line)) or (len(letters) >= 4 and all(c.isupper() for c in letters))
+
+
+def split_sections(text: str) -> List[Tuple[str, str]]:
+    """``(heading, body)`` pairs in document order; text before the first heading has heading ''"""
+    sections: List[Tuple[str, List[str]]] = [("", [])]
+    for line in text.split("\n"):
+        if is_heading(line):
+            sections.append((line.strip(), []))
+        else:
+            sections[-1][1].append(line)
+    return [(heading, "\n".join(lines).strip()) for heading, lines in sections if heading or "\n".join(lines).strip()]
+
+
+def _section_text(heading: str, body: str) -> str:
+    return f"{heading}\n{body}".strip() if heading else body
+
+
+def _split_large(heading: str, body: str, max_tokens: int) -> List[str]:
+    """A section over the budget, cut at line boundaries with the heading repeated on each part"""
+    parts, current, used = [], [], estimate_tokens(heading)
+    for line in body.split("\n"):
+        cost = estimate_tokens(line + "\n")
+        if current and used + cost > max_tokens:
+            parts.append(current)
+            current, used = [], estimate_tokens(heading)
+        current.append(line)
+        used += cost
+    if current:
+        parts.append(current)
+    return [_section_text(f"{heading} (continued)" if i and heading else heading, "\n".join(lines))
+            for i, lines in enumerate(parts)]
+
+
+def chunk_resume(text: str, max_tokens: int) -> List[str]:
+    """Consecutive sections packed into chunks of at most ``max_tokens`` estimated tokens"""
+    pieces: List[str] = []
+    for heading, body in split_sections(text):
+        piece = _section_text(heading, body)
+        if estimate_tokens(piece) > max_tokens:
+            pieces.extend(_split_large(heading, body, max_tokens))
+        else:
+            pieces.append(piece)
+
+    chunks: List[str] = []
+    for piece in pieces:
+        if chunks and estimate_tokens(chunks[-1]) + estimate_tokens(piece) <= max_tokens:
+            chunks[-1] = f"{chunks[-1]}\n\n{piece}"
+        else:
+            chunks.append(piece)
+    return chunks
+
+
+def _merge_value(existing: Any, incoming: Any) -> Any:
+    if isinstance(existing, list) and isinstance(incoming, dict):
+        incoming = [incoming]
+    if isinstance(existing, list) and isinstance(incoming, list):
+        seen = {json.dumps(item, sort_keys=True, default=str) for item in existing}
+        merged = list(existing)
+        for item in incoming:
+            key = json.dumps(item, sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                merged.append(item)
+        return merged
+    if isinstance(existing, dict) and isinstance(incoming, dict):
+        return merge_parsed([existing, incoming])
+    return existing
+
+
+def merge_parsed(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Partial parses merged in the order given (see module docstring)"""
+    merged: Dict[str, Any] = {}
+    for part in parts:
+        for key, value in part.items():
+            merged[key] = _merge_value(merged[key], value) if key in merged else value
+    return merged
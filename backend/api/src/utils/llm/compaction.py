@@ -0,0 +1,171 @@
+"""
+Compaction of extracted resume text before it is put into an LLM prompt.
+
+Text extracted from PDFs carries a lot that costs input tokens (latency and
+money) without telling the model anything. ``compact_text`` removes it in
+order:
+
+    normalize     drop zero-width/control characters, turn bullet glyphs into
+                  "- ", collapse runs of spaces and blank lines
+    boilerplate   on a document of at least ``MIN_PAGES`` pages, lines repeated
+                  at the top or bottom of ``MIN_PAGES`` or more pages (running
+                  headers/footers, but not labels ending in ":") are kept
+                  once; page markers such as "Page 2 of 3" or a bare page
+                  number at a page edge are dropped. Pages are separated by a
+                  form feed (``PAGE_BREAK``), which the PDF extractors put
+                  between page texts; blank lines are ordinary paragraph
+                  breaks, so a job title or degree that recurs across entries
+                  is never taken for a header.
+    dedupe        a line of ``min_dup_chars`` or more that repeats an earlier
+                  line exactly is dropped (short lines such as headings or
+                  single skills repeat legitimately and are kept)
+    budget        only when ``token_budget`` is given: past that many
+                  estimated tokens the text is cut at a line boundary and
+                  marked as truncated
+
+``CompactionStats`` sums bytes and tokens saved across calls for /health.
+
+Configuration (environment):
+
+    LLM_PROMPT_COMPACTION       1 (default) or 0 to send the extracted text as-is
+    LLM_PROMPT_TOKEN_BUDGET     max estimated tokens of resume text per prompt (default 0 = no limit);
+                                a truncated parse is logged and flagged ``_truncated`` in its result
+"""
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .limiter import estimate_tokens
+
+_INVISIBLE_RE = re.compile("[\u200b-\u200f\u2060\ufeff\u00ad\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+_SPACES_RE = re.compile("[ \t\u00a0\u2000-\u200a\u202f\u205f\u3000]+")
+_BULLET_RE = re.compile("^[\u2022\u25cf\u25aa\u25a0\u25e6\u2023\u2219\u25cb\u25ba\u25b6\u27a2\u2713\u2714\u2043*\u00b7]+\\s*")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_PAGE_MARKER_RE = re.compile(r"^(?:page\s*\d+(?:\s*(?:of|/)\s*\d+)?|\d+\s*(?:of|/)\s*\d+|-\s*\d+\s*-)$", re.IGNORECASE)
+_PAGE_NUMBER_RE = re.compile(r"^\d{1,3}$")
+
+#separator the extractors put between page texts
+PAGE_BREAK = "\f"
+#lines at each end of a page that count as header/footer candidates
+EDGE_LINES = 2
+#pages a line must head or foot (and pages the document needs) to count as a running header/footer
+MIN_PAGES = 3
+
+
+class CompactionResult(NamedTuple):
+    text: str
+    original_bytes: int
+    compacted_bytes: int
+    original_tokens: int
+    compacted_tokens: int
+    boilerplate_lines: int
+    duplicate_lines: int
+    truncated: bool
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_bytes - self.compacted_bytes
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.compacted_tokens
+
+
+def _normalize_line(line: str) -> str:
+    line = _SPACES_RE.sub(" ", line).strip()
+    return _BULLET_RE.sub("- ", line)
+
+
+def _page_edges(pages: List[List[str]]) -> List[set]:
+    """Indexes of the first and last EDGE_LINES non-empty lines of each page"""
+    edges = []
+    for lines in pages:
+        filled = [i for i, line in enumerate(lines) if line]
+        edges.append(set(filled[:EDGE_LINES] + filled[-EDGE_LINES:]))
+    return edges
+
+
+def compact_text(text: str, token_budget: Optional[int] = None, min_dup_chars: int = 24) -> CompactionResult:
+    """Normalized, de-boilerplated, deduplicated and budgeted copy of ``text``"""
+    original_bytes = len(text.encode("utf-8"))
+    original_tokens = estimate_tokens(text)
+
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    #page breaks are split on before control characters are stripped
+    pages = [[_normalize_line(line) for line in _INVISIBLE_RE.sub("", page).split("\n")]
+             for page in text.split(PAGE_BREAK)]
+    paged = len(pages) > 1
+    edges = _page_edges(pages)
+
+    #a header/footer shows up at the edge of several real pages; each page counts a line once
+    edge_counts = Counter(key for lines, edge in zip(pages, edges) for key in {lines[i].casefold() for i in edge})
+    boilerplate = {key for key, count in edge_counts.items() if count >= MIN_PAGES}
+
+    kept: List[str] = []
+    seen = set()
+    boilerplate_lines = duplicate_lines = 0
+    for lines, edge in zip(pages, edges):
+        for i, line in enumerate(lines):
+            if not line:
+                kept.append("")
+                continue
+            key = line.casefold()
+            if _PAGE_MARKER_RE.match(line) or (paged and i in edge and _PAGE_NUMBER_RE.match(line)):
+                boilerplate_lines += 1
+                continue
+            if key in seen and i in edge and key in boilerplate and not line.endswith(":"):
+                boilerplate_lines += 1
+                continue
+            if key in seen and len(line) >= min_dup_chars:
+                duplicate_lines += 1
+                continue
+            seen.add(key)
+            kept.append(line)
+        kept.append("")
+
+    compacted = _BLANK_LINES_RE.sub("\n\n", "\n".join(kept)).strip()
+    truncated = False
+    if token_budget and estimate_tokens(compacted) > token_budget:
+        lines = compacted.split("\n")
+        used, cut = 0, len(lines)
+        for index, line in enumerate(lines):
+            used += estimate_tokens(line + "\n")
+            if used > token_budget:
+                cut = index
+                break
+        compacted = "\n".join(lines[:cut]).rstrip() + f"\n[... {len(lines) - cut} more lines truncated]"
+        truncated = True
+
+    return CompactionResult(compacted, original_bytes, len(compacted.encode("utf-8")), original_tokens,
+                            estimate_tokens(compacted), boilerplate_lines, duplicate_lines, truncated)
+
+
+class CompactionStats:
+    """Running totals of what compaction saved"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.truncated = 0
+        self.bytes_in = self.bytes_out = 0
+        self.tokens_in = self.tokens_out = 0
+
+    def record(self, result: CompactionResult) -> None:
+        with self._lock:
+            self.calls += 1
+            self.truncated += int(result.truncated)
+            self.bytes_in += result.original_bytes
+            self.bytes_out += result.compacted_bytes
+            self.tokens_in += result.original_tokens
+            self.tokens_out += result.compacted_tokens
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "truncated": self.truncated,
+                "bytes_saved": self.bytes_in - self.bytes_out,
+                "tokens_saved": self.tokens_in - self.tokens_out,
+                "token_reduction": round(1 - self.tokens_out / self.tokens_in, 4) if self.tokens_in else 0.0,
+            }
@@ -0,0 +1,93 @@
+"""
+Incremental parser for the top-level members of a streamed JSON object.
+
+The resume prompt asks for one JSON object whose top-level keys are sections
+(``contact_information``, ``work_experience``, ...). While the response is
+still streaming, ``SectionParser.feed`` returns every member whose value has
+been closed, so a section can be shown long before the whole object is
+complete::
+
+    parser = SectionParser()
+    for chunk in stream:
+        for key, value in parser.feed(chunk):
+            ...
+    parser.text     # everything received, for the usual full parse at the end
+
+Anything before the first ``{`` (e.g. a markdown code fence) and after the
+closing ``}`` is ignored. Only string state and nesting depth are tracked; each
+member is decoded with ``json.loads`` once its closing ``,`` or ``}`` arrives,
+and a member that does not decode is skipped (the final full parse decides).
+"""
+import json
+from typing import Any, List, Tuple
+
+
+class SectionParser:
+    """Yields ``(key, value)`` for each completed top-level member of a streamed JSON object"""
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start = -1
+        self.done = False
+
+    @property
+    def text(self) -> str:
+        """The full response received so far"""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume the next chunk; returns the members it completed, in order"""
+        self._chunks.append(chunk)
+        if self.done:
+            return []
+        self._buffer += chunk
+        completed = []
+        buffer = self._buffer
+        for pos in range(self._pos, len(buffer)):
+            char = buffer[pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    self._member_start = pos + 1
+                continue
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._close_member(buffer[self._member_start:pos], completed)
+                    self.done = True
+                    break
+            elif char == "," and self._depth == 1:
+                self._close_member(buffer[self._member_start:pos], completed)
+                self._member_start = pos + 1
+        #keep only the unfinished member so the buffer never grows past one section
+        start = self._member_start if self._depth and not self.done else len(buffer)
+        self._buffer = buffer[start:]
+        self._pos = len(buffer) - start
+        self._member_start = 0
+        return completed
+
+    @staticmethod
+    def _close_member(member: str, completed: List[Tuple[str, Any]]) -> None:
+        if not member.strip():
+            return
+        try:
+            completed.extend(json.loads("{" + member + "}").items())
+        except json.JSONDecodeError:
+            pass
@@ -0,0 +1,271 @@
+"""
+Per-provider admission control for LLM calls.
+
+Providers enforce per-minute request and token quotas; going over them turns
+into errors that ``LLMManager`` treats as provider failures, so every parse
+in a burst degrades to the regex fallback. ``ProviderLimiter`` admits a call
+only when all of these allow it:
+
+    in-flight cap      at most ``max_in_flight`` calls running at once
+    RPM bucket         requests per minute (token bucket, bursts up to one minute's worth)
+    TPM bucket         prompt tokens per minute, estimated with ``estimate_tokens``;
+                       response tokens are charged when the call is released
+
+When the provider itself answers with a rate-limit/quota error
+(``ProviderRateLimitError``), ``back_off`` stops admitting calls for the
+error's retry-after, or ``backoff`` seconds when it gives none.
+
+Callers that can't be admitted wait in a FIFO queue of at most
+``max_queue`` entries for at most ``max_wait`` seconds. A full queue raises
+``LimiterQueueFull`` and a missed deadline raises ``LimiterTimeout`` (both
+``RateLimitExceeded``), which the manager handles like any other provider
+failure. Sync callers (threads) and async callers share one limiter.
+
+Configuration (environment), per provider with a global fallback, e.g.
+``LLM_GEMINI_RPM`` then ``LLM_RPM``:
+
+    LLM_MAX_IN_FLIGHT       concurrent calls (default 8)
+    LLM_RPM                 requests per minute (default 0 = unlimited)
+    LLM_TPM                 tokens per minute (default 0 = unlimited)
+    LLM_QUEUE_LIMIT         callers allowed to wait (default 64)
+    LLM_QUEUE_TIMEOUT       seconds a caller may wait (default 30)
+    LLM_RATE_LIMIT_BACKOFF  seconds admissions pause after a provider rate-limit error (default 10)
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+
+class RateLimitExceeded(RuntimeError):
+    """A call could not be admitted under the provider's limits"""
+
+
+class LimiterQueueFull(RateLimitExceeded):
+    """Raised when the wait queue is full"""
+
+
+class LimiterTimeout(RateLimitExceeded):
+    """Raised when a caller's deadline passes while it is still queued"""
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Rough token count (~4 characters per token for English prose)"""
+    return (len(text) + 3) // 4 if text else 0
+
+
+class TokenBucket:
+    """Refills continuously at ``per_minute / 60`` per second up to one minute's worth"""
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until ``amount`` (capped at capacity) is available; 0 when it is now"""
+        self._refill()
+        missing = min(amount, self.capacity) - self.tokens
+        return missing / self.rate if missing > 0 else 0.0
+
+    def take(self, amount: float) -> None:
+        """Remove tokens; the balance may go negative, which delays later callers"""
+        self._refill()
+        self.tokens -= amount
+
+
+class _Waiter:
+    __slots__ = ("tokens", "loop", "event")
+
+    def __init__(self, tokens: int, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.tokens = tokens
+        self.loop = loop
+        self.event = asyncio.Event() if loop is not None else threading.Event()
+
+    def wake(self) -> None:
+        if self.loop is None:
+            self.event.set()
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.event.set)
+        except RuntimeError:
+            pass        #the waiter's loop is closed; nobody is left to wake
+
+
+class ProviderLimiter:
+    """In-flight cap plus RPM/TPM token buckets with a bounded FIFO wait queue"""
+
+    def __init__(self, name: str, max_in_flight: int = 8, rpm: float = 0, tpm: float = 0,
+                 max_queue: int = 64, max_wait: float = 30.0, backoff: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue = max(0, max_queue)
+        self.max_wait = max_wait
+        self.backoff = backoff
+        self._clock = clock
+        self._paused_until = 0.0
+        self._rpm = TokenBucket(rpm, clock) if rpm > 0 else None
+        self._tpm = TokenBucket(tpm, clock) if tpm > 0 else None
+        self._queue: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.backoffs = 0
+        self.max_queue_depth = 0
+        self.total_wait = 0.0
+        self.max_wait_seen = 0.0
+        self._recent_waits: Deque[float] = deque(maxlen=512)
+
+    @classmethod
+    def from_env(cls, name: str, env_name: str) -> "ProviderLimiter":
+        """Limits from ``LLM_<ENV_NAME>_<SETTING>``, falling back to ``LLM_<SETTING>``"""
+        def setting(key: str, default: str) -> float:
+            return float(os.getenv(f"LLM_{env_name}_{key}") or os.getenv(f"LLM_{key}") or default)
+
+        return cls(name, max_in_flight=int(setting("MAX_IN_FLIGHT", "8")), rpm=setting("RPM", "0"),
+                   tpm=setting("TPM", "0"), max_queue=int(setting("QUEUE_LIMIT", "64")),
+                   max_wait=setting("QUEUE_TIMEOUT", "30"), backoff=setting("RATE_LIMIT_BACKOFF", "10"))
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        with self._lock:
+            if self._queue and len(self._queue) >= self.max_queue:
+                self.rejected += 1
+                raise LimiterQueueFull(f"{self.name}: {len(self._queue)} calls already waiting")
+            self._queue.append(waiter)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+
+    def _try_admit(self, waiter: _Waiter) -> Tuple[bool, Optional[float]]:
+        """``(admitted, retry_after)``; retry_after is None when only a release or our turn can help"""
+        with self._lock:
+            if self._queue[0] is not waiter or self.in_flight >= self.max_in_flight:
+                return False, None
+            delay = max(self._rpm.delay(1) if self._rpm else 0.0,
+                        self._tpm.delay(waiter.tokens) if self._tpm else 0.0,
+                        self._paused_until - self._clock())
+            if delay > 0:
+                return False, delay
+            if self._rpm:
+                self._rpm.take(1)
+            if self._tpm:
+                self._tpm.take(waiter.tokens)
+            self.in_flight += 1
+            self.admitted += 1
+            self._queue.popleft()
+            if self._queue:
+                self._queue[0].wake()
+            return True, None
+
+    def _leave(self, waiter: _Waiter, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timed_out += 1
+            was_head = bool(self._queue) and self._queue[0] is waiter
+            try:
+                self._queue.remove(waiter)
+            except ValueError:
+                pass
+            if was_head and self._queue:
+                self._queue[0].wake()
+
+    def _record_wait(self, waited: float) -> float:
+        with self._lock:
+            self.total_wait += waited
+            self.max_wait_seen = max(self.max_wait_seen, waited)
+            self._recent_waits.append(waited)
+        return waited
+
+    def _timeout(self, waiter: _Waiter, waited: float) -> LimiterTimeout:
+        self._leave(waiter, timed_out=True)
+        return LimiterTimeout(f"{self.name}: not admitted within {waited:.1f}s")
+
+    def acquire(self, tokens: int = 0, timeout: Optional[float] = None) -> float:
+        """Block until admitted; returns the seconds spent waiting. Pair with ``release``."""
+        waiter = _Waiter(tokens)
+        started = self._clock()
+        deadline = started + (self.max_wait if timeout is None else timeout)
+        self._enqueue(waiter)
+        try:
+            while True:
+                admitted, retry_after = self._try_admit(waiter)
+                if admitted:
+                    return self._record_wait(self._clock() - started)
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise self._timeout(waiter, self._clock() - started)
+                waiter.event.wait(remaining if retry_after is None else min(remaining, retry_after))
+                waiter.event.clear()
+        except BaseException:
+            self._leave(waiter, timed_out=False)
+            raise
+
+    async def acquire_async(self, tokens: int = 0, timeout: Optional[float] = None) -> float:
+        """Async counterpart of ``acquire``; waits without blocking the event loop"""
+        waiter = _Waiter(tokens, asyncio.get_running_loop())
+        started = self._clock()
+        deadline = started + (self.max_wait if timeout is None else timeout)
+        self._enqueue(waiter)
+        try:
+            while True:
+                admitted, retry_after = self._try_admit(waiter)
+                if admitted:
+                    return self._record_wait(self._clock() - started)
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise self._timeout(waiter, self._clock() - started)
+                try:
+                    await asyncio.wait_for(waiter.event.wait(),
+                                           remaining if retry_after is None else min(remaining, retry_after))
+                except asyncio.TimeoutError:
+                    pass
+                waiter.event.clear()
+        except BaseException:
+            self._leave(waiter, timed_out=False)
+            raise
+
+    def release(self, response_tokens: int = 0) -> None:
+        """Free the in-flight slot and charge the response's tokens to the TPM bucket"""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if self._tpm and response_tokens:
+                self._tpm.take(response_tokens)
+            if self._queue:
+                self._queue[0].wake()
+
+    def back_off(self, seconds: Optional[float] = None) -> None:
+        """Admit nothing for ``seconds`` (default ``backoff``) after the provider rate-limited a call"""
+        with self._lock:
+            self.backoffs += 1
+            self._paused_until = max(self._paused_until, self._clock() + (self.backoff if seconds is None else seconds))
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._recent_waits)
+            return {
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self.max_queue_depth,
+                "queue_limit": self.max_queue,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "backoffs": self.backoffs,
+                "paused_ms": round(max(0.0, self._paused_until - self._clock()) * 1000),
+                "mean_wait_ms": round(self.total_wait / self.admitted * 1000, 1) if self.admitted else 0.0,
+                "p95_wait_ms": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0.0,
+                "max_wait_ms": round(self.max_wait_seen * 1000, 1),
+                "rpm_available": round(self._rpm.tokens, 1) if self._rpm else None,
+                "tpm_available": round(self._tpm.tokens) if self._tpm else None,
+            }
@@ -2,20 +2,156 @@
 LLM Manager for handling multiple LLM providers with fallback support
 Handles all parsing logic while keeping LLM providers clean
 """
+import asyncio
+import contextlib
+import hashlib
 import logging
 import json
-from typing import Dict, Any, List, Optional
-from .base import BaseLLMProvider
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from utils.singleflight import SingleFlight
+from .base import BaseLLMProvider, ProviderRateLimitError
+from .cache import get_llm_cache
+from .chunking import SECTION_SCHEMA, chunk_resume, merge_parsed
+from .compaction import CompactionStats, compact_text
+from .json_stream import SectionParser
+from .limiter import ProviderLimiter, RateLimitExceeded, estimate_tokens
+from .resilience import CircuitBreaker, CircuitOpenError, LatencyWindow
 from .providers.gemini import GeminiProvider
 
 logger = logging.getLogger(__name__)
 
+# provider classes whose credentials are watched by get_llm_manager
+PROVIDER_CLASSES = (GeminiProvider,)
+
+
+def credentials_fingerprint() -> str:
+    """Hash of every provider credential currently in the environment (the values never leave this function)"""
+    digest = hashlib.sha256()
+    for provider_class in PROVIDER_CLASSES:
+        for name in provider_class.credential_env:
+            digest.update(f"{name}={os.getenv(name, '')}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+class ProviderGuards(NamedTuple):
+    limiter: ProviderLimiter
+    breaker: CircuitBreaker
+    latency: LatencyWindow
+
+
+class GuardedCall:
+    """One provider call inside ``LLMManager._guarded_call``: the caller acquires, calls the provider and sets ``response``"""
+    
+    def __init__(self, guards: ProviderGuards, prompt: str):
+        self.guards = guards
+        self.tokens = estimate_tokens(prompt)
+        self.response: Optional[str] = None
+        self.started: Optional[float] = None
+    
+    def acquire(self) -> None:
+        self.guards.limiter.acquire(self.tokens)
+        self.started = time.perf_counter()
+    
+    async def acquire_async(self) -> None:
+        await self.guards.limiter.acquire_async(self.tokens)
+        self.started = time.perf_counter()
+    
+    def release(self) -> None:
+        """Free the limiter slot (if one was taken) and charge the response's tokens"""
+        if self.started is not None:
+            self.guards.limiter.release(estimate_tokens(self.response))
+
+
+class HedgedRace:
+    """
+    Bookkeeping of one hedged ``LLMManager._first_success`` run
+    
+    The thread and asyncio versions only start attempts (futures or tasks) and
+    wait on them; which provider goes next, how long to wait before hedging
+    and what the finished attempts mean is decided here.
+    """
+    
+    def __init__(self, manager: "LLMManager", providers: Iterable[BaseLLMProvider]):
+        self.manager = manager
+        self.remaining = list(providers)
+        self.running: Dict[Any, BaseLLMProvider] = {}
+        self.latest: Optional[BaseLLMProvider] = None
+        self.hedged = False
+        self.result: Any = None
+    
+    @property
+    def pending(self) -> bool:
+        return bool(self.remaining or self.running)
+    
+    def launch(self, start: Callable[[BaseLLMProvider], Any], delay: Optional[float] = None) -> None:
+        """Start the next provider; with ``delay`` it is a hedge next to the one still running"""
+        self.latest = self.remaining.pop(0)
+        if delay is not None:
+            self.hedged = True
+            self.manager._count_hedge("fired")
+            logger.info(f"Hedging with {self.latest.get_provider_name()} after {delay:.2f}s")
+        self.running[start(self.latest)] = self.latest
+    
+    def delay(self) -> Optional[float]:
+        """How long to wait on the latest attempt before hedging (None = until it finishes)"""
+        return self.manager._hedge_delay(self.latest) if self.remaining else None
+    
+    def settle(self, done: Iterable[Any]) -> bool:
+        """Take finished attempts out of the race; True (with ``result`` set) once one succeeded"""
+        for attempt in done:
+            provider = self.running.pop(attempt)
+            if attempt.exception() is None:
+                if self.hedged:
+                    self.manager._count_hedge("won" if provider is self.latest else "lost")
+                self.result = attempt.result()
+                return True
+            self.manager._log_failure(provider, attempt.exception())
+        return False
+
+
+CHUNK_NOTE = """**THIS IS PART {index} OF {total} OF A LONGER RESUME:**
+- Extract only what appears in this part; the other parts are parsed separately and merged
+- Use these section names whenever they fit: {schema}
+- Contact details usually appear only in part 1; never invent them for other parts
+
+"""
+
+
+class ParseEvent(NamedTuple):
+    """One step of a streaming parse: a finished ``section``, then ``complete`` with the full result"""
+    kind: str
+    section: Optional[str]
+    data: Any
+
+
 class LLMManager:
     """Manages multiple LLM providers with fallback support and handles parsing logic"""
     
     def __init__(self):
         self.providers: List[BaseLLMProvider] = []
         self.primary_provider: Optional[BaseLLMProvider] = None
+        self.credentials = credentials_fingerprint()
+        self.cache = get_llm_cache()
+        # identical requests already in flight share one upstream call
+        self.inflight = SingleFlight()
+        # per-provider limiter, circuit breaker and latency window
+        self.guards: Dict[str, ProviderGuards] = {}
+        self.hedge_percentile = float(os.getenv("LLM_HEDGE_PERCENTILE", "0"))
+        self.hedge_min_samples = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+        self.hedges = {"fired": 0, "won": 0, "lost": 0}
+        self._hedge_lock = threading.Lock()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self.compaction = CompactionStats() if os.getenv("LLM_PROMPT_COMPACTION", "1") != "0" else None
+        #0 (default) never truncates; a parse that was truncated is flagged "_truncated"
+        self.prompt_token_budget = int(os.getenv("LLM_PROMPT_TOKEN_BUDGET", "0"))
+        # long resumes are parsed as concurrent section chunks when enabled (see chunking.py)
+        self.chunk_threshold = int(os.getenv("LLM_CHUNKED_PARSE_TOKENS", "0"))
+        self.chunk_tokens = int(os.getenv("LLM_CHUNK_TOKENS", "2000"))
+        if self.prompt_token_budget:
+            self.chunk_tokens = min(self.chunk_tokens, self.prompt_token_budget)
         self._initialize_providers()
     
     def _initialize_providers(self):
@@ -54,8 +190,52 @@ class LLMManager:
         """Get list of available provider names"""
         return [provider.get_provider_name() for provider in self.providers]
     
+    def compact_resume_text(self, text: str, token_budget: Optional[int] = None) -> str:
+        """Resume text with extraction noise removed and the token budget (default: LLM_PROMPT_TOKEN_BUDGET) applied"""
+        return self._compact(text, token_budget)[0]
+    
+    def _compact(self, text: str, token_budget: Optional[int] = None) -> Tuple[str, bool]:
+        """Compacted text and whether the token budget cut it short"""
+        if self.compaction is None:
+            return text, False
+        budget = self.prompt_token_budget if token_budget is None else token_budget
+        result = compact_text(text, token_budget=budget or None)
+        self.compaction.record(result)
+        logger.info(f"Compacted resume text: {result.original_tokens} -> {result.compacted_tokens} tokens "
+                    f"({result.bytes_saved} bytes saved)")
+        if result.truncated:
+            logger.warning(f"Resume text truncated to LLM_PROMPT_TOKEN_BUDGET={budget} tokens; "
+                           f"the parse will be flagged _truncated")
+        return result.text, result.truncated
+    
     def format_resume_prompt(self, text: str) -> str:
         """Format the resume text into a flexible prompt for dynamic LLM parsing"""
+        return self._resume_prompt(self.compact_resume_text(text))
+    
+    def resume_chunk_prompts(self, text: str) -> List[str]:
+        """
+        Parse prompts for the resume: one, or one per section chunk for a long resume
+        
+        Chunks are used when LLM_CHUNKED_PARSE_TOKENS is set and the compacted
+        text is longer than that; each chunk stays under LLM_CHUNK_TOKENS (and
+        the prompt token budget) instead of the whole text being truncated.
+        """
+        return self._resume_prompts(text)[0]
+    
+    def _resume_prompts(self, text: str) -> Tuple[List[str], bool]:
+        """``resume_chunk_prompts`` plus whether the text had to be truncated to fit the budget"""
+        if not self.chunk_threshold:
+            compacted, truncated = self._compact(text)
+            return [self._resume_prompt(compacted)], truncated
+        compacted = self.compact_resume_text(text, token_budget=0)
+        if estimate_tokens(compacted) <= self.chunk_threshold:
+            return [self._resume_prompt(compacted)], False
+        chunks = chunk_resume(compacted, self.chunk_tokens)
+        return [self._resume_prompt(chunk, CHUNK_NOTE.format(index=index, total=len(chunks),
+                                                              schema=", ".join(SECTION_SCHEMA)))
+                for index, chunk in enumerate(chunks, 1)], False
+    
+    def _resume_prompt(self, text: str, part_note: str = "") -> str:
         return f"""
 You are an expert resume analyzer with deep understanding of various resume formats and structures.
 
@@ -123,7 +303,7 @@ Analyze the resume text and extract ALL information into a flexible JSON structu
   }}
 }}
 
-**RESUME TEXT TO ANALYZE:**
+{part_note}**RESUME TEXT TO ANALYZE:**
 {text}
 
 **OUTPUT (JSON ONLY - include only sections with actual data):**
@@ -163,11 +343,8 @@ Analyze the resume text and extract ALL information into a flexible JSON structu
         if not isinstance(data, dict):
             return data
         
-        print(f"before cleaning: {data}")
-        
         cleaned = {}
         for key, value in data.items():
-            print(f"Processing key '{key}' with value: {value} (type: {type(value)})")
             if value is not None and value != "" and value != []:
                 if isinstance(value, dict):
                     cleaned_value = self._clean_empty_fields(value)
@@ -183,7 +360,6 @@ Analyze the resume text and extract ALL information into a flexible JSON structu
                         cleaned[key] = cleaned_list
                 else:
                     cleaned[key] = value
-        print(f"AFTER cleaning: {cleaned}")
         return cleaned
     
     
@@ -210,6 +386,214 @@ Analyze the resume text and extract ALL information into a flexible JSON structu
         # return cleaned
 
 
+    def _guards(self, provider: BaseLLMProvider) -> ProviderGuards:
+        """Limiter, breaker and latency window of a provider, created on first use (see limiter.py, resilience.py)"""
+        name = provider.get_provider_name()
+        guards = self.guards.get(name)
+        if guards is None:
+            env_name = type(provider).__name__.upper().replace("PROVIDER", "") or "DEFAULT"
+            guards = self.guards.setdefault(name, ProviderGuards(
+                ProviderLimiter.from_env(name, env_name),
+                CircuitBreaker(name, failure_threshold=int(os.getenv("LLM_BREAKER_FAILURES", "5")),
+                               reset_timeout=float(os.getenv("LLM_BREAKER_RESET", "30")),
+                               half_open_probes=int(os.getenv("LLM_BREAKER_PROBES", "1"))),
+                LatencyWindow()))
+        return guards
+    
+    def limiter_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth, wait times and bucket levels per provider"""
+        return {name: guards.limiter.stats() for name, guards in self.guards.items()}
+    
+    def breaker_stats(self) -> Dict[str, Any]:
+        """Breaker state and recent latency per provider, plus hedging counters"""
+        return {
+            "providers": {name: {**guards.breaker.stats(), "latency": guards.latency.stats()}
+                          for name, guards in self.guards.items()},
+            "hedging": {"percentile": self.hedge_percentile or None, **self.hedges},
+        }
+    
+    def _admit(self, provider: BaseLLMProvider) -> ProviderGuards:
+        guards = self._guards(provider)
+        if not guards.breaker.allow():
+            raise CircuitOpenError(f"circuit open for {provider.get_provider_name()}")
+        return guards
+    
+    def _cached(self, provider: BaseLLMProvider, prompt: str) -> Optional[str]:
+        """Cached response for the prompt, if any (lookups are local and sub-millisecond)"""
+        if self.cache is None:
+            return None
+        cached = self.cache.get(provider, prompt)
+        if cached is not None:
+            logger.info(f"LLM cache hit for {provider.get_provider_name()}")
+        return cached
+    
+    @contextlib.contextmanager
+    def _guarded_call(self, provider: BaseLLMProvider, prompt: str) -> Iterator[GuardedCall]:
+        """
+        Breaker, limiter, latency and cache bookkeeping around one provider call
+        
+        The body acquires the limiter through the yielded ``GuardedCall`` and
+        sets its ``response``; a non-empty response is timed and cached.
+        """
+        guards = self._admit(provider)
+        call = GuardedCall(guards, prompt)
+        ok = None
+        try:
+            yield call
+            ok = bool(call.response)
+            if ok:
+                guards.latency.add(time.perf_counter() - call.started)
+        except RateLimitExceeded:
+            raise       #never reached the provider: says nothing about its health
+        except ProviderRateLimitError as e:
+            ok = False      #the provider is over its quota: count it and pause admissions
+            guards.limiter.back_off(e.retry_after)
+            raise
+        except Exception:
+            ok = False
+            raise
+        finally:
+            call.release()
+            #a cancelled call (the losing side of a hedge, a client gone mid-stream) leaves ok as None
+            guards.breaker.record(ok)
+        if ok and self.cache is not None:
+            self.cache.set(provider, prompt, call.response)
+    
+    def _generate(self, provider: BaseLLMProvider, prompt: str) -> Optional[str]:
+        """Provider response for the prompt, served from the response cache when possible"""
+        cached = self._cached(provider, prompt)
+        if cached is not None:
+            return cached
+        with self._guarded_call(provider, prompt) as call:
+            call.acquire()
+            call.response = provider.generate_text(prompt)
+        return call.response
+    
+    async def _generate_async(self, provider: BaseLLMProvider, prompt: str) -> Optional[str]:
+        """Async counterpart of ``_generate``"""
+        cached = self._cached(provider, prompt)
+        if cached is not None:
+            return cached
+        with self._guarded_call(provider, prompt) as call:
+            await call.acquire_async()
+            call.response = await provider.generate_text_async(prompt)
+        return call.response
+    
+    def _forget(self, provider: BaseLLMProvider, prompt: str) -> None:
+        """Drop a cached response that turned out to be unusable so the next call asks the provider again"""
+        if self.cache is not None:
+            self.cache.delete(provider, prompt)
+    
+    def _hedge_delay(self, provider: BaseLLMProvider) -> Optional[float]:
+        """Seconds to wait on ``provider`` before also starting the next one (None = don't hedge)"""
+        if not self.hedge_percentile:
+            return None
+        latency = self._guards(provider).latency
+        if len(latency) < self.hedge_min_samples:
+            return None
+        return latency.percentile(self.hedge_percentile)
+    
+    @staticmethod
+    def _log_failure(provider: BaseLLMProvider, error: BaseException) -> None:
+        logger.error(f"Provider {provider.get_provider_name()} failed: {error}")
+    
+    def _first_success(self, providers: List[BaseLLMProvider], attempt: Callable[[BaseLLMProvider], Any]) -> Any:
+        """
+        Result of the first provider whose ``attempt`` returns (raising means failure)
+        
+        Providers are tried in order. With hedging on, the next provider is also
+        started once the running one outlives its latency percentile, and the
+        first success wins. Returns None when every provider failed.
+        """
+        if not self._hedging(providers):
+            for provider in providers:
+                try:
+                    return attempt(provider)
+                except Exception as e:
+                    self._log_failure(provider, e)
+            return None
+        
+        def start(provider: BaseLLMProvider) -> Future:
+            return self._hedge_pool().submit(attempt, provider)
+        
+        race = HedgedRace(self, providers)
+        while race.pending:
+            if not race.running:
+                race.launch(start)
+            delay = race.delay()
+            done, _ = wait(list(race.running), timeout=delay, return_when=FIRST_COMPLETED)
+            if not done:
+                race.launch(start, delay)
+            elif race.settle(done):
+                return race.result
+        return None
+    
+    async def _first_success_async(self, providers: List[BaseLLMProvider],
+                                   attempt: Callable[[BaseLLMProvider], Awaitable[Any]]) -> Any:
+        """Async counterpart of ``_first_success``; hedges run as tasks and the losers are cancelled"""
+        if not self._hedging(providers):
+            for provider in providers:
+                try:
+                    return await attempt(provider)
+                except Exception as e:
+                    self._log_failure(provider, e)
+            return None
+        
+        def start(provider: BaseLLMProvider) -> asyncio.Future:
+            return asyncio.ensure_future(attempt(provider))
+        
+        race = HedgedRace(self, providers)
+        try:
+            while race.pending:
+                if not race.running:
+                    race.launch(start)
+                delay = race.delay()
+                done, _ = await asyncio.wait(list(race.running), timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    race.launch(start, delay)
+                elif race.settle(done):
+                    return race.result
+            return None
+        finally:
+            for task in race.running:
+                task.cancel()
+    
+    def _hedging(self, providers: List[BaseLLMProvider]) -> bool:
+        return bool(self.hedge_percentile) and len(providers) > 1
+    
+    def _count_hedge(self, outcome: str) -> None:
+        with self._hedge_lock:
+            self.hedges[outcome] += 1
+    
+    def _hedge_pool(self) -> ThreadPoolExecutor:
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm-hedge")
+            return self._hedge_executor
+    
+    def _parse_order(self, preferred_provider: Optional[str] = None) -> List[BaseLLMProvider]:
+        """Providers to try when parsing: the preferred one first (if any), then the others in order, each once"""
+        preferred = [p for p in self.providers if preferred_provider and p.get_provider_name() == preferred_provider][:1]
+        return preferred + [p for p in self.providers if p not in preferred]
+    
+    def _parse_response(self, response_text: str, provider: BaseLLMProvider) -> Dict[str, Any]:
+        """Clean, decode and validate one provider's parsing response"""
+        clean_response = self._clean_llm_response(response_text)
+        parsed_data = json.loads(clean_response)
+        return self._validate_parsed_data(parsed_data, provider.get_provider_name())
+    
+    def _parsed(self, provider: BaseLLMProvider, prompt: str, response_text: Optional[str]) -> Dict[str, Any]:
+        if not response_text:
+            raise ValueError(f"{provider.get_provider_name()} returned an empty response")
+        try:
+            result = self._parse_response(response_text, provider)
+        except json.JSONDecodeError:
+            logger.error(f"{provider.get_provider_name()} returned invalid JSON ({len(response_text)} chars)")
+            self._forget(provider, prompt)
+            raise
+        logger.info(f"Resume parsed successfully by: {provider.get_provider_name()}")
+        return result
+
     def parse_resume_with_llm(self, text: str, preferred_provider: Optional[str] = None) -> Dict[str, Any]:
         """
         Parse resume using LLM with fallback support
@@ -227,55 +611,202 @@ Analyze the resume text and extract ALL information into a flexible JSON structu
         if not self.providers:
             raise RuntimeError("No LLM providers available")
         
-        # Create the prompt using manager's logic
-        prompt = self.format_resume_prompt(text)
+        # Create the prompt(s) using manager's logic
+        prompts, truncated = self._resume_prompts(text)
+        result = self.inflight.do(("parse", tuple(prompts), preferred_provider),
+                                  lambda: self._parse_prompts(prompts, preferred_provider))
+        return self._flag_truncated(result, truncated)
+    
+    @staticmethod
+    def _flag_truncated(result: Dict[str, Any], truncated: bool) -> Dict[str, Any]:
+        """The parse marked ``_truncated`` when its resume text was cut to the prompt token budget"""
+        return {**result, "_truncated": True} if truncated else result
+    
+    def _parse_prompts(self, prompts: List[str], preferred_provider: Optional[str]) -> Dict[str, Any]:
+        if len(prompts) == 1:
+            return self._parse_prompt(prompts[0], preferred_provider)
+        with ThreadPoolExecutor(max_workers=len(prompts), thread_name_prefix="llm-chunk") as pool:
+            def outcomes_of(indexes: List[int]) -> List[Any]:
+                futures = [pool.submit(self._parse_prompt, prompts[index], preferred_provider) for index in indexes]
+                return [future.exception() or future.result() for future in futures]
+            
+            outcomes = outcomes_of(list(range(len(prompts))))
+            retry = self._chunks_to_retry(outcomes)
+            for index, outcome in zip(retry, outcomes_of(retry)):
+                outcomes[index] = outcome
+        return self._merge_chunks(outcomes)
+    
+    @staticmethod
+    def _chunks_to_retry(outcomes: List[Any]) -> List[int]:
+        """Indexes of failed chunks worth one more attempt (none when every chunk failed)"""
+        failed = [index for index, outcome in enumerate(outcomes) if not isinstance(outcome, dict)]
+        if failed and len(failed) < len(outcomes):
+            logger.warning(f"{len(failed)} of {len(outcomes)} resume chunks failed to parse; retrying them once")
+            return failed
+        return []
+    
+    @staticmethod
+    def _merge_chunks(outcomes: List[Any]) -> Dict[str, Any]:
+        """
+        Chunk results merged in chunk order
         
-        # Try preferred provider first if specified
-        if preferred_provider:
-            for provider in self.providers:
-                if provider.get_provider_name() == preferred_provider:
-                    try:
-                        response_text = provider.generate_text(prompt)
-                        
-                        # Clean and parse the response using manager's logic
-                        clean_response = self._clean_llm_response(response_text)
-                        parsed_data = json.loads(clean_response)
-                        
-                        # Validate and return
-                        result = self._validate_parsed_data(parsed_data, provider.get_provider_name())
-                        logger.info(f"Resume parsed successfully by preferred provider: {provider.get_provider_name()}")
-                        return result
-                        
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON decode error from {provider.get_provider_name()}: {e}")
-                        logger.error(f"Raw response: {response_text}")
-                    except Exception as e:
-                        logger.error(f"Preferred provider {provider.get_provider_name()} failed: {e}")
-                    break
+        Chunks that failed even after their retry are left out and listed (by
+        part number, as in the prompt's "PART n OF m") in ``_partial_chunks``,
+        so callers can tell that sections may be missing.
+        """
+        parts = [outcome for outcome in outcomes if isinstance(outcome, dict)]
+        if not parts:
+            raise RuntimeError("All LLM providers failed to parse the resume")
+        merged = merge_parsed(parts)
+        failed = [number for number, outcome in enumerate(outcomes, 1) if not isinstance(outcome, dict)]
+        if failed:
+            logger.warning(f"Resume parts {failed} of {len(outcomes)} failed to parse; result flagged _partial_chunks")
+            merged["_partial_chunks"] = failed
+        logger.info(f"Merged {len(parts)} resume chunks")
+        return merged
+    
+    def _parse_prompt(self, prompt: str, preferred_provider: Optional[str]) -> Dict[str, Any]:
+        result = self._first_success(self._parse_order(preferred_provider),
+                                     lambda provider: self._parsed(provider, prompt, self._generate(provider, prompt)))
+        if result is None:
+            raise RuntimeError("All LLM providers failed to parse the resume")
+        return result
+    
+    async def parse_resume_with_llm_async(self, text: str, preferred_provider: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async counterpart of ``parse_resume_with_llm``; awaits each provider's async client
         
-        # Try providers in order
-        for provider in self.providers:
+        Raises:
+            RuntimeError: If no providers are available or all fail
+        """
+        if not self.providers:
+            raise RuntimeError("No LLM providers available")
+        
+        prompts, truncated = self._resume_prompts(text)
+        result = await self.inflight.do_async(("parse", tuple(prompts), preferred_provider),
+                                              lambda: self._parse_prompts_async(prompts, preferred_provider))
+        return self._flag_truncated(result, truncated)
+    
+    async def _parse_prompts_async(self, prompts: List[str], preferred_provider: Optional[str]) -> Dict[str, Any]:
+        if len(prompts) == 1:
+            return await self._parse_prompt_async(prompts[0], preferred_provider)
+        outcomes = list(await asyncio.gather(*(self._parse_prompt_async(prompt, preferred_provider) for prompt in prompts),
+                                             return_exceptions=True))
+        retry = self._chunks_to_retry(outcomes)
+        retried = await asyncio.gather(*(self._parse_prompt_async(prompts[index], preferred_provider) for index in retry),
+                                       return_exceptions=True)
+        for index, outcome in zip(retry, retried):
+            outcomes[index] = outcome
+        return self._merge_chunks(outcomes)
+    
+    async def _parse_prompt_async(self, prompt: str, preferred_provider: Optional[str]) -> Dict[str, Any]:
+        async def attempt(provider: BaseLLMProvider) -> Dict[str, Any]:
+            return self._parsed(provider, prompt, await self._generate_async(provider, prompt))
+        
+        result = await self._first_success_async(self._parse_order(preferred_provider), attempt)
+        if result is None:
+            raise RuntimeError("All LLM providers failed to parse the resume")
+        return result
+    
+    async def _stream_async(self, provider: BaseLLMProvider, prompt: str) -> AsyncIterator[str]:
+        """Streaming counterpart of ``_generate_async``: a cached response arrives as one chunk"""
+        cached = self._cached(provider, prompt)
+        if cached is not None:
+            yield cached
+            return
+        with self._guarded_call(provider, prompt) as call:
+            await call.acquire_async()
+            chunks: List[str] = []
             try:
-                response_text = provider.generate_text(prompt)
-                
-                # Clean and parse the response using manager's logic
-                clean_response = self._clean_llm_response(response_text)
-                parsed_data = json.loads(clean_response)
-                
-                # Validate and return
-                result = self._validate_parsed_data(parsed_data, provider.get_provider_name())
-                logger.info(f"Resume parsed successfully by: {provider.get_provider_name()}")
-                return result
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error from {provider.get_provider_name()}: {e}")
-                logger.error(f"Raw response: {response_text}")
-                continue
-            except Exception as e:
-                logger.error(f"Provider {provider.get_provider_name()} failed: {e}")
-                continue
+                async for chunk in provider.stream_text_async(prompt):
+                    chunks.append(chunk)
+                    yield chunk
+            finally:
+                call.response = "".join(chunks)
+    
+    async def parse_resume_with_llm_stream(self, text: str, preferred_provider: Optional[str] = None
+                                           ) -> AsyncIterator[ParseEvent]:
+        """
+        Parse resume while the response streams, yielding each top-level section as soon as it closes
         
-        raise RuntimeError("All LLM providers failed to parse the resume")
+        The first provider in parse order is streamed through ``SectionParser``;
+        once the response is complete it is validated exactly like
+        ``parse_resume_with_llm``. If the stream fails, the non-streaming parse
+        (with its fallback providers) finishes the job and any sections not yet
+        sent are yielded from its result. A resume split into chunks (see
+        ``resume_chunk_prompts``) is parsed concurrently without streaming and
+        its merged sections are yielded at the end.
+        
+        Args:
+            text: Resume text to parse
+            preferred_provider: Name of preferred provider (optional)
+            
+        Yields:
+            ParseEvent("section", name, value) per section, then ParseEvent("complete", None, result)
+            
+        Raises:
+            RuntimeError: If no providers are available or all fail
+        """
+        if not self.providers:
+            raise RuntimeError("No LLM providers available")
+        
+        prompts, truncated = self._resume_prompts(text)
+        sent = set()
+        if len(prompts) > 1:
+            #chunks are parsed concurrently and merged in order, so sections arrive once all chunks are done
+            result = await self._parse_prompts_async(prompts, preferred_provider)
+            for key, value in result.items():
+                if not key.startswith("_"):
+                    yield ParseEvent("section", key, value)
+            yield ParseEvent("complete", None, result)
+            return
+        
+        prompt = prompts[0]
+        provider = self._parse_order(preferred_provider)[0]
+        try:
+            parser = SectionParser()
+            async for chunk in self._stream_async(provider, prompt):
+                for key, value in parser.feed(chunk):
+                    value = self._clean_empty_fields({key: value}).get(key)
+                    if value is not None and key not in sent:
+                        sent.add(key)
+                        yield ParseEvent("section", key, value)
+            result = self._parsed(provider, prompt, parser.text)
+        except Exception as e:
+            self._log_failure(provider, e)
+            result = await self.inflight.do_async(("parse", tuple(prompts), preferred_provider),
+                                                  lambda: self._parse_prompt_async(prompt, preferred_provider))
+        
+        for key, value in result.items():
+            if key not in sent and not key.startswith("_"):
+                yield ParseEvent("section", key, value)
+        yield ParseEvent("complete", None, self._flag_truncated(result, truncated))
+    
+    def _generation_order(self, preferred_provider: Optional[str] = None) -> List[BaseLLMProvider]:
+        """Preferred provider (case-insensitive) first, the rest as fallback; default order otherwise"""
+        providers_to_try = []
+        if preferred_provider:
+            for provider in self.providers:
+                if provider.get_provider_name().lower() == preferred_provider.lower():
+                    providers_to_try.append(provider)
+                    break
+        providers_to_try.extend([p for p in self.providers if p not in providers_to_try])
+        return providers_to_try
+    
+    @staticmethod
+    def _generation_result(content: Optional[str], provider_used: Optional[str], error: Optional[str]) -> Dict[str, Any]:
+        return {
+            "success": error is None,
+            "content": content,
+            "provider_used": provider_used,
+            "error": error
+        }
+    
+    def _generated(self, provider: BaseLLMProvider, response: Optional[str]) -> Dict[str, Any]:
+        if not response:
+            raise ValueError("empty response")
+        logger.info(f"Text generation successful with provider: {provider.get_provider_name()}")
+        return self._generation_result(response, provider.get_provider_name(), None)
     
     def generate_text(self, prompt: str, preferred_provider: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -293,58 +824,69 @@ Analyze the resume text and extract ALL information into a flexible JSON structu
                 - error: Error message if generation failed
         """
         if not self.providers:
-            return {
-                "success": False,
-                "content": None,
-                "provider_used": None,
-                "error": "No LLM providers available"
-            }
-        
-        # Determine provider order
-        providers_to_try = []
-        
-        if preferred_provider:
-            # Try preferred provider first
-            for provider in self.providers:
-                if provider.get_provider_name().lower() == preferred_provider.lower():
-                    providers_to_try.append(provider)
-                    break
-            # Add other providers as fallback
-            providers_to_try.extend([p for p in self.providers if p not in providers_to_try])
-        else:
-            # Use default order (primary first)
-            providers_to_try = self.providers.copy()
+            return self._generation_result(None, None, "No LLM providers available")
+        return self.inflight.do(("generate", prompt, preferred_provider),
+                                lambda: self._generate_with_fallback(prompt, preferred_provider))
+    
+    def _generate_with_fallback(self, prompt: str, preferred_provider: Optional[str]) -> Dict[str, Any]:
+        def attempt(provider: BaseLLMProvider) -> Dict[str, Any]:
+            logger.info(f"Attempting text generation with provider: {provider.get_provider_name()}")
+            return self._generated(provider, self._generate(provider, prompt))
         
-        # Try each provider
-        for provider in providers_to_try:
-            try:
-                logger.info(f"Attempting text generation with provider: {provider.get_provider_name()}")
-                
-                response = provider.generate_text(prompt)
-                
-                if response:
-                    logger.info(f"Text generation successful with provider: {provider.get_provider_name()}")
-                    return {
-                        "success": True,
-                        "content": response,
-                        "provider_used": provider.get_provider_name(),
-                        "error": None
-                    }
-                else:
-                    logger.warning(f"Provider {provider.get_provider_name()} returned empty response")
-                    continue
-                    
-            except Exception as e:
-                logger.error(f"Provider {provider.get_provider_name()} failed: {e}")
-                continue
+        result = self._first_success(self._generation_order(preferred_provider), attempt)
+        return result or self._generation_result(None, None, "All LLM providers failed to generate text")
+    
+    async def generate_text_async(self, prompt: str, preferred_provider: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async counterpart of ``generate_text``; same fallback order and result dict
+        """
+        if not self.providers:
+            return self._generation_result(None, None, "No LLM providers available")
+        return await self.inflight.do_async(("generate", prompt, preferred_provider),
+                                            lambda: self._generate_with_fallback_async(prompt, preferred_provider))
+    
+    async def _generate_with_fallback_async(self, prompt: str, preferred_provider: Optional[str]) -> Dict[str, Any]:
+        async def attempt(provider: BaseLLMProvider) -> Dict[str, Any]:
+            logger.info(f"Attempting text generation with provider: {provider.get_provider_name()}")
+            return self._generated(provider, await self._generate_async(provider, prompt))
         
-        return {
-            "success": False,
-            "content": None,
-            "provider_used": None,
-            "error": "All LLM providers failed to generate text"
-        }
+        result = await self._first_success_async(self._generation_order(preferred_provider), attempt)
+        return result or self._generation_result(None, None, "All LLM providers failed to generate text")
+    
     
     def get_primary_provider_name(self) -> Optional[str]:
         """Get the name of the primary provider"""
         return self.primary_provider.get_provider_name() if self.primary_provider else None
+
+
+_manager: Optional[LLMManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_llm_manager(refresh: bool = False) -> LLMManager:
+    """
+    Process-wide LLMManager, built on first use
+    
+    Providers (and their clients and connections) are created once and shared
+    by every request. The manager is rebuilt when a provider credential in the
+    environment changes, or when ``refresh`` is set; providers added to it with
+    ``add_provider`` are not carried over.
+    
+    Args:
+        refresh: Rebuild the manager even if credentials are unchanged
+        
+    Returns:
+        The shared manager
+    """
+    global _manager
+    fingerprint = credentials_fingerprint()
+    manager = _manager
+    if manager is not None and not refresh and manager.credentials == fingerprint:
+        return manager
+    
+    with _manager_lock:
+        if refresh or _manager is None or _manager.credentials != fingerprint:
+            if _manager is not None:
+                logger.info("Rebuilding LLM manager (credentials changed or refresh requested)")
+            _manager = LLMManager()
+        return _manager
@@ -1,20 +1,27 @@
 """
 Gemini LLM Provider - Clean interface for Google's Gemini API
 """
+import asyncio
 import os
 import logging
-from typing import Optional
-import google.generativeai as genai
-from ..base import BaseLLMProvider
+import weakref
+from typing import AsyncIterator, Optional
+from ..base import BaseLLMProvider, ProviderRateLimitError
 
 logger = logging.getLogger(__name__)
 
 class GeminiProvider(BaseLLMProvider):
     """Clean Gemini provider that only handles model communication"""
     
+    credential_env = ('GOOGLE_API_KEY', 'GEMINI_API_KEY')
+    model_name = 'gemini-1.5-flash'
+    
     def __init__(self):
         super().__init__()
         self.model = None
+        self._genai = None
+        # per event loop: a model with its own async client (see _async_model)
+        self._async_models = weakref.WeakKeyDictionary()
         self._is_available = False
         self._initialize()
     
@@ -33,8 +40,11 @@ class GeminiProvider(BaseLLMProvider):
             key_source = "GOOGLE_API_KEY" if os.getenv('GOOGLE_API_KEY') else "GEMINI_API_KEY"
             logger.debug(f"Using API key from: {key_source}")
             
+            import google.generativeai as genai     # ~0.6s to import, so only once a key is configured
+
             genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel('gemini-1.5-flash')
+            self._genai = genai
+            self.model = genai.GenerativeModel(self.model_name)
             self._is_available = True
             logger.info("Gemini provider initialized successfully")
             
@@ -48,7 +58,7 @@ class GeminiProvider(BaseLLMProvider):
     
     def get_provider_name(self) -> str:
         """Get the provider name"""
-        return "Gemini (gemini-1.5-flash)"
+        return f"Gemini ({self.model_name})"
     
     def generate_text(self, prompt: str) -> Optional[str]:
         """
@@ -59,6 +69,9 @@ class GeminiProvider(BaseLLMProvider):
             
         Returns:
             Generated text response or None if failed
+            
+        Raises:
+            ProviderRateLimitError: Gemini rejected the call for rate or quota limits
         """
         if not self.is_available() or not self.model:
             logger.error("Gemini provider not available")
@@ -67,14 +80,112 @@ class GeminiProvider(BaseLLMProvider):
         try:
             logger.debug(f"Sending prompt to Gemini (length: {len(prompt)} chars)")
             response = self.model.generate_content(prompt)
+            return self._response_text(response)
+                
+        except Exception as e:
+            self._raise_if_rate_limited(e)
+            logger.error(f"Error generating text with Gemini: {e}")
+            return None
+    
+    async def generate_text_async(self, prompt: str) -> Optional[str]:
+        """
+        Generate text using Gemini's async (grpc.aio) client
+        
+        Args:
+            prompt: The input prompt for the model
             
-            if response and response.text:
-                logger.debug(f"Received response from Gemini (length: {len(response.text)} chars)")
-                return response.text.strip()
-            else:
-                logger.warning("Empty response from Gemini")
-                return None
+        Returns:
+            Generated text response or None if failed
+            
+        Raises:
+            ProviderRateLimitError: Gemini rejected the call for rate or quota limits
+        """
+        if not self.is_available() or not self.model:
+            logger.error("Gemini provider not available")
+            return None
+        
+        try:
+            logger.debug(f"Sending prompt to Gemini async (length: {len(prompt)} chars)")
+            response = await self._async_model().generate_content_async(prompt)
+            return self._response_text(response)
                 
         except Exception as e:
+            self._raise_if_rate_limited(e)
             logger.error(f"Error generating text with Gemini: {e}")
             return None
+    
+    async def stream_text_async(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream the response using Gemini's async streaming API
+        
+        Args:
+            prompt: The input prompt for the model
+            
+        Yields:
+            Text chunks in the order Gemini produces them
+        """
+        if not self.is_available() or not self.model:
+            raise RuntimeError("Gemini provider not available")
+        
+        logger.debug(f"Streaming prompt to Gemini (length: {len(prompt)} chars)")
+        try:
+            response = await self._async_model().generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                try:
+                    text = chunk.text
+                except ValueError:      # a chunk without text parts (e.g. only a finish reason)
+                    continue
+                if text:
+                    yield text
+        except Exception as e:
+            self._raise_if_rate_limited(e)
+            raise
+    
+    def _async_model(self):
+        """
+        Model with an async client of its own for the running event loop
+        
+        google.generativeai hands every model one process-wide async client, and
+        its grpc.aio channel is bound to the loop that first used it. A second
+        loop (a worker thread, ``asyncio.run`` in a script) gets its own client
+        and channel here, reused for every call on that loop.
+
+        This relies on the private ``client._client_manager`` of the exact
+        google-generativeai version pinned in requirements.txt / pyproject.toml.
+        Should it be missing, the shared model is used as is (one loop only).
+        """
+        loop = asyncio.get_running_loop()
+        model = self._async_models.get(loop)
+        if model is None:
+            from google.generativeai import client as genai_client
+            make_client = getattr(getattr(genai_client, "_client_manager", None), "make_client", None)
+            if make_client is None:
+                logger.warning("google.generativeai has no _client_manager.make_client; using its shared async client")
+                model = self.model
+            else:
+                model = self._genai.GenerativeModel(self.model_name)
+                # same configuration as the default client, but a new instance (make_client never caches)
+                model._async_client = make_client("generative_async")
+            self._async_models[loop] = model
+        return model
+    
+    @staticmethod
+    def _raise_if_rate_limited(error: Exception) -> None:
+        """Re-raise 429/quota errors as ProviderRateLimitError so the limiter and breaker can react"""
+        try:
+            from google.api_core.exceptions import ResourceExhausted, TooManyRequests
+            limited = isinstance(error, (ResourceExhausted, TooManyRequests))
+        except ImportError:
+            limited = False
+        message = str(error).lower()
+        if limited or "429" in message or "quota" in message or "rate limit" in message:
+            logger.warning(f"Gemini rate limited the request: {error}")
+            raise ProviderRateLimitError(f"Gemini rate limited the request: {error}") from error
+    
+    @staticmethod
+    def _response_text(response) -> Optional[str]:
+        if response and response.text:
+            logger.debug(f"Received response from Gemini (length: {len(response.text)} chars)")
+            return response.text.strip()
+        logger.warning("Empty response from Gemini")
+        return None
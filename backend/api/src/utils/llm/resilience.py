@@ -0,0 +1,127 @@
+"""
+Circuit breakers and latency tracking for LLM providers.
+
+``LLMManager`` tries providers in order. Without these, a provider that is
+down or very slow costs its full timeout on every request before the next
+provider (or the regex fallback) gets a turn.
+
+    CircuitBreaker   opens after ``failure_threshold`` consecutive failures and
+                     then rejects calls immediately; after ``reset_timeout``
+                     seconds it lets ``half_open_probes`` trial calls through -
+                     a success closes it, a failure opens it again
+    LatencyWindow    recent successful call latencies; the manager hedges
+                     (starts the next provider while the first is still
+                     running) once a call outlives the configured percentile
+
+Configuration (environment):
+
+    LLM_BREAKER_FAILURES      consecutive failures that open a breaker (default 5)
+    LLM_BREAKER_RESET         seconds before an open breaker lets a probe through (default 30)
+    LLM_BREAKER_PROBES        concurrent probes while half-open (default 1)
+    LLM_HEDGE_PERCENTILE      latency percentile that triggers a hedge, e.g. 95 (default 0 = off)
+    LLM_HEDGE_MIN_SAMPLES     latencies needed before a provider is hedged (default 20)
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose breaker is open"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with timed half-open probes"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 half_open_probes: int = 1, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = max(1, half_open_probes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probes = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; every allowed call must be followed by ``record``"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if self._clock() - self.opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self._probes = 0
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    self.rejected += 1
+                    return False
+                self._probes += 1
+            return True
+
+    def record(self, ok: Optional[bool]) -> None:
+        """Outcome of an allowed call; None (cancelled, never sent) leaves the breaker as it was"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+            if ok is None:
+                return
+            if ok:
+                self.state = self.CLOSED
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self.opened_at = self._clock()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+class LatencyWindow:
+    """Latencies (seconds) of the most recent successful calls"""
+
+    def __init__(self, size: int = 200):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+    def stats(self) -> Dict[str, Any]:
+        p50, p95 = self.percentile(50), self.percentile(95)
+        return {
+            "samples": len(self),
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+        }
@@ -0,0 +1,83 @@
+"""
+Startup readiness tracking.
+
+The server starts listening before its models are loaded (see the warm-up in
+``app.py``). Each warm-up step is recorded here as a named check with its
+outcome, detail and duration. The service is ready once warm-up has finished
+and every *required* check passed. Liveness (``/healthz``) only says the
+process is serving; readiness (``/readyz``) is what load balancers should
+route on.
+
+Configuration (environment):
+
+    READINESS_REQUIRED    comma-separated checks that must pass before the
+                          service reports ready (default: ats_analyzer,
+                          ats_workers)
+
+A check can also make itself required when it is recorded: the data-file
+checks tfidf_vectorizer and esco_index do so whenever their files are
+deployed, so a vectorizer or index that is there but fails to load keeps the
+service unready. Without the files they are recorded as failing but, unless
+listed above, do not gate readiness.
+"""
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+DEFAULT_REQUIRED = "ats_analyzer,ats_workers"
+
+
+class Readiness:
+    """Named warm-up checks; ready once warm-up is complete and every required check passed"""
+
+    def __init__(self, required: Optional[Iterable[str]] = None):
+        if required is None:
+            required = os.getenv("READINESS_REQUIRED", DEFAULT_REQUIRED).split(",")
+        self.required = {name.strip() for name in required if name.strip()}
+        self.started_at = time.time()
+        self.completed_at: Optional[float] = None
+        self._checks: Dict[str, Dict[str, Any]] = {}
+
+    def mark(self, name: str, ok: bool, detail: Any = None, seconds: Optional[float] = None,
+             required: bool = False) -> None:
+        if required:
+            self.required.add(name)
+        self._checks[name] = {"ok": bool(ok), "detail": detail, "seconds": None if seconds is None else round(seconds, 3)}
+
+    async def run(self, name: str, fn: Callable[[], Any]) -> bool:
+        """Run a warm-up step (a blocking one in a thread); a falsy result or an exception fails the check"""
+        started = time.perf_counter()
+        try:
+            result = await fn() if asyncio.iscoroutinefunction(fn) else await asyncio.to_thread(fn)
+            ok, detail = result is not False, (None if isinstance(result, bool) else result)
+        except Exception as e:
+            ok, detail = False, f"{type(e).__name__}: {e}"
+            print(f"Warm-up step {name} failed: {detail}")
+        self.mark(name, ok, detail, time.perf_counter() - started)
+        return ok
+
+    def complete(self) -> None:
+        self.completed_at = time.time()
+        print(f"Warm-up finished in {self.completed_at - self.started_at:.1f}s: {self.status()}")
+
+    @property
+    def is_ready(self) -> bool:
+        return self.completed_at is not None and all(self._checks.get(name, {}).get("ok") for name in self.required)
+
+    def status(self) -> str:
+        """starting (warm-up running), ready, or degraded (warm-up done but a required check failed)"""
+        if self.completed_at is None:
+            return "starting"
+        return "ready" if self.is_ready else "degraded"
+
+    def report(self) -> Dict[str, Any]:
+        failing = sorted(name for name in self.required if not self._checks.get(name, {}).get("ok"))
+        return {
+            "status": self.status(),
+            "ready": self.is_ready,
+            "warmup_seconds": round(self.completed_at - self.started_at, 3) if self.completed_at else None,
+            "required": sorted(self.required),
+            "failing": failing,
+            "checks": dict(self._checks),
+        }
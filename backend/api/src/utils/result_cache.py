@@ -0,0 +1,223 @@
+"""
+Content-addressed cache for analysis results (e.g. ``/ats-checker`` reports).
+
+Entries are JSON-serializable values stored under a hex key derived from the
+inputs (see ``content_key``). Two interchangeable backends:
+
+    MemoryResultCache   bounded in-process LRU with TTL
+    DiskResultCache     one file per key under a directory, with TTL and
+                        least-recently-used eviction past ``max_entries``;
+                        survives restarts and can be shared by workers on one host
+
+``create_result_cache`` picks one from the environment:
+
+    ATS_RESULT_CACHE        memory (default), disk or off
+    ATS_RESULT_CACHE_DIR    directory for the disk backend
+    ATS_RESULT_CACHE_SIZE   max entries (default 1024)
+    ATS_RESULT_CACHE_TTL    seconds an entry stays valid (default 86400, 0 = forever)
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from utils.cache import LRUCache
+
+
+def content_key(*parts: Any) -> str:
+    """SHA-256 over the parts (bytes are hashed as-is, anything else as its str)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part if isinstance(part, bytes) else str(part).encode("utf-8")
+        digest.update(hashlib.sha256(data).digest())
+    return digest.hexdigest()
+
+
+class ResultCache(ABC):
+    """Backend interface; values are stored as JSON so hits can never alias live objects"""
+
+    name = "base"
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._get(key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any) -> None:
+        self._set(key, json.dumps(value))
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        """Stored JSON for ``key``, or None on a miss"""
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, raw: str) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class MemoryResultCache(ResultCache):
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        super().__init__()
+        self._lru = LRUCache(maxsize=max_entries, ttl=ttl)
+
+    def _get(self, key: str) -> Optional[str]:
+        return self._lru.get(key, count=False)
+
+    def _set(self, key: str, raw: str) -> None:
+        self._lru.set(key, raw)
+
+    def delete(self, key: str) -> None:
+        self._lru.pop(key)
+
+    def clear(self) -> None:
+        self._lru.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lru = self._lru.stats()
+        return {**super().stats(), "size": lru["size"], "max_entries": lru["maxsize"], "evictions": lru["evictions"]}
+
+
+class DiskResultCache(ResultCache):
+    name = "disk"
+
+    def __init__(self, directory: str, max_entries: int = 10000, ttl: Optional[float] = None):
+        super().__init__()
+        self.directory = directory
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._count = sum(1 for _ in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.entry")
+
+    def _entries(self):
+        for shard in os.listdir(self.directory):
+            shard_dir = os.path.join(self.directory, shard)
+            if os.path.isdir(shard_dir):
+                for name in os.listdir(shard_dir):
+                    if name.endswith(".entry"):
+                        yield os.path.join(shard_dir, name)
+
+    def _get(self, key: str) -> Optional[str]:
+        # file layout: "<expires_at or empty>\n<json>"; mtime tracks last use for eviction
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                expires_at = fh.readline().strip()
+                if expires_at and float(expires_at) <= time.time():
+                    raw = None
+                else:
+                    raw = fh.read()
+            if raw is None:
+                self.delete(key)
+                return None
+            os.utime(path, None)
+            return raw
+        except (OSError, ValueError):
+            return None
+
+    def _set(self, key: str, raw: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        existed = os.path.exists(path)
+        expires_at = f"{time.time() + self.ttl}" if self.ttl else ""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(f"{expires_at}\n{raw}")
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            if not existed:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries down to 90% of max_entries (amortizes the directory scan)"""
+        entries = []
+        for path in self._entries():
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                pass
+        entries.sort()
+        excess = len(entries) - int(self.max_entries * 0.9)
+        for _, path in entries[:max(0, excess)]:
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except OSError:
+                pass
+        self._count = len(entries) - max(0, excess)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+            with self._lock:
+                self._count -= 1
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        for path in list(self._entries()):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._count = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "size": self._count, "max_entries": self.max_entries, "evictions": self.evictions}
+
+
+def create_result_cache(default_dir: str) -> Optional[ResultCache]:
+    """Backend configured by ATS_RESULT_CACHE* env vars (None when disabled)"""
+    backend = os.getenv("ATS_RESULT_CACHE", "memory").lower()
+    max_entries = int(os.getenv("ATS_RESULT_CACHE_SIZE", "1024"))
+    ttl = float(os.getenv("ATS_RESULT_CACHE_TTL", "86400")) or None
+    if backend in ("off", "none", "0", "false"):
+        return None
+    if backend == "disk":
+        return DiskResultCache(os.getenv("ATS_RESULT_CACHE_DIR", default_dir), max_entries=max_entries, ttl=ttl)
+    return MemoryResultCache(max_entries=max_entries, ttl=ttl)
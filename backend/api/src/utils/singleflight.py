@@ -0,0 +1,99 @@
+"""
+Single-flight call coalescing.
+
+When several callers ask for the same thing at the same time (a frontend retry,
+a double-submit), only the first one - the leader - does the work; the others
+wait for it and get its result (or its exception). Nothing is cached: once the
+leader finishes the key is released and the next call starts a new flight.
+
+Flights are ``concurrent.futures.Future`` objects, so sync callers in worker
+threads and async callers on any event loop can share one.
+"""
+import asyncio
+import copy
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution"""
+
+    def __init__(self, copy_result: Optional[Callable[[Any], Any]] = copy.deepcopy):
+        #followers get a copy so no two callers ever hold the same mutable result
+        self.copy_result = copy_result
+        self._flights: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    def _join(self, key: Hashable):
+        """``(future, is_leader)`` for key, registering a new flight when none is running"""
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._flights[key] = future
+            self.leaders += 1
+            return future, True
+
+    def _land(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if self._flights.get(key) is future:
+                del self._flights[key]
+
+    def _shared(self, result: Any) -> Any:
+        return self.copy_result(result) if self.copy_result else result
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Result of ``fn()``, or of the identical call already in flight"""
+        while True:
+            future, leader = self._join(key)
+            if not leader:
+                try:
+                    return self._shared(future.result())
+                except CancelledError:
+                    continue        #the leader was cancelled; start over (possibly as the new leader)
+            try:
+                result = fn()
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                self._land(key, future)
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of ``do``; ``fn`` returns the awaitable to run when this caller leads"""
+        while True:
+            future, leader = self._join(key)
+            if not leader:
+                try:
+                    result = await asyncio.shield(asyncio.wrap_future(future))
+                except asyncio.CancelledError:
+                    if future.cancelled():
+                        continue
+                    raise
+                return self._shared(result)
+            try:
+                result = await fn()
+            except asyncio.CancelledError:
+                #don't hand our cancellation to the followers: they retry instead
+                future.cancel()
+                raise
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                self._land(key, future)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"in_flight": len(self._flights), "leaders": self.leaders, "coalesced": self.coalesced}
@@ -0,0 +1,149 @@
+"""
+Benchmark for ESCO term matching at full taxonomy size.
+
+Builds an ESCO index (from the real ESCO zip with --zip, otherwise from a
+synthetic taxonomy of --labels labels), then reports build time, index size,
+load time and memory, and per-resume match latency. Exits non-zero if the p95
+match latency exceeds --max-ms.
+
+    cd backend/api
+    python tests/bench_esco_matcher.py
+    python tests/bench_esco_matcher.py --zip "src/ats/data/ESCO dataset - v1.2.0 - classification - en - csv.zip"
+"""
+import argparse
+import csv
+import io
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from ats.ats import buzzwords, clean_text  # noqa: E402
+from ats.esco_index import EscoIndex, build_esco_index  # noqa: E402
+from ats.term_matcher import TermMatcher  # noqa: E402
+
+
+def _rss_kb() -> int:
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _synthetic_words(rng, count):
+    syllables = [c + v for c in "bcdfghklmnprstvz" for v in "aeiou"]
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def write_synthetic_esco_zip(path, n_labels, seed=13):
+    """ESCO-shaped skills_en.csv with ~n_labels preferred + newline separated alt labels"""
+    rng = random.Random(seed)
+    words = _synthetic_words(rng, 12000)
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["conceptType", "conceptUri", "preferredLabel", "altLabels", "description"])
+    written = 0
+    skill = 0
+    while written < n_labels:
+        labels = [" ".join(rng.sample(words, rng.randint(1, 4))) for _ in range(rng.randint(1, 10))]
+        writer.writerow(["KnowledgeSkillCompetence", f"http://data.europa.eu/esco/skill/{skill}",
+                         labels[0], "\n".join(labels[1:]), f"Synthetic skill {skill}"])
+        written += len(labels)
+        skill += 1
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("skills_en.csv", buf.getvalue())
+
+
+def synthetic_resumes(index, rng, count, length):
+    """Cleaned token lists mixing ESCO vocabulary with unknown words"""
+    vocab = list(index.automaton.vocab)
+    resumes = []
+    for _ in range(count):
+        tokens = []
+        while len(tokens) < length:
+            if rng.random() < 0.3:
+                tokens.extend(index.term(rng.randrange(len(index))).split())
+            elif rng.random() < 0.5:
+                tokens.append(rng.choice(vocab))
+            else:
+                tokens.append(f"word{rng.randrange(5000)}")
+        resumes.append(tokens[:length])
+    return resumes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--zip", help="real ESCO classification zip (default: synthetic taxonomy)")
+    parser.add_argument("--labels", type=int, default=120000, help="synthetic taxonomy size")
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--tokens", type=int, default=800, help="cleaned tokens per resume")
+    parser.add_argument("--max-ms", type=float, default=10.0, help="p95 match latency ceiling")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        zip_path = args.zip
+        if not zip_path:
+            zip_path = os.path.join(tmp, "esco.zip")
+            write_synthetic_esco_zip(zip_path, args.labels)
+        index_dir = os.path.join(tmp, "esco_index")
+
+        start = time.perf_counter()
+        build_esco_index(zip_path, index_dir)
+        build_s = time.perf_counter() - start
+        index_bytes = sum(os.path.getsize(os.path.join(index_dir, f)) for f in os.listdir(index_dir))
+
+        rss_before = _rss_kb()
+        tracemalloc.start()
+        start = time.perf_counter()
+        index = EscoIndex.load(index_dir)
+        matcher = TermMatcher.from_esco_index(buzzwords, index)
+        load_s = time.perf_counter() - start
+        heap_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        rng = random.Random(7)
+        resumes = synthetic_resumes(index, rng, args.resumes, args.tokens)
+        timings = []
+        hits = 0
+        for tokens in resumes:
+            start = time.perf_counter()
+            result = matcher.scan_tokens(tokens)
+            timings.append((time.perf_counter() - start) * 1000)
+            hits += len(result.esco_terms)
+        rss_after = _rss_kb()
+
+        sample_text = " ".join(index.label(rng.randrange(len(index))) for _ in range(150))
+        start = time.perf_counter()
+        clean_text(sample_text)
+        clean_ms = (time.perf_counter() - start) * 1000
+
+        timings.sort()
+        p95 = timings[int(0.95 * (len(timings) - 1))]
+        print(f"terms:              {len(index):,} ({index.meta['vocab_size']:,} tokens, "
+              f"{index.meta['node_count']:,} automaton states)")
+        print(f"build:              {build_s:.1f} s, index on disk {index_bytes / 1e6:.1f} MB")
+        print(f"load:               {load_s * 1000:.0f} ms, python heap {heap_bytes / 1e6:.1f} MB, "
+              f"rss after matching +{(rss_after - rss_before) / 1024:.1f} MB")
+        print(f"match ({args.tokens} tokens): p50 {statistics.median(timings):.2f} ms, "
+              f"p95 {p95:.2f} ms, max {timings[-1]:.2f} ms, {hits / len(resumes):.0f} hits/resume")
+        print(f"clean_text (~{len(sample_text.split())} words, for reference): {clean_ms:.1f} ms")
+
+        if p95 > args.max_ms:
+            print(f"FAIL: p95 match latency {p95:.2f} ms exceeds {args.max_ms} ms")
+            return 1
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Fuzz / latency check for the quantifiable-achievement extractor.
+
+Runs the pattern set over adversarial inputs that made the old unbounded
+``.*?`` patterns quadratic (one very long line, thousands of "increased"
+without "by", long digit and whitespace runs) plus random fuzz, and exits
+non-zero if any input takes longer than --max-ms or if doubling an input more
+than --max-growth times its extraction time. Ordinary resume sentences are
+also checked against the legacy patterns to confirm the same metrics come out.
+
+    cd backend/api
+    python tests/bench_quantifiable.py
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from ats.document import ResumeDocument  # noqa: E402
+from ats.quantifiable import quantifiable_extractor  # noqa: E402
+
+LEGACY_PATTERNS = [
+    r'(?:increased|reduced|improved|decreased|boosted|cut|grew)\s+.*?by\s+([\d,\.]+\s*%?)',
+    r'(?:managed|led|oversaw)\s+(?:a\s+team\s+of|[\d,\.]+\s+projects?)',
+    r'(?:saved)\s+([\$\€\£]?[\d,\.]+)',
+    r'(?:achieved|delivered)\s+(?:a\s+)?([\d,\.]+%?)\s+.*?',
+    r'(?:handled|processed)\s+([\d,\.]+)\s+(?:data\s+records?|transactions?)',
+    r'(?:developed|implemented)\s+.*?for\s+([\d,\.]+)\s+users?',
+    r'(?:optimized|streamlined)\s+.*?resulting\s+in\s+([\d,\.]+%?)\s+reduction',
+    r'([\d,\.]+%?)\s+(?:increase|reduction|improvement|gain|growth)',
+]
+
+RESUME_LINES = [
+    "Increased quarterly revenue by 35% through targeted campaigns.",
+    "Led a team of 8 engineers building the payments platform.",
+    "Saved $120,000 annually by consolidating vendors.",
+    "Achieved a 99.9% uptime across production services.",
+    "Processed 2,000,000 transactions per day with sub-second latency.",
+    "Developed an onboarding flow for 50,000 users.",
+    "Streamlined deployment resulting in 40% reduction in lead time.",
+    "Delivered 12 features ahead of schedule, a 20% improvement over plan.",
+    "Managed 5 projects across three time zones.",
+]
+
+FUZZ_WORDS = ["increased", "reduced", "by", "for", "users", "led", "a", "team", "of", "saved",
+              "resulting", "in", "reduction", "growth", "achieved", "12", "3.5%", "1,000", "$40",
+              "revenue", "streamlined", "\n", ".", "   "]
+
+
+def legacy_extract(text):
+    lower = text.lower()
+    found = []
+    for pattern in LEGACY_PATTERNS:
+        for match in re.findall(pattern, lower):
+            found.extend(item for item in match if item) if isinstance(match, tuple) else found.append(match)
+    return found
+
+
+def adversarial_inputs(size, rng):
+    return {
+        "increased without by": "increased revenue " * (size // 18),
+        "keywords, one long line": " ".join(rng.choice(["increased", "developed", "optimized", "reduced", "sales"])
+                                            for _ in range(size // 9)),
+        "long digit run": "saved " + "1" * size + " increase",
+        "digits and commas": "1,0." * (size // 4) + " growth",
+        "whitespace run": "reduced" + " " * size + "by 5% costs",
+        "reduced words no by": "reduced " + "cost " * (size // 5),
+        "random fuzz": " ".join(rng.choice(FUZZ_WORDS) for _ in range(size // 6)),
+    }
+
+
+def time_ms(extractor, text, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        doc = ResumeDocument(text)      # fresh document so segmentation is timed too
+        start = time.perf_counter()
+        extractor.extract(doc)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=200000, help="characters per adversarial input")
+    parser.add_argument("--max-ms", type=float, default=500.0, help="latency ceiling per input")
+    parser.add_argument("--max-growth", type=float, default=3.0,
+                        help="allowed time ratio when the input size doubles (linear ~2)")
+    args = parser.parse_args(argv)
+
+    failures = []
+
+    resume = "\n".join(RESUME_LINES)
+    expected = legacy_extract(resume)
+    actual = quantifiable_extractor.extract(resume)
+    print(f"resume sample: {len(actual)} metrics (legacy {len(expected)})")
+    if sorted(actual) != sorted(expected):
+        failures.append(f"metrics differ from legacy patterns: {actual} vs {expected}")
+
+    rng = random.Random(11)
+    small = adversarial_inputs(args.size, rng)
+    rng = random.Random(11)
+    large = adversarial_inputs(args.size * 2, rng)
+    for case, text in small.items():
+        ms = time_ms(quantifiable_extractor, text)
+        ms_double = time_ms(quantifiable_extractor, large[case])
+        growth = ms_double / ms if ms > 1 else 1.0
+        print(f"{case:24} {len(text):>8,} chars {ms:8.1f} ms   x2 size: {ms_double:8.1f} ms "
+              f"(growth {growth:.1f})")
+        if ms > args.max_ms:
+            failures.append(f"{case}: {ms:.1f} ms exceeds {args.max_ms} ms")
+        if growth > args.max_growth:
+            failures.append(f"{case}: time grew {growth:.1f}x when input doubled")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
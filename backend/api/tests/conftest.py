@@ -0,0 +1,52 @@
+"""Shared fixtures; the environment is set before any test imports the app or the analyzer"""
+import os
+import tempfile
+
+import pytest
+
+#no data files, no worker processes and no background warm-up, so the analyzer builds fast and deterministically
+_MISSING_DATA = os.path.join(tempfile.gettempdir(), "darzi-tests-no-data")
+os.environ.setdefault("ESCO_ZIP_PATH", os.path.join(_MISSING_DATA, "esco.zip"))
+os.environ.setdefault("ESCO_INDEX_DIR", os.path.join(_MISSING_DATA, "esco_index"))
+os.environ.setdefault("TFIDF_VECTORIZER_PATH", os.path.join(_MISSING_DATA, "tfidf_vectorizer.pkl"))
+os.environ.setdefault("ATS_WORKERS", "0")
+os.environ.setdefault("ATS_WARMUP", "off")
+
+RESUME = """Jane Doe
+jane@example.com
+
+Summary
+Python developer with experience in machine learning, cloud computing and agile teams.
+
+Experience
+Senior Software Engineer, Acme Corp
+Increased API throughput by 40% and reduced infrastructure costs by 25%.
+Led a team of 5 engineers and delivered 12 projects for 20,000 users.
+
+Education
+B.Tech in Computer Science
+
+Skills
+Python, SQL, Docker, Kubernetes, AWS, data analysis, project management
+"""
+
+
+@pytest.fixture
+def resume_text():
+    return RESUME
+
+
+@pytest.fixture(scope="session")
+def analyzer():
+    from ats.analyzer import get_analyzer
+
+    return get_analyzer()
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    from app import app
+
+    with TestClient(app) as test_client:
+        yield test_client
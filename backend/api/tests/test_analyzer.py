@@ -0,0 +1,90 @@
+"""ATS analyzer entry points"""
+import csv
+import io
+import os
+import zipfile
+
+from ats import analyzer as analyzer_module, esco_index
+from ats.analyzer import (ATSDataPaths, analysis_plan, analysis_step, ats_data_version, build_report, clamp_score,
+                          data_paths)
+from ats.esco_index import build_esco_index
+
+
+def test_data_version_reads_metadata_only(tmp_path, monkeypatch):
+    paths = ATSDataPaths(str(tmp_path / "esco.zip"), str(tmp_path / "tfidf.pkl"), str(tmp_path / "index"))
+    def no_analyzer(*args, **kwargs):
+        raise AssertionError("the version must not load an analyzer")
+
+    monkeypatch.setattr(analyzer_module, "get_analyzer", no_analyzer)
+    missing = ats_data_version(paths)
+
+    (tmp_path / "tfidf.pkl").write_bytes(b"vectorizer")
+    with_vectorizer = ats_data_version(paths)
+    os.utime(tmp_path / "tfidf.pkl", (0, 0))
+    touched = ats_data_version(paths)
+
+    assert len({missing, with_vectorizer, touched}) == 3
+    assert ats_data_version(paths) == touched
+
+
+def test_data_version_follows_the_esco_index(tmp_path):
+    rows = io.StringIO()
+    csv.writer(rows).writerows([["conceptType", "preferredLabel", "altLabels", "description"],
+                                ["KnowledgeSkillCompetence", "SQL", "", ""]])
+    with zipfile.ZipFile(tmp_path / "esco.zip", "w") as zf:
+        zf.writestr(esco_index.SKILLS_CSV_NAME, rows.getvalue())
+    paths = ATSDataPaths(str(tmp_path / "esco.zip"), str(tmp_path / "tfidf.pkl"), str(tmp_path / "index"))
+
+    before = ats_data_version(paths)
+    build_esco_index(paths.esco_zip, paths.esco_index_dir)
+
+    assert ats_data_version(paths) != before
+    assert f"esco:{esco_index.FORMAT_VERSION}/" in ats_data_version(paths)
+
+
+def test_analyzer_version_is_the_data_version(analyzer):
+    assert analyzer.paths == data_paths()
+    assert analyzer.version() == ats_data_version()
+
+
+def test_stream_steps_add_up_to_the_report(analyzer, resume_text):
+    analyses, points = {}, {}
+    for key in analysis_plan():
+        result, step_points = analysis_step(resume_text, "", key)
+        if key != "jd_match":
+            analyses[key], points[key] = result, step_points
+
+    report = analyzer.analyze(resume_text, "", "resume.txt")
+    streamed = build_report(analyses, {"score": 0, "percentage": 0, "available": False}, "resume.txt", len(resume_text))
+    assert streamed["categories"] == report["categories"]
+    assert round(clamp_score(sum(points.values())), 1) == report["overall_score"] == streamed["overall_score"]
+
+
+def test_analyzers_run_inline_by_default(analyzer, monkeypatch):
+    from ats.registry import AnalyzerRunner
+
+    monkeypatch.delenv("ATS_ANALYZER_THREADS", raising=False)
+    assert AnalyzerRunner(analyzer.registry).max_workers == 1
+    monkeypatch.setenv("ATS_ANALYZER_THREADS", "4")
+    assert AnalyzerRunner(analyzer.registry).max_workers == 4
+
+
+def test_term_hits_are_passed_to_the_analyzers(analyzer, monkeypatch):
+    from ats.term_matcher import TermHits
+
+    scans = []
+    monkeypatch.setattr(analyzer, "scan_terms", lambda doc: scans.append(doc) or TermHits(["agile"], []))
+
+    assert analyzer.analyze_buzzwords_from_text("anything", TermHits(["python", "sql"], []))["found_terms"] == ["python", "sql"]
+    assert analyzer.analyze_buzzwords_from_text("anything")["found_terms"] == ["agile"]
+    assert len(scans) == 1
+    assert analyzer.registry.get("buzzwords").inputs == analyzer.registry.get("technical").inputs == ("doc", "term_hits")
+
+
+def test_technical_fallback_matches_whole_words(analyzer, monkeypatch):
+    monkeypatch.setattr(analyzer, "esco_index", object())       #index loaded but no term matcher: basic term list
+    monkeypatch.setattr(analyzer, "scan_terms", lambda doc: None)
+
+    result = analyzer.analyze_esco_technical_terms("Senior JavaScript and React developer; PostgreSQL, not SQL Server")
+
+    assert result["terms"] == ["javascript", "sql", "react"]
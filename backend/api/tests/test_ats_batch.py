@@ -0,0 +1,45 @@
+"""/ats-checker/batch: many resumes against one job description"""
+import app as app_module
+
+JD = "Python developer with SQL and cloud experience"
+
+
+def _without_timestamp(report):
+    return {**report, "metadata": {k: v for k, v in report["metadata"].items() if k != "analysis_timestamp"}}
+
+
+def test_batch_matches_single_reports(client, resume_text):
+    single = client.post("/ats-checker", files={"file": ("resume.txt", resume_text.encode())},
+                         data={"job_description": JD}).json()
+
+    response = client.post("/ats-checker/batch",
+                           files=[("files", ("resume.txt", resume_text.encode()))],
+                           data={"texts": [resume_text], "job_description": JD})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == body["analyzed"] == 2
+    assert _without_timestamp(body["results"][0]) == _without_timestamp(single)
+    assert body["results"][1]["metadata"]["filename"] == "text_1"
+    assert body["results"][1]["overall_score"] == single["overall_score"]
+
+
+def test_bad_entries_keep_their_position(client, resume_text):
+    response = client.post("/ats-checker/batch",
+                           files=[("files", ("resume.exe", b"binary")), ("files", ("resume.txt", resume_text.encode()))],
+                           data={"texts": ["too short"]})
+
+    results = response.json()["results"]
+    assert response.json()["analyzed"] == 1
+    assert results[0] == {"filename": "resume.exe", "error": "Only pdf, docx, txt files are supported"}
+    assert results[1]["metadata"]["filename"] == "resume.txt"
+    assert results[2] == {"filename": "text_1", "error": "Could not extract meaningful text from resume"}
+
+
+def test_empty_and_oversized_batches_are_rejected(client, resume_text, monkeypatch):
+    assert client.post("/ats-checker/batch", data={"job_description": JD}).status_code == 400
+
+    monkeypatch.setattr(app_module, "ATS_BATCH_MAX_RESUMES", 1)
+    response = client.post("/ats-checker/batch", data={"texts": [resume_text, resume_text]})
+    assert response.status_code == 400
+    assert "At most 1" in response.json()["detail"]
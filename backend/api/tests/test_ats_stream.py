@@ -0,0 +1,64 @@
+"""/ats-checker/stream: categories as Server-Sent Events"""
+import json
+
+import app as app_module
+from ats.analyzer import analysis_plan
+from ats.executor import ATSExecutor
+from utils.result_cache import MemoryResultCache
+
+
+def _events(response):
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        name, data = block.split("\n", 1)
+        events.append((name.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def _without_timestamp(report):
+    return {**report, "metadata": {k: v for k, v in report["metadata"].items() if k != "analysis_timestamp"}}
+
+
+def test_categories_stream_cheapest_first(client, resume_text, monkeypatch):
+    monkeypatch.setattr(app_module, "ats_result_cache", MemoryResultCache())
+    upload = {"file": ("stream-resume.txt", resume_text.encode())}
+
+    response = client.post("/ats-checker/stream", files=upload)
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response)
+    categories = [data for name, data in events if name == "category"]
+    assert [event["analysis"] for event in categories] == analysis_plan()
+    assert [event["completed"] for event in categories] == list(range(1, len(categories) + 1))
+
+    name, report = events[-1]
+    assert name == "complete"
+    assert categories[-1]["overall_score"] == report["overall_score"]
+    streamed = {event["category"]: event["result"] for event in categories if "category" in event}
+    assert streamed == report["categories"]
+
+    app_module.ats_result_cache.clear()
+    single = client.post("/ats-checker", files=upload)
+    assert _without_timestamp(single.json()) == _without_timestamp(report)
+    assert single.headers["etag"] == response.headers["etag"]
+
+
+def test_cached_report_is_sent_at_once(client, resume_text, monkeypatch):
+    monkeypatch.setattr(app_module, "ats_result_cache", MemoryResultCache())
+    upload = {"file": ("stream-resume.txt", resume_text.encode())}
+    report = client.post("/ats-checker", files=upload).json()
+
+    assert _events(client.post("/ats-checker/stream", files=upload)) == [("complete", report)]
+
+
+def test_full_queue_and_short_text(client, resume_text, monkeypatch):
+    monkeypatch.setattr(app_module, "ats_result_cache", None)
+    busy = ATSExecutor(workers=0, queue_limit=1)
+    busy._pending = 1
+    monkeypatch.setattr(app_module, "ats_executor", busy)
+
+    response = client.post("/ats-checker/stream", files={"file": ("resume.txt", resume_text.encode())})
+    assert response.status_code == 503 and response.headers["retry-after"] == "1"
+    assert busy.rejected == 1
+
+    assert client.post("/ats-checker/stream", files={"file": ("resume.txt", b"too short")}).status_code == 400
@@ -0,0 +1,88 @@
+"""Section chunking of long resumes and merging of the partial parses"""
+import pytest
+
+from utils.llm.chunking import chunk_resume, is_heading, merge_parsed, split_sections
+from utils.llm.limiter import estimate_tokens
+from utils.llm.manager import LLMManager
+
+CV = """Jane Doe
+jane@example.com
+
+EDUCATION
+PhD, Physics, State University
+
+Publications
+""" + "\n".join(f"Paper {i}: a study of things, Journal of Studies, 20{i:02d}" for i in range(40)) + """
+
+Teaching Experience
+Lecturer, Mechanics 101
+"""
+
+
+def test_is_heading():
+    assert is_heading("Work Experience:")
+    assert is_heading("PROFESSIONAL DEVELOPMENT")
+    assert not is_heading("Experienced engineer who ships reliable services")
+    assert not is_heading("Jane Doe")
+
+
+def test_split_sections_keeps_the_preamble():
+    sections = split_sections(CV)
+
+    assert [heading for heading, _ in sections] == ["", "EDUCATION", "Publications", "Teaching Experience"]
+    assert sections[0][1] == "Jane Doe\njane@example.com"
+
+
+def test_chunks_respect_the_budget_and_keep_every_line():
+    chunks = chunk_resume(CV, max_tokens=200)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 200 for chunk in chunks)
+    text = "\n".join(chunks)
+    assert all(f"Paper {i}:" in text for i in range(40))
+    assert "Publications (continued)" in text
+    assert chunks[0].startswith("Jane Doe")
+
+
+def test_small_resume_is_one_chunk():
+    assert chunk_resume("Skills\nPython", max_tokens=200) == ["Skills\nPython"]
+
+
+def test_merge_parsed():
+    parts = [
+        {"contact_information": {"name": "Jane"}, "publications": [{"title": "A"}], "summary": "first"},
+        {"contact_information": {"email": "j@x.com", "name": "Other"}, "publications": [{"title": "A"}, {"title": "B"}],
+         "summary": "second", "teaching_experience": [{"course": "Mechanics"}]},
+        {"publications": {"title": "C"}},
+    ]
+
+    merged = merge_parsed(parts)
+
+    assert merged == {
+        "contact_information": {"name": "Jane", "email": "j@x.com"},
+        "publications": [{"title": "A"}, {"title": "B"}, {"title": "C"}],
+        "summary": "first",
+        "teaching_experience": [{"course": "Mechanics"}],
+    }
+
+
+def test_merge_is_in_chunk_order():
+    assert merge_parsed([{"a": 1}, {"a": 2}]) == {"a": 1}
+    assert merge_parsed([{"a": 2}, {"a": 1}]) == {"a": 2}
+
+
+def test_failed_chunks_are_flagged_in_the_merge():
+    merged = LLMManager._merge_chunks([{"education": ["BSc"]}, RuntimeError("timeout"), {"skills": ["SQL"]}])
+
+    assert merged == {"education": ["BSc"], "skills": ["SQL"], "_partial_chunks": [2]}
+
+
+def test_all_chunks_failing_raises():
+    with pytest.raises(RuntimeError):
+        LLMManager._merge_chunks([RuntimeError("a"), None])
+
+
+def test_only_partial_failures_are_retried():
+    assert LLMManager._chunks_to_retry([{}, RuntimeError("x"), {}]) == [1]
+    assert LLMManager._chunks_to_retry([RuntimeError("x"), RuntimeError("y")]) == []
+    assert LLMManager._chunks_to_retry([{}, {}]) == []
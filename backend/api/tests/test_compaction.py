@@ -0,0 +1,113 @@
+"""Prompt compaction of extracted resume text"""
+from utils.llm.compaction import PAGE_BREAK, CompactionStats, compact_text
+
+REPEATED_TITLES = """Jane Doe
+Experience
+
+Software Engineer
+Acme Corp
+Remote
+2021 - Present
+Built billing services in Go
+
+Software Engineer
+Globex
+Remote
+2018 - 2021
+Maintained the Python data platform
+
+Software Engineer
+Initech
+Remote
+2016 - 2018
+Wrote internal tooling
+
+Education
+
+B.Sc. Computer Science
+State University
+
+B.Sc. Computer Science
+Second University
+"""
+
+
+def _page(number, body, total=3):
+    return f"Jane Doe Resume\n{body}\nPage {number} of {total}"
+
+
+def test_repeated_job_titles_and_degrees_are_kept():
+    result = compact_text(REPEATED_TITLES)
+
+    lines = result.text.split("\n")
+    assert lines.count("Software Engineer") == 3
+    assert lines.count("Remote") == 3
+    assert lines.count("B.Sc. Computer Science") == 2
+    assert result.boilerplate_lines == 0
+
+
+def test_running_header_and_page_markers_are_stripped_across_pages():
+    pages = [_page(1, "Experience\nBuilt billing services"), _page(2, "Education\nState University"),
+             _page(3, "Skills\nPython, SQL")]
+
+    result = compact_text(PAGE_BREAK.join(pages))
+
+    assert result.text.count("Jane Doe Resume") == 1
+    assert "Page" not in result.text
+    assert all(word in result.text for word in ("Built billing services", "State University", "Python, SQL"))
+    assert result.boilerplate_lines == 5
+
+
+def test_two_page_header_is_not_boilerplate():
+    pages = [_page(1, "Experience", total=2), _page(2, "Education", total=2)]
+
+    result = compact_text(PAGE_BREAK.join(pages))
+
+    assert result.text.count("Jane Doe Resume") == 2
+    assert "Page" not in result.text
+
+
+def test_bare_page_numbers_are_dropped_only_at_page_edges():
+    pages = ["Awards\nHackathon finalist\n2\nrunner-up finishes\nChess club\nDebate society",
+             "Skills\nSQL\nPython\n2", "Projects\nParser\nCompiler\n3"]
+
+    result = compact_text(PAGE_BREAK.join(pages))
+
+    assert result.text.split("\n").count("2") == 1
+    assert "3" not in result.text.split("\n")
+
+
+def test_normalizes_bullets_spaces_and_invisible_characters():
+    result = compact_text("•  Led​   a   team\n\n\n\n● Shipped v2")
+
+    assert result.text == "- Led a team\n\n- Shipped v2"
+
+
+def test_long_duplicate_lines_are_dropped():
+    line = "Reduced cloud costs by 30 percent across regions"
+
+    result = compact_text(f"{line}\nSQL\n{line}\nSQL")
+
+    assert result.text == f"{line}\nSQL\nSQL"
+    assert result.duplicate_lines == 1
+
+
+def test_budget_truncates_at_a_line_boundary_only_when_given():
+    text = "\n".join(f"Line number {i} with some words" for i in range(100))
+
+    assert not compact_text(text).truncated
+    result = compact_text(text, token_budget=50)
+
+    assert result.truncated
+    assert result.text.endswith("more lines truncated]")
+    assert result.compacted_tokens < result.original_tokens
+
+
+def test_stats_accumulate():
+    stats = CompactionStats()
+    stats.record(compact_text("a   b\n\n\n\nc"))
+    stats.record(compact_text("x" * 40, token_budget=2))
+
+    summary = stats.stats()
+    assert summary["calls"] == 2 and summary["truncated"] == 1
+    assert summary["bytes_saved"] > 0
@@ -0,0 +1,67 @@
+"""Shared per-request ResumeDocument"""
+from ats import document
+from ats.document import ResumeDocument
+
+
+def test_views_are_computed_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(document, "clean_text", lambda text: calls.append(text) or "python develop")
+    doc = ResumeDocument("Python developer")
+
+    assert doc.cleaned == "python develop"
+    assert doc.stemmed_tokens == ["python", "develop"]
+    assert doc.cleaned is doc.cleaned
+    assert len(calls) == 1
+
+
+def test_tokens_and_counts():
+    doc = ResumeDocument("Built APIs; built CLIs.\nShipped 3 apps")
+
+    assert doc.tokens == ["built", "apis", "built", "clis", "shipped", "3", "apps"]
+    assert doc.token_counts["built"] == 2
+    assert doc.lines() == ["built apis; built clis.", "shipped 3 apps"]
+
+
+def test_sentences_end_at_punctuation_and_line_breaks():
+    doc = ResumeDocument("Led a team. Shipped v2!\n  Cut costs by 30%  \n\nWon awards")
+
+    assert doc.sentences() == ["led a team.", "shipped v2!", "cut costs by 30%", "won awards"]
+
+
+def test_contains_phrase_is_whole_word():
+    doc = ResumeDocument("JavaScript and Machine Learning; work experience")
+
+    assert doc.contains_phrase("machine learning")
+    assert doc.contains_phrase("Work Experience")
+    assert not doc.contains_phrase("java")
+    assert not doc.contains_phrase("learning machine")
+    assert not doc.contains_phrase("")
+
+
+def test_coerce_and_memo():
+    doc = ResumeDocument(None)
+    assert doc.text == "" and ResumeDocument.coerce(doc) is doc
+    assert ResumeDocument.coerce("text").text == "text"
+
+    calls = []
+    assert doc.memo("key", lambda: calls.append(1) or 42) == 42
+    assert doc.memo("key", lambda: calls.append(1) or 0) == 42
+    assert len(calls) == 1
+
+
+def test_analyzers_share_one_document(analyzer, resume_text, monkeypatch):
+    calls = []
+    original = document.clean_text
+    monkeypatch.setattr(document, "clean_text", lambda text: calls.append(1) or original(text))
+
+    report = analyzer.analyze(resume_text, "", "resume.txt")
+
+    assert len(calls) == 1      # cleaned and stemmed once for every analyzer
+    assert set(report["categories"]) >= {"Industry Keywords", "Quantifiable Impact", "Resume Structure",
+                                         "Content Quality", "Technical Expertise"}
+
+
+def test_jd_and_resume_share_clean_text():
+    from ats import ats, matchjd
+
+    assert matchjd.clean_text is ats.clean_text
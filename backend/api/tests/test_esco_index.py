@@ -0,0 +1,131 @@
+"""Prebuilt on-disk ESCO skill index"""
+import csv
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+from ats import esco_index
+from ats.ats import clean_text
+from ats.esco_index import EscoIndex, build_esco_index, load_or_build_esco_index, source_fingerprint
+
+SKILLS = [
+    ("Python (computer programming)", "python\nprogramming in python"),
+    ("manage budgets", "budget management"),
+    ("machine learning", ""),
+    ("SQL", "structured query language"),
+]
+BUZZWORDS = ["machine learning", "leadership"]
+
+
+@pytest.fixture
+def esco_zip(tmp_path):
+    rows = io.StringIO()
+    writer = csv.writer(rows)
+    writer.writerow(["conceptType", "preferredLabel", "altLabels", "description"])
+    for preferred, alt in SKILLS:
+        writer.writerow(["KnowledgeSkillCompetence", preferred, alt, f"Description of {preferred}."])
+    path = tmp_path / "esco.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(esco_index.SKILLS_CSV_NAME, rows.getvalue())
+    return str(path)
+
+
+def test_build_and_reload(esco_zip, tmp_path):
+    out_dir = str(tmp_path / "index")
+
+    assert build_esco_index(esco_zip, out_dir, BUZZWORDS) == out_dir
+    index = EscoIndex.load(out_dir)
+
+    labels = [preferred for preferred, _ in SKILLS] + ["python", "programming in python", "budget management",
+                                                       "structured query language"]
+    expected = {clean_text(label): label for label in reversed(labels) if clean_text(label)}
+    assert len(index) == len(expected)
+    assert dict(index) == expected
+    assert index.term(0) == clean_text(SKILLS[0][0]) and index.label(0) == SKILLS[0][0]
+    assert index.meta["format_version"] == esco_index.FORMAT_VERSION
+    assert index.meta["source"] == source_fingerprint(esco_zip)
+    assert index.buzzwords == BUZZWORDS
+    assert index.stems_path and os.path.isfile(index.stems_path)
+
+
+def test_mmapped_automaton_finds_terms(esco_zip, tmp_path):
+    build_esco_index(esco_zip, str(tmp_path / "index"), BUZZWORDS)
+    index = EscoIndex.load(str(tmp_path / "index"))
+    terms = [index.term(i) for i in range(len(index))]
+
+    tokens = clean_text("Shipped SQL reports and machine learning models in Python").split()
+    found = {phrase_id for _start, _end, phrase_id in index.automaton.iter_matches(tokens)}
+
+    assert {terms.index(clean_text("SQL")), terms.index(clean_text("machine learning")),
+            terms.index(clean_text("python"))} <= found
+    assert len(index) + BUZZWORDS.index("machine learning") in found       # buzzword ids follow the ESCO terms
+
+
+def test_load_or_build_rebuilds_a_stale_index(esco_zip, tmp_path):
+    out_dir = str(tmp_path / "index")
+    built = load_or_build_esco_index(esco_zip, out_dir, BUZZWORDS)
+    assert built.meta["source"] == source_fingerprint(esco_zip)
+
+    os.utime(esco_zip, (0, 0))
+    rebuilt = load_or_build_esco_index(esco_zip, out_dir, BUZZWORDS)
+
+    assert rebuilt.meta["source"] == source_fingerprint(esco_zip) != built.meta["source"]
+    assert load_or_build_esco_index(esco_zip, out_dir, ["other"], build=False).buzzwords == BUZZWORDS
+
+
+def test_missing_index_and_zip(tmp_path):
+    assert load_or_build_esco_index(str(tmp_path / "none.zip"), str(tmp_path / "index")) is None
+
+
+def test_unsupported_format_version_is_refused(esco_zip, tmp_path):
+    out_dir = str(tmp_path / "index")
+    build_esco_index(esco_zip, out_dir, BUZZWORDS)
+    meta_path = os.path.join(out_dir, esco_index.META_FILE)
+    with open(meta_path) as fh:
+        meta = json.load(fh)
+    meta["format_version"] = esco_index.FORMAT_VERSION - 1
+    with open(meta_path, "w") as fh:
+        json.dump(meta, fh)
+
+    with pytest.raises(ValueError):
+        EscoIndex.load(out_dir)
+
+
+def _index_files(path):
+    return sorted(os.listdir(path))
+
+
+def test_failed_write_keeps_the_previous_index(esco_zip, tmp_path, monkeypatch):
+    out_dir = str(tmp_path / "index")
+    build_esco_index(esco_zip, out_dir, BUZZWORDS)
+    before = _index_files(out_dir)
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(esco_index, "_write_arrays", fail)
+    with pytest.raises(OSError, match="disk full"):
+        build_esco_index(esco_zip, out_dir, BUZZWORDS)
+
+    assert _index_files(out_dir) == before
+    assert EscoIndex.load(out_dir).meta["source"] == source_fingerprint(esco_zip)
+    assert _index_files(tmp_path) == ["esco.zip", "index"]      # no temporary directories left behind
+
+
+def test_failed_swap_restores_the_previous_index(esco_zip, tmp_path, monkeypatch):
+    out_dir = str(tmp_path / "index")
+    build_esco_index(esco_zip, out_dir, BUZZWORDS)
+
+    def fail(src, dst):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(esco_index.os, "replace", fail)
+    with pytest.raises(OSError, match="cross-device"):
+        build_esco_index(esco_zip, out_dir, BUZZWORDS)
+    monkeypatch.undo()
+
+    assert EscoIndex.load(out_dir).meta["source"] == source_fingerprint(esco_zip)
+    assert _index_files(tmp_path) == ["esco.zip", "index"]
@@ -0,0 +1,58 @@
+"""Bounded ATS job executor"""
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from ats.executor import ATSExecutor, ExecutorBusyError, ExecutorStoppedError
+
+
+def test_thread_mode_runs_jobs_in_process():
+    executor = ATSExecutor(workers=0, queue_limit=2)
+
+    assert asyncio.run(executor.run(os.getpid)) == os.getpid()
+    assert executor.stats()["completed"] == 1 and executor.stats()["pending"] == 0
+
+
+def test_full_queue_is_rejected():
+    executor = ATSExecutor(workers=0, queue_limit=1)
+
+    async def main():
+        async with executor.reserve():
+            assert executor.full
+            with pytest.raises(ExecutorBusyError):
+                await executor.run(os.getpid)
+            return await executor.submit(os.getpid)     #jobs of the reserving request don't take another slot
+
+    assert asyncio.run(main()) == os.getpid()
+    assert executor.stats()["rejected"] == 1 and not executor.full
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_jobs_after_shutdown_are_refused(workers):
+    executor = ATSExecutor(workers=workers)
+    executor.shutdown()
+
+    with pytest.raises(ExecutorStoppedError, match="stopped"):
+        asyncio.run(executor.run(os.getpid))
+    executor.start()
+    assert executor._pool is None       #a stopped executor never starts workers again
+
+
+def test_pool_shut_down_under_a_job():
+    executor = ATSExecutor(workers=1)
+    pool = ProcessPoolExecutor(max_workers=1)
+    pool.shutdown()
+    executor._pool = pool       #what a job sees when shutdown() runs between taking the pool and submitting
+
+    with pytest.raises(ExecutorStoppedError):
+        asyncio.run(executor.run(os.getpid))
+    assert executor.stats()["failed"] == 1 and executor.stats()["pending"] == 0
+
+
+def test_executor_can_be_created_without_an_event_loop():
+    executor = ATSExecutor(workers=0)      #e.g. at import time; one executor then serves several loops
+
+    for _ in range(2):
+        assert asyncio.run(executor.run(os.getpid)) == os.getpid()
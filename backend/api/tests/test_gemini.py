@@ -0,0 +1,40 @@
+"""Gemini provider: one async client per event loop"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from utils.llm.providers.gemini import GeminiProvider  # noqa: E402
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    provider = GeminiProvider()
+    assert provider.is_available()
+    return provider
+
+
+async def _model_and_client(provider):
+    model = provider._async_model()
+    assert provider._async_model() is model      #reused on the same loop
+    return model, model._async_client
+
+
+def test_each_loop_gets_its_own_async_client(provider):
+    """Guards the private client API of the pinned google-generativeai version"""
+    first_model, first_client = asyncio.run(_model_and_client(provider))
+    second_model, second_client = asyncio.run(_model_and_client(provider))
+
+    assert first_model is not second_model and first_model is not provider.model
+    assert first_client is not None and first_client is not second_client
+
+
+def test_missing_client_manager_falls_back_to_the_shared_model(provider, monkeypatch):
+    from google.generativeai import client as genai_client
+
+    monkeypatch.delattr(genai_client, "_client_manager")
+
+    model, _client = asyncio.run(_model_and_client(provider))
+    assert model is provider.model
@@ -0,0 +1,75 @@
+"""Cache of cleaned and vectorized job descriptions"""
+import gc
+
+from ats.jd_cache import JDCache
+
+
+class Vectorizer:
+    def __init__(self):
+        self.calls = []
+
+    def transform(self, texts):
+        self.calls.extend(texts)
+        return ("vector", id(self), texts[0])
+
+
+def test_repeated_jd_is_computed_once():
+    cache, vectorizer, cleaned = JDCache(), Vectorizer(), []
+
+    first = cache.get("Senior Python developer", vectorizer, lambda text: cleaned.append(text) or text.lower())
+    second = cache.get("Senior Python developer", vectorizer, lambda text: cleaned.append(text) or text.lower())
+
+    assert first is second
+    assert first.cleaned == "senior python developer"
+    assert cleaned == ["Senior Python developer"] and vectorizer.calls == ["senior python developer"]
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_keyed_by_vectorizer():
+    cache, old, new = JDCache(), Vectorizer(), Vectorizer()
+
+    assert cache.get("Data engineer", old, str.lower).vector[1] == id(old)
+    assert cache.get("Data engineer", new, str.lower).vector[1] == id(new)
+    assert len(old.calls) == len(new.calls) == 1
+
+
+def test_collected_vectorizer_drops_its_entries():
+    cache, kept, dropped = JDCache(), Vectorizer(), Vectorizer()
+    cache.get("Data engineer", kept, str.lower)
+    cache.get("Data engineer", dropped, str.lower)
+    cache.get("Data analyst", dropped, str.lower)
+
+    del dropped
+    gc.collect()
+
+    assert cache.stats()["size"] == 1
+    assert cache._vectorizers.keys() == {id(kept)}
+
+
+def test_unreferenceable_vectorizer_is_not_cached():
+    class Slotted:
+        __slots__ = ("calls",)
+
+        def __init__(self):
+            self.calls = 0
+
+        def transform(self, texts):
+            self.calls += 1
+            return texts[0]
+
+    cache, vectorizer = JDCache(), Slotted()
+    cache.get("Data engineer", vectorizer, str.lower)
+    cache.get("Data engineer", vectorizer, str.lower)
+
+    assert vectorizer.calls == 2
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_bound():
+    cache, vectorizer = JDCache(maxsize=2), Vectorizer()
+    for jd in ("a", "b", "c"):
+        cache.get(jd, vectorizer, str.lower)
+
+    assert cache.stats()["size"] == 2
+    cache.get("a", vectorizer, str.lower)
+    assert vectorizer.calls == ["a", "b", "c", "a"]
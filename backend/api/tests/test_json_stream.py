@@ -0,0 +1,54 @@
+"""Incremental top-level member parser for streamed JSON"""
+import json
+
+from utils.llm.json_stream import SectionParser
+
+RESPONSE = {
+    "contact_information": {"name": "Jane Doe", "email": "jane@example.com"},
+    "professional_summary": "Builds {robust} \"data\" systems, [mostly] in Python",
+    "work_experience": [{"title": "Engineer", "highlights": ["a, b", "c}"]}],
+    "languages": ["English", "Hindi"],
+}
+
+
+def _feed_all(parser, text, size):
+    members = []
+    for start in range(0, len(text), size):
+        members.extend(parser.feed(text[start:start + size]))
+    return members
+
+
+def test_members_are_yielded_in_order_for_any_chunking():
+    text = "```json\n" + json.dumps(RESPONSE, indent=2) + "\n```"
+    for size in (1, 3, 17, len(text)):
+        parser = SectionParser()
+
+        members = _feed_all(parser, text, size)
+
+        assert members == list(RESPONSE.items())
+        assert parser.done
+        assert parser.text == text
+
+
+def test_member_is_yielded_as_soon_as_it_closes():
+    parser = SectionParser()
+
+    assert parser.feed('{"education": [{"degree": "BSc"}') == []
+    assert parser.feed('], "skills"') == [("education", [{"degree": "BSc"}])]
+    assert parser.feed(': ["SQL"]}') == [("skills", ["SQL"])]
+
+
+def test_undecodable_member_is_skipped():
+    parser = SectionParser()
+
+    members = parser.feed('{"a": 1, "b": tru, "c": [2]}')
+
+    assert members == [("a", 1), ("c", [2])]
+
+
+def test_text_after_the_object_is_ignored():
+    parser = SectionParser()
+
+    assert parser.feed('{"a": 1} {"b": 2}') == [("a", 1)]
+    assert parser.feed('{"c": 3}') == []
+    assert parser.text.endswith('{"c": 3}')
@@ -0,0 +1,138 @@
+"""Per-provider admission control"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.llm.limiter import LimiterQueueFull, LimiterTimeout, ProviderLimiter, TokenBucket, estimate_tokens
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens(None) == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+def test_token_bucket_refills_continuously():
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock)
+    bucket.take(60)
+
+    assert bucket.delay(1) == pytest.approx(1.0)
+    clock.now += 0.5
+    assert bucket.delay(1) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert bucket.delay(1) == 0.0
+
+
+def test_in_flight_cap():
+    limiter = ProviderLimiter("test", max_in_flight=1)
+    limiter.acquire()
+
+    with pytest.raises(LimiterTimeout):
+        limiter.acquire(timeout=0)
+    limiter.release()
+    limiter.acquire(timeout=0)
+
+    assert limiter.stats()["timed_out"] == 1
+
+
+def test_rpm_bucket():
+    clock = FakeClock()
+    limiter = ProviderLimiter("test", max_in_flight=100, rpm=3, clock=clock)
+    for _ in range(3):
+        limiter.acquire(timeout=0)
+        limiter.release()
+
+    with pytest.raises(LimiterTimeout):
+        limiter.acquire(timeout=0)
+    clock.now += 20     # one request's worth at 3 per minute
+    limiter.acquire(timeout=0)
+
+
+def test_tpm_bucket_charges_prompt_and_response_tokens():
+    clock = FakeClock()
+    limiter = ProviderLimiter("test", tpm=100, clock=clock)
+    limiter.acquire(tokens=60, timeout=0)
+    limiter.release(response_tokens=40)
+
+    with pytest.raises(LimiterTimeout):
+        limiter.acquire(tokens=10, timeout=0)
+    clock.now += 6      # 10 tokens at 100 per minute
+    limiter.acquire(tokens=10, timeout=0)
+
+
+def test_full_queue_is_rejected():
+    limiter = ProviderLimiter("test", max_in_flight=1, max_queue=1)
+    limiter.acquire()
+    queued = threading.Thread(target=lambda: (limiter.acquire(timeout=5), limiter.release()))
+    queued.start()
+    deadline = time.monotonic() + 5
+    while limiter.stats()["queue_depth"] < 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+    with pytest.raises(LimiterQueueFull):
+        limiter.acquire(timeout=1)
+    limiter.release()
+    queued.join(5)
+
+    stats = limiter.stats()
+    assert stats["rejected"] == 1 and stats["admitted"] == 2 and stats["in_flight"] == 0
+
+
+def test_back_off_pauses_admissions():
+    clock = FakeClock()
+    limiter = ProviderLimiter("test", backoff=10, clock=clock)
+    limiter.back_off()
+
+    with pytest.raises(LimiterTimeout):
+        limiter.acquire(timeout=0)
+    clock.now += 5
+    limiter.back_off(2)     # a shorter retry-after never shortens the pause
+    with pytest.raises(LimiterTimeout):
+        limiter.acquire(timeout=0)
+    clock.now += 5
+    limiter.acquire(timeout=0)
+
+    assert limiter.stats()["backoffs"] == 2
+
+
+def test_async_callers_wait_their_turn():
+    limiter = ProviderLimiter("test", max_in_flight=1)
+    order = []
+
+    async def call(name):
+        await limiter.acquire_async()
+        order.append(name)
+        await asyncio.sleep(0.01)
+        limiter.release()
+
+    async def main():
+        await asyncio.gather(*(call(i) for i in range(4)))
+
+    asyncio.run(main())
+
+    assert order == [0, 1, 2, 3]
+    assert limiter.stats()["admitted"] == 4
+
+
+def test_from_env_prefers_provider_settings(monkeypatch):
+    monkeypatch.setenv("LLM_RPM", "30")
+    monkeypatch.setenv("LLM_GEMINI_RPM", "90")
+    monkeypatch.setenv("LLM_MAX_IN_FLIGHT", "3")
+
+    limiter = ProviderLimiter.from_env("gemini", "GEMINI")
+
+    assert limiter.max_in_flight == 3
+    assert limiter.stats()["rpm_available"] == 90
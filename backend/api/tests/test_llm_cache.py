@@ -0,0 +1,135 @@
+"""LLM response cache: memory + SQLite tiers"""
+import os
+import stat
+
+import pytest
+
+from utils.llm import cache as cache_module
+from utils.llm.cache import LLMResponseCache, SQLiteResponseStore, create_llm_cache
+
+
+class Provider:
+    model_name = "test-model"
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "llm" / "responses.db")
+
+
+def test_disk_hit_is_promoted_to_memory(db_path):
+    provider = Provider()
+    LLMResponseCache(store=SQLiteResponseStore(db_path)).set(provider, "prompt", '{"name": "A"}')
+
+    restarted = LLMResponseCache(store=SQLiteResponseStore(db_path))
+    assert restarted.get(provider, "prompt") == '{"name": "A"}'
+    assert restarted.get(provider, "prompt") == '{"name": "A"}'
+
+    stats = restarted.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 0)
+    assert stats["memory"]["size"] == 1
+
+
+def test_key_covers_provider_model_and_prompt(db_path):
+    cache = LLMResponseCache(store=SQLiteResponseStore(db_path))
+    provider = Provider()
+    cache.set(provider, "prompt", "answer")
+
+    other_model = Provider()
+    other_model.model_name = "other-model"
+    assert cache.get(other_model, "prompt") is None
+    assert cache.get(provider, "prompt v2") is None
+    assert cache.get(provider, "prompt") == "answer"
+
+
+def test_disk_entries_expire(db_path, clock):
+    store = SQLiteResponseStore(db_path, ttl=60)
+    store.set("key", "value")
+
+    clock.now += 59
+    assert store.get("key")[0] == "value"
+    clock.now += 2
+    assert store.get("key") is None
+    assert store.stats()["size"] == 0
+
+
+def test_promoted_entry_keeps_remaining_ttl(db_path, clock, monkeypatch):
+    provider = Provider()
+    SQLiteResponseStore(db_path, ttl=60).set(cache_module.response_key(provider, "prompt"), "answer")
+    clock.now += 50
+
+    cache = LLMResponseCache(ttl=60, store=SQLiteResponseStore(db_path, ttl=60))
+    ttls = []
+    original = cache._memory.set
+    monkeypatch.setattr(cache._memory, "set", lambda key, value, ttl=None: ttls.append(ttl) or original(key, value, ttl))
+
+    assert cache.get(provider, "prompt") == "answer"
+    assert ttls == [pytest.approx(10)]     # not a fresh 60s in memory
+
+
+def test_disk_file_is_owner_only(db_path):
+    SQLiteResponseStore(db_path).set("key", "value")
+
+    assert stat.S_IMODE(os.stat(db_path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(os.path.dirname(db_path)).st_mode) == 0o700
+
+
+def test_disk_evicts_least_recently_used(db_path, clock):
+    store = SQLiteResponseStore(db_path, max_entries=10)
+    for i in range(10):
+        clock.now += 1
+        store.set(f"key{i}", "value")
+    clock.now += 1
+    store.get("key0")
+
+    clock.now += 1
+    store.set("key10", "value")
+
+    assert store.stats()["size"] == 9
+    assert store.get("key0") is not None
+    assert store.get("key1") is None and store.get("key2") is None
+
+
+def test_memory_is_the_default(monkeypatch):
+    for name in ("LLM_CACHE", "LLM_CACHE_PATH", "LLM_CACHE_TTL"):
+        monkeypatch.delenv(name, raising=False)
+
+    cache = create_llm_cache()
+    assert cache is not None and cache.store is None
+    assert cache.ttl == 604800
+
+
+def test_disk_needs_a_path(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE", "disk")
+    monkeypatch.delenv("LLM_CACHE_PATH", raising=False)
+
+    cache = create_llm_cache()
+    assert cache is not None and cache.store is None
+
+
+def test_disk_and_off(monkeypatch, db_path):
+    monkeypatch.setenv("LLM_CACHE", "disk")
+    monkeypatch.setenv("LLM_CACHE_PATH", db_path)
+    monkeypatch.setenv("LLM_CACHE_TTL", "0")
+
+    cache = create_llm_cache()
+    assert cache.store is not None and cache.store.path == db_path
+    assert cache.ttl is None
+
+    monkeypatch.setenv("LLM_CACHE", "off")
+    assert create_llm_cache() is None
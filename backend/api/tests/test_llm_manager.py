@@ -0,0 +1,48 @@
+"""Shared LLMManager"""
+import pytest
+
+import app as app_module
+from utils.llm import manager as manager_module
+from utils.llm.manager import credentials_fingerprint, get_llm_manager
+
+
+@pytest.fixture(autouse=True)
+def fresh_manager(monkeypatch):
+    monkeypatch.setattr(manager_module, "_manager", None)
+    for name in ("GOOGLE_API_KEY", "GEMINI_API_KEY"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_one_manager_per_process():
+    manager = get_llm_manager()
+
+    assert get_llm_manager() is manager
+    assert app_module._get_llm() is manager and app_module._get_llm("gemini") is manager
+    assert not manager.is_llm_available()
+
+
+def test_rebuilt_when_credentials_change(monkeypatch):
+    pytest.importorskip("google.generativeai")
+    without_key = get_llm_manager()
+
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    with_key = get_llm_manager()
+
+    assert with_key is not without_key
+    assert with_key.get_available_providers() == [with_key.primary_provider.get_provider_name()]
+    assert get_llm_manager() is with_key
+    assert with_key.cache is without_key.cache      #the response cache outlives rebuilds
+
+
+def test_refresh_rebuilds():
+    manager = get_llm_manager()
+
+    assert get_llm_manager(refresh=True) is not manager
+
+
+def test_fingerprint_hides_the_key(monkeypatch):
+    before = credentials_fingerprint()
+    monkeypatch.setenv("GOOGLE_API_KEY", "secret-value")
+
+    assert credentials_fingerprint() != before
+    assert "secret-value" not in credentials_fingerprint()
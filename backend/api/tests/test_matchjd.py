@@ -0,0 +1,58 @@
+"""Vectorized resume / JD ranking"""
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from ats.ats import clean_text
+from ats.matchjd import get_resumes_jd_match_scores, predict_top_resumes, top_k_indices
+
+RESUMES = [
+    "Data scientist with machine learning, Python and statistical modeling",
+    "Project manager with agile and team leadership experience",
+    "Python backend developer working with SQL and cloud services",
+    "Graphic designer skilled in illustration and branding",
+    "Machine learning engineer using Python, SQL and statistical analysis",
+]
+JD = "Data scientist with machine learning, Python, SQL and statistical analysis"
+
+
+@pytest.fixture(scope="module")
+def vectorizer():
+    return TfidfVectorizer().fit([clean_text(text) for text in RESUMES + [JD]])
+
+
+def test_top_k_ties_keep_input_order():
+    scores = [0.5, 0.9, 0.5, 0.9, 0.1, 0.5]
+
+    assert top_k_indices(scores, 3).tolist() == [1, 3, 0]
+    assert top_k_indices(scores, 4).tolist() == [1, 3, 0, 2]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 0, 2, 5, 4]
+    assert top_k_indices(scores, 0).tolist() == []
+    assert top_k_indices([], 3).tolist() == []
+
+
+def test_batch_scores_equal_cosine_similarity(vectorizer):
+    scores = get_resumes_jd_match_scores(RESUMES, JD, vectorizer)
+
+    expected = cosine_similarity(vectorizer.transform([clean_text(text) for text in RESUMES]),
+                                 vectorizer.transform([clean_text(JD)])).ravel()
+    np.testing.assert_allclose(scores, expected)
+
+
+def test_predict_top_resumes_returns_only_the_winners(vectorizer):
+    resumes = pd.DataFrame({"resume_id": range(len(RESUMES)),
+                            "cleaned_resume_text": [clean_text(text) for text in RESUMES]})
+
+    top = predict_top_resumes(JD, resumes, vectorizer, n=2)
+
+    scores = get_resumes_jd_match_scores(RESUMES, JD, vectorizer)
+    assert top["resume_id"].tolist() == np.argsort(-scores, kind="stable")[:2].tolist()
+    np.testing.assert_allclose(top["match_score"], np.sort(scores)[::-1][:2])
+    assert "match_score" not in resumes
+
+
+def test_missing_vectorizer():
+    assert get_resumes_jd_match_scores(RESUMES, JD, None) is None
+    assert predict_top_resumes(JD, pd.DataFrame(), None).empty
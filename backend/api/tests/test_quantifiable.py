@@ -0,0 +1,43 @@
+"""Linear-time quantifiable-achievement extraction"""
+import time
+
+import pytest
+
+from ats.document import ResumeDocument
+from ats.quantifiable import quantifiable_extractor
+
+SIZE = 100000
+CEILING_S = 1.0     # the old unbounded patterns took minutes on these inputs
+
+ADVERSARIAL = {
+    "increased without by": "increased revenue " * (SIZE // 18),
+    "long digit run": "saved " + "1" * SIZE + " increase",
+    "digits and commas": "1,0." * (SIZE // 4) + " growth",
+    "whitespace run": "reduced" + " " * SIZE + "by 5% costs",
+    "developed without users": "developed a tool for " * (SIZE // 21),
+}
+
+
+def test_extracts_resume_metrics():
+    text = ("Increased quarterly revenue by 35% through targeted campaigns.\n"
+            "Saved $120,000 annually by consolidating vendors.\n"
+            "Developed an onboarding flow for 50,000 users.\n"
+            "Streamlined deployment resulting in 40% reduction in lead time.")
+
+    metrics = quantifiable_extractor.extract(text)
+
+    assert {"35%", "$120,000", "50,000", "40%"} <= set(metrics)
+
+
+def test_metrics_do_not_span_sentences():
+    assert quantifiable_extractor.extract("Increased revenue.\nWon by 5% in the poll") == []
+
+
+@pytest.mark.parametrize("case", sorted(ADVERSARIAL))
+def test_adversarial_input_is_bounded(case):
+    doc = ResumeDocument(ADVERSARIAL[case])
+
+    start = time.perf_counter()
+    quantifiable_extractor.extract(doc)
+
+    assert time.perf_counter() - start < CEILING_S
@@ -0,0 +1,85 @@
+"""Startup readiness checks and /readyz"""
+import asyncio
+
+import app as app_module
+from utils.readiness import Readiness
+
+
+def test_ready_once_required_checks_pass():
+    readiness = Readiness(required=["ats_analyzer"])
+    readiness.mark("llm", False, "no provider")
+    assert readiness.status() == "starting"
+
+    readiness.mark("ats_analyzer", True)
+    readiness.complete()
+
+    assert readiness.is_ready and readiness.report()["failing"] == []
+
+
+def test_deployed_data_file_that_fails_to_load_is_required():
+    readiness = Readiness(required=["ats_analyzer"])
+    readiness.mark("ats_analyzer", True)
+    readiness.mark("esco_index", False, "not deployed: esco_index", required=False)
+    readiness.mark("tfidf_vectorizer", False, "tfidf_vectorizer.pkl", required=True)
+    readiness.complete()
+
+    report = readiness.report()
+    assert report["status"] == "degraded" and report["failing"] == ["tfidf_vectorizer"]
+
+
+def test_run_records_sync_and_async_steps():
+    readiness = Readiness(required=["sync", "async"])
+
+    async def step():
+        return "loaded"
+
+    async def main():
+        await readiness.run("sync", lambda: False)
+        await readiness.run("async", step)
+
+    asyncio.run(main())
+    checks = readiness.report()["checks"]
+    assert checks["sync"]["ok"] is False
+    assert checks["async"]["ok"] is True and checks["async"]["detail"] == "loaded"
+
+
+def _warm_up_with(monkeypatch, status):
+    readiness = Readiness(required=["ats_analyzer"])
+    monkeypatch.setattr(app_module, "readiness", readiness)
+
+    async def run(fn, *args):
+        return status
+
+    monkeypatch.setattr(app_module.ats_executor, "run", run)
+    asyncio.run(readiness.run("ats_analyzer", app_module._warm_up_ats_analyzer))
+    readiness.complete()
+    return readiness.report()
+
+
+def test_warm_up_gates_on_deployed_data_files(monkeypatch):
+    missing = {"ok": False, "detail": "not deployed: x", "deployed": False}
+    broken = {"ok": False, "detail": "tfidf_vectorizer.pkl", "deployed": True}
+
+    report = _warm_up_with(monkeypatch, {"analyzers": 6, "tfidf_vectorizer": missing, "esco_index": missing})
+    assert report["ready"] and report["checks"]["esco_index"]["detail"] == "not deployed: x"
+
+    report = _warm_up_with(monkeypatch, {"analyzers": 6, "tfidf_vectorizer": broken, "esco_index": missing})
+    assert not report["ready"] and report["failing"] == ["tfidf_vectorizer"]
+
+
+def test_analyzer_status_reports_deployment(analyzer, tmp_path, monkeypatch):
+    from ats.analyzer import analyzer_status
+
+    status = analyzer_status()
+    assert status["analyzers"] == len(analyzer.registry)
+    assert status["tfidf_vectorizer"]["deployed"] is False and status["esco_index"]["deployed"] is False
+
+    (tmp_path / "tfidf.pkl").write_bytes(b"not a pickle")
+    monkeypatch.setattr(analyzer, "vectorizer_path", str(tmp_path / "tfidf.pkl"))
+    assert analyzer_status()["tfidf_vectorizer"] == {"ok": False, "detail": str(tmp_path / "tfidf.pkl"), "deployed": True}
+
+
+def test_readyz_without_warm_up(client):
+    response = client.get("/readyz")      #ATS_WARMUP=off in the tests: ready immediately
+
+    assert response.status_code == 200 and response.json()["status"] == "ready"
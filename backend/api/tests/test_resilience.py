@@ -0,0 +1,256 @@
+"""Circuit breaker, latency window and the manager's guarded, hedged provider calls"""
+import asyncio
+import time
+
+import pytest
+
+from utils.llm.base import BaseLLMProvider, ProviderRateLimitError
+from utils.llm.cache import LLMResponseCache
+from utils.llm.manager import LLMManager
+from utils.llm.resilience import CircuitBreaker, LatencyWindow
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fail(breaker, times):
+    for _ in range(times):
+        assert breaker.allow()
+        breaker.record(False)
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=3, clock=FakeClock())
+    _fail(breaker, 2)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    _fail(breaker, 1)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.stats()["times_opened"] == 1 and breaker.stats()["rejected"] == 1
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker("test", failure_threshold=2, clock=FakeClock())
+    _fail(breaker, 1)
+    assert breaker.allow()
+    breaker.record(True)
+    _fail(breaker, 1)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_closes_on_success():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30, clock=clock)
+    _fail(breaker, 1)
+    clock.now += 29
+    assert not breaker.allow()
+
+    clock.now += 1
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()      # one probe at a time
+    breaker.record(True)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_half_open_probe_reopens_on_failure():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=5, reset_timeout=30, clock=clock)
+    _fail(breaker, 5)
+    clock.now += 30
+    assert breaker.allow()
+
+    breaker.record(False)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()["times_opened"] == 2
+    assert not breaker.allow()
+
+
+def test_cancelled_probe_frees_its_slot_without_an_outcome():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30, clock=clock)
+    _fail(breaker, 1)
+    clock.now += 30
+    assert breaker.allow()
+
+    breaker.record(None)
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_latency_window_percentiles():
+    window = LatencyWindow(size=100)
+    assert window.percentile(95) is None
+    for ms in range(1, 101):
+        window.add(ms / 1000)
+
+    assert window.percentile(50) == 0.051
+    assert window.percentile(95) == 0.096
+    assert window.stats() == {"samples": 100, "p50_ms": 51.0, "p95_ms": 96.0}
+
+
+class FakeProvider(BaseLLMProvider):
+    def __init__(self, name, response="ok", delay=0.0, error=None, chunks=None):
+        super().__init__()
+        self.name = name
+        self.response = response
+        self.delay = delay
+        self.error = error
+        self.chunks = chunks
+        self.calls = 0
+
+    def is_available(self):
+        return True
+
+    def get_provider_name(self):
+        return self.name
+
+    def generate_text(self, prompt):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    async def generate_text_async(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    async def stream_text_async(self, prompt):
+        self.calls += 1
+        for chunk in self.chunks or [self.response]:
+            yield chunk
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    for name in ("GOOGLE_API_KEY", "GEMINI_API_KEY"):
+        monkeypatch.delenv(name, raising=False)
+    manager = LLMManager()
+    manager.cache = None
+    return manager
+
+
+def _hedging(manager, slow, fast):
+    manager.add_provider(slow)
+    manager.add_provider(fast)
+    manager.hedge_percentile, manager.hedge_min_samples = 50, 1
+    manager._guards(slow).latency.add(0.01)
+
+
+def test_parse_order_lists_each_provider_once(manager):
+    first, second = FakeProvider("first"), FakeProvider("second")
+    manager.add_provider(first)
+    manager.add_provider(second)
+
+    assert manager._parse_order("second") == [second, first]
+    assert manager._parse_order("first") == [first, second]
+    assert manager._parse_order(None) == [first, second]
+    assert manager._parse_order("missing") == [first, second]
+
+
+def test_failures_open_the_breaker(manager):
+    provider = FakeProvider("flaky", error=RuntimeError("boom"))
+    manager.add_provider(provider)
+
+    for _ in range(5):
+        assert not manager.generate_text("prompt")["success"]
+    assert manager.generate_text("prompt")["error"] == "All LLM providers failed to generate text"
+
+    assert provider.calls == 5      # the sixth call never reached the provider
+    assert manager.breaker_stats()["providers"]["flaky"]["state"] == CircuitBreaker.OPEN
+
+
+def test_provider_rate_limit_pauses_the_limiter(manager):
+    provider = FakeProvider("limited", error=ProviderRateLimitError("429", retry_after=5))
+    manager.add_provider(provider)
+
+    assert not manager.generate_text("prompt")["success"]
+
+    stats = manager.limiter_stats()["limited"]
+    assert stats["backoffs"] == 1 and stats["in_flight"] == 0
+    assert manager.breaker_stats()["providers"]["limited"]["consecutive_failures"] == 1
+
+
+def test_success_is_timed_and_cached(manager):
+    provider = FakeProvider("cached")
+    manager.add_provider(provider)
+    manager.cache = LLMResponseCache()
+
+    assert manager.generate_text("prompt")["content"] == "ok"
+    assert asyncio.run(manager.generate_text_async("prompt"))["content"] == "ok"
+
+    assert provider.calls == 1
+    assert len(manager._guards(provider).latency) == 1
+    assert manager.limiter_stats()["cached"]["in_flight"] == 0
+
+
+def test_hedge_wins_when_the_first_provider_is_slow(manager):
+    slow, fast = FakeProvider("slow", response="late", delay=0.5), FakeProvider("fast", response="early")
+    _hedging(manager, slow, fast)
+
+    result = manager.generate_text("prompt")
+
+    assert result["provider_used"] == "fast"
+    assert manager.hedges == {"fired": 1, "won": 1, "lost": 0}
+
+
+def test_async_hedge_cancels_the_loser(manager):
+    slow, fast = FakeProvider("slow", response="late", delay=0.5), FakeProvider("fast", response="early")
+    _hedging(manager, slow, fast)
+
+    result = asyncio.run(manager.generate_text_async("prompt"))
+
+    assert result["provider_used"] == "fast"
+    assert manager.hedges == {"fired": 1, "won": 1, "lost": 0}
+    slow_breaker = manager.breaker_stats()["providers"]["slow"]
+    assert slow_breaker["consecutive_failures"] == 0        # a cancelled call is not a failure
+    assert manager.limiter_stats()["slow"]["in_flight"] == 0
+
+
+def test_streamed_sections_and_cache(manager):
+    provider = FakeProvider("streaming", chunks=['{"name": "Ada",', ' "skills": ["Python"]}'])
+    manager.add_provider(provider)
+    manager.cache = LLMResponseCache()
+
+    async def events():
+        return [event async for event in manager.parse_resume_with_llm_stream("resume")]
+
+    streamed = asyncio.run(events())
+    assert [(event.kind, event.section) for event in streamed][:2] == [("section", "name"), ("section", "skills")]
+    assert streamed[-1].kind == "complete"
+
+    assert asyncio.run(events())[-1].data == streamed[-1].data
+    assert provider.calls == 1
+    assert len(manager._guards(provider).latency) == 1
+
+
+def test_disconnected_stream_is_not_a_failure(manager):
+    provider = FakeProvider("streaming", chunks=['{"name": "Ada",', ' "skills": ["Python"]}'])
+    manager.add_provider(provider)
+
+    async def first_event():
+        stream = manager.parse_resume_with_llm_stream("resume")
+        event = await stream.__anext__()
+        await stream.aclose()
+        return event
+
+    assert asyncio.run(first_event()).section == "name"
+    stats = manager.breaker_stats()["providers"]["streaming"]
+    assert stats["state"] == CircuitBreaker.CLOSED and stats["consecutive_failures"] == 0
+    assert manager.limiter_stats()["streaming"]["in_flight"] == 0
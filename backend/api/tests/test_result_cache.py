@@ -0,0 +1,84 @@
+"""Content-addressed ATS result cache and /ats-checker revalidation"""
+import pytest
+
+import app as app_module
+from utils import result_cache
+from utils.result_cache import DiskResultCache, MemoryResultCache, content_key, create_result_cache
+
+REPORT = {"overall_score": 71.5, "categories": {"Resume Structure": {"score": 80}}}
+
+
+@pytest.fixture(params=["memory", "disk"])
+def cache(request, tmp_path):
+    if request.param == "disk":
+        return DiskResultCache(str(tmp_path / "results"), max_entries=10)
+    return MemoryResultCache(max_entries=10)
+
+
+def test_content_key_separates_its_parts():
+    assert content_key(b"resume", "resume.pdf", "jd", "1") == content_key(b"resume", "resume.pdf", "jd", "1")
+    assert content_key(b"ab", "c") != content_key(b"a", "bc")
+    assert content_key(b"resume", "resume.pdf", "jd", "1") != content_key(b"resume", "resume.pdf", "jd", "2")
+
+
+def test_round_trip_returns_a_copy(cache):
+    assert cache.get("k" * 64) is None
+    cache.set("k" * 64, REPORT)
+
+    hit = cache.get("k" * 64)
+    assert hit == REPORT and hit is not REPORT
+    hit["overall_score"] = 0
+    assert cache.get("k" * 64) == REPORT
+
+    cache.delete("k" * 64)
+    assert cache.get("k" * 64) is None
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 2
+
+
+def test_disk_entries_expire_and_survive_restart(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "time", lambda: now[0])
+    cache = DiskResultCache(str(tmp_path), ttl=60)
+    cache.set("a" * 64, REPORT)
+
+    assert DiskResultCache(str(tmp_path), ttl=60).get("a" * 64) == REPORT
+    now[0] += 61
+    assert cache.get("a" * 64) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_disk_evicts_least_recently_used(tmp_path):
+    cache = DiskResultCache(str(tmp_path), max_entries=10)
+    for i in range(11):
+        cache.set(f"{i:064x}", {"i": i})
+
+    assert cache.stats()["size"] == 9 and cache.evictions == 2
+
+
+def test_create_result_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("ATS_RESULT_CACHE", "off")
+    assert create_result_cache(str(tmp_path)) is None
+    monkeypatch.setenv("ATS_RESULT_CACHE", "disk")
+    assert isinstance(create_result_cache(str(tmp_path)), DiskResultCache)
+    monkeypatch.delenv("ATS_RESULT_CACHE")
+    assert isinstance(create_result_cache(str(tmp_path)), MemoryResultCache)
+
+
+def test_ats_checker_etag_and_cached_report(client, resume_text, monkeypatch):
+    monkeypatch.setattr(app_module, "ats_result_cache", MemoryResultCache())
+    upload = {"file": ("etag-resume.txt", resume_text.encode())}
+
+    first = client.post("/ats-checker", files=upload)
+    etag = first.headers["etag"]
+    second = client.post("/ats-checker", files=upload)
+
+    assert second.json() == first.json()
+    assert second.headers["etag"] == etag
+    assert app_module.ats_result_cache.stats()["hits"] == 1
+
+    not_modified = client.post("/ats-checker", files=upload, headers={"If-None-Match": f'"other", W/{etag}'})
+    assert not_modified.status_code == 304 and not_modified.headers["etag"] == etag
+
+    other_jd = client.post("/ats-checker", files=upload, data={"job_description": "Rust systems engineer"},
+                           headers={"If-None-Match": etag})
+    assert other_jd.status_code == 200 and other_jd.headers["etag"] != etag
@@ -0,0 +1,69 @@
+"""SQLite inverted resume index"""
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+from ats.ats import clean_text
+from ats.resume_index import ResumeIndex
+
+RESUMES = {
+    "r1": "Python developer building machine learning models with pandas and scikit-learn",
+    "r2": "Frontend engineer working with React, TypeScript and CSS",
+    "r3": "Data engineer running Python pipelines on Spark and Airflow",
+}
+JD = "Looking for a Python machine learning engineer"
+
+
+@pytest.fixture
+def vectorizer():
+    return TfidfVectorizer().fit([clean_text(text) for text in RESUMES.values()])
+
+
+@pytest.fixture
+def index(tmp_path, vectorizer):
+    with ResumeIndex(str(tmp_path / "resumes.db"), vectorizer) as index:
+        index.add_many((resume_id, text, {"name": resume_id.upper()}) for resume_id, text in RESUMES.items())
+        yield index
+
+
+def test_query_ranks_by_cosine_similarity(index, vectorizer):
+    hits = index.query(JD, k=3)
+
+    matrix = normalize(vectorizer.transform([clean_text(text) for text in RESUMES.values()]))
+    jd = normalize(vectorizer.transform([clean_text(JD)]))
+    expected = dict(zip(RESUMES, (matrix @ jd.T).toarray().ravel()))
+    assert [hit["resume_id"] for hit in hits] == sorted((r for r in expected if expected[r] > 0),
+                                                       key=lambda r: -expected[r])
+    for hit in hits:
+        assert hit["score"] == pytest.approx(expected[hit["resume_id"]])
+    assert hits[0] == {"resume_id": "r1", "score": pytest.approx(expected["r1"]), "metadata": {"name": "R1"}}
+
+
+def test_query_limits_to_k(index):
+    assert len(index.query(JD, k=1)) == 1
+    assert index.query(JD, k=0) == []
+
+
+def test_add_replaces_and_delete_removes(index):
+    index.add("r2", "Python machine learning researcher")
+    assert len(index) == 3
+    assert index.query(JD, k=1)[0]["resume_id"] in ("r1", "r2")
+
+    assert index.delete("r2") is True
+    assert index.delete("r2") is False
+    assert "r2" not in index
+    assert "r2" not in [hit["resume_id"] for hit in index.query(JD, k=3)]
+    assert index.stats()["resumes"] == 2
+
+
+def test_replaced_resume_loses_its_old_postings(index):
+    index.add("r2", "Python machine learning researcher")
+
+    assert "r2" not in [hit["resume_id"] for hit in index.query("React TypeScript CSS", k=3)]
+
+
+def test_reopening_with_another_vectorizer_is_refused(tmp_path, index):
+    other = TfidfVectorizer().fit(["completely different vocabulary here"])
+
+    with pytest.raises(ValueError):
+        ResumeIndex(index.path, other)
@@ -0,0 +1,118 @@
+"""Single-flight call coalescing"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.singleflight import SingleFlight
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def _run_followers(flight, key, fn, count):
+    results, errors = [], []
+
+    def follower():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=follower) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        return {"sections": ["education"]}
+
+    threads, results, errors = _run_followers(flight, "resume", work, 4)
+    _wait_for(lambda: flight.stats()["coalesced"] == 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1 and not errors
+    assert all(result == {"sections": ["education"]} for result in results)
+    assert len({id(result) for result in results}) == 4     # followers get copies
+    assert flight.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 3}
+
+
+def test_exception_reaches_every_caller_and_key_is_released():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ValueError("provider down")
+
+    threads, results, errors = _run_followers(flight, "resume", fail, 3)
+    _wait_for(lambda: flight.stats()["coalesced"] == 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert not results and len(errors) == 3
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert flight.do("resume", lambda: "fresh") == "fresh"
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.stats()["leaders"] == 2
+
+
+def test_async_callers_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return [1, 2]
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("jd", work) for _ in range(3)))
+
+    assert asyncio.run(main()) == [[1, 2]] * 3
+    assert len(calls) == 1
+
+
+def test_follower_takes_over_when_the_async_leader_is_cancelled():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05 if len(calls) > 1 else 10)
+        return "done"
+
+    async def main():
+        leader = asyncio.create_task(flight.do_async("jd", work))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(flight.do_async("jd", work))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "done"
+    assert len(calls) == 2
@@ -0,0 +1,58 @@
+"""Token-level Aho-Corasick automaton and the buzzword/ESCO term matcher"""
+from ats.term_matcher import CompiledAutomaton, PhraseAutomaton, TermMatcher, compile_phrases
+
+PHRASES = [["machin", "learn"], ["learn"], ["deep", "learn"], ["learn", "rate"], ["python"]]
+
+
+def test_phrase_automaton_reports_overlapping_and_nested_phrases():
+    automaton = PhraseAutomaton()
+    for phrase_id, tokens in enumerate(PHRASES):
+        automaton.add(tokens, phrase_id)
+    automaton.build()
+
+    matches = sorted(automaton.iter_matches("deep learn rate".split()))
+
+    assert matches == [(0, 2, 2), (1, 2, 1), (1, 3, 3)]
+
+
+def test_phrase_automaton_builds_lazily_after_add():
+    automaton = PhraseAutomaton()
+    automaton.add(["a", "b"], "ab")
+    assert list(automaton.iter_matches(["x", "a", "b"])) == [(1, 3, "ab")]
+    automaton.add(["b"], "b")
+    assert sorted(automaton.iter_matches(["a", "b"]), key=str) == [(0, 2, "ab"), (1, 2, "b")]
+
+
+def test_compiled_automaton_matches_the_in_memory_one():
+    arrays, vocab, lengths = compile_phrases(PHRASES)
+    compiled = CompiledAutomaton(arrays, {token: i for i, token in enumerate(vocab)}, lengths)
+    reference = PhraseAutomaton()
+    for phrase_id, tokens in enumerate(PHRASES):
+        reference.add(tokens, phrase_id)
+
+    tokens = "we use machin learn and deep learn with python unknown learn rate".split()
+
+    assert sorted(compiled.iter_matches(tokens)) == sorted(reference.iter_matches(tokens))
+
+
+def test_compiled_automaton_resets_on_unknown_tokens():
+    arrays, vocab, lengths = compile_phrases([["machin", "learn"]])
+    compiled = CompiledAutomaton(arrays, {token: i for i, token in enumerate(vocab)}, lengths)
+
+    assert list(compiled.iter_matches(["machin", "other", "learn"])) == []
+
+
+def test_term_matcher_finds_buzzwords_in_list_order():
+    matcher = TermMatcher(["machine learning", "python", "docker"])
+
+    hits = matcher.scan("Docker and Python for Machine Learning pipelines, more Python")
+
+    assert hits.buzzwords == ["machine learning", "python", "docker"]
+    assert hits.esco_terms == []
+
+
+def test_term_matcher_is_token_aligned():
+    matcher = TermMatcher(["java"])
+
+    assert matcher.scan("JavaScript developer").buzzwords == []
+    assert matcher.scan("Java developer").buzzwords == ["java"]